@@ -1,25 +1,100 @@
-"""Main package entrypoint for Tikara."""
-
-from tikara.core import Tika
-from tikara.data_types import (
-    TikaDetectLanguageResult,
-    TikaInputType,
-    TikaLanguageConfidence,
-    TikaMetadata,
-    TikaParseOutputFormat,
-    TikaUnpackedItem,
-    TikaUnpackResult,
-)
-from tikara.error_handling import TikaError
+"""Main package entrypoint for Tikara.
+
+The exports below are imported on first access rather than with the package, so `import tikara` does not load
+jpype, pydantic or the JVM utilities until something from them is actually used.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from tikara.async_core import AsyncTika, AsyncTikaStream
+    from tikara.cache import TikaDetectionCache, TikaParseCache
+    from tikara.core import Tika
+    from tikara.data_types import (
+        TesseractOptions,
+        TikaCacheStats,
+        TikaDetectLanguageResult,
+        TikaInputType,
+        TikaJvmOptions,
+        TikaLanguageConfidence,
+        TikaMetadata,
+        TikaOcrPolicy,
+        TikaParsedItem,
+        TikaParseOutputFormat,
+        TikaUnpackedItem,
+        TikaUnpackResult,
+        TikaWarmUpFamily,
+        TikaWarmUpTiming,
+    )
+    from tikara.error_handling import TikaError
+    from tikara.process_pool import TikaProcessPool
+    from tikara.session import TikaParseSession
+    from tikara.util.java import set_jvm_options
+
+_EXPORTS: dict[str, str] = {
+    "AsyncTika": "tikara.async_core",
+    "AsyncTikaStream": "tikara.async_core",
+    "TesseractOptions": "tikara.data_types",
+    "Tika": "tikara.core",
+    "TikaCacheStats": "tikara.data_types",
+    "TikaDetectLanguageResult": "tikara.data_types",
+    "TikaDetectionCache": "tikara.cache",
+    "TikaError": "tikara.error_handling",
+    "TikaInputType": "tikara.data_types",
+    "TikaJvmOptions": "tikara.data_types",
+    "TikaLanguageConfidence": "tikara.data_types",
+    "TikaMetadata": "tikara.data_types",
+    "TikaOcrPolicy": "tikara.data_types",
+    "TikaParseCache": "tikara.cache",
+    "TikaParseOutputFormat": "tikara.data_types",
+    "TikaParseSession": "tikara.session",
+    "TikaParsedItem": "tikara.data_types",
+    "TikaProcessPool": "tikara.process_pool",
+    "TikaUnpackResult": "tikara.data_types",
+    "TikaUnpackedItem": "tikara.data_types",
+    "TikaWarmUpFamily": "tikara.data_types",
+    "TikaWarmUpTiming": "tikara.data_types",
+    "set_jvm_options": "tikara.util.java",
+}
+"""Module each public name is imported from on first access."""
 
 __all__ = [
+    "AsyncTika",
+    "AsyncTikaStream",
+    "TesseractOptions",
     "Tika",
+    "TikaCacheStats",
     "TikaDetectLanguageResult",
+    "TikaDetectionCache",
     "TikaError",
     "TikaInputType",
+    "TikaJvmOptions",
     "TikaLanguageConfidence",
     "TikaMetadata",
+    "TikaOcrPolicy",
+    "TikaParseCache",
     "TikaParseOutputFormat",
+    "TikaParseSession",
+    "TikaParsedItem",
+    "TikaProcessPool",
     "TikaUnpackResult",
     "TikaUnpackedItem",
+    "TikaWarmUpFamily",
+    "TikaWarmUpTiming",
+    "set_jvm_options",
 ]
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value  # later accesses skip this hook
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,7 @@
+"""Allow running the command line with `python -m tikara`."""
+
+import sys
+
+from tikara.cli import main
+
+sys.exit(main())
@@ -0,0 +1,324 @@
+"""Asyncio facade over the blocking `Tika` entrypoint. Re-exported from `tikara`."""
+
+import asyncio
+import os
+import threading
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import suppress
+from functools import partial
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO, Self, overload
+
+from tikara.core import Tika
+from tikara.data_types import (
+    TikaDetectLanguageResult,
+    TikaInputType,
+    TikaIOMode,
+    TikaMetadata,
+    TikaOcrPolicy,
+    TikaParseOutputFormat,
+    TikaUnpackResult,
+    TikaWarmUpFamily,
+    TikaWarmUpTiming,
+)
+from tikara.error_handling import TikaInputArgumentsError
+
+if TYPE_CHECKING:
+    from java.lang import Thread as JThread
+
+
+class _InterruptibleCall[R]:
+    """A blocking call that can be interrupted, Java-side, from another thread while it runs."""
+
+    def __init__(self, func: Callable[[], R]) -> None:
+        self._func = func
+        self._lock = threading.Lock()
+        self._thread: JThread | None = None
+        self._interrupted = False
+
+    def __call__(self) -> R:
+        from java.lang import Thread as JThread
+
+        with self._lock:
+            self._thread = JThread.currentThread()
+            if self._interrupted:
+                self._thread.interrupt()
+        try:
+            return self._func()
+        finally:
+            with self._lock:
+                self._thread = None
+            # clear the flag so the pooled thread starts its next call clean
+            JThread.interrupted()
+
+    def interrupt(self) -> None:
+        with self._lock:
+            self._interrupted = True
+            if self._thread is not None:
+                self._thread.interrupt()
+
+
+class AsyncTikaStream:
+    """Asynchronous view of a parse streaming its output.
+
+    Iterate with `async for` to receive chunks of output as the background parse produces them. Each read runs on
+    the owning `AsyncTika`'s executor, so slow consumers never block the event loop.
+    """
+
+    def __init__(self, owner: "AsyncTika", stream: BinaryIO, chunk_size: int) -> None:
+        self._owner = owner
+        self._stream = stream
+        self._chunk_size = chunk_size
+
+    @property
+    def metadata(self) -> TikaMetadata | None:
+        """The complete document metadata once the stream has been read to the end, like `parse` streams."""
+        return getattr(self._stream, "metadata", None)
+
+    async def read(self, size: int = -1) -> bytes:
+        """Read up to `size` bytes, or everything that is left if `size` is negative."""
+        return await self._owner._run(self._stream.read, size)
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        return self._iter_chunks()
+
+    async def _iter_chunks(self) -> AsyncIterator[bytes]:
+        while chunk := await self.read(self._chunk_size):
+            yield chunk
+
+    async def aclose(self) -> None:
+        """Close the stream. A parse still producing output is aborted."""
+        await self._owner._run(self._stream.close)
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, exc_type: object, exc_value: object, traceback: object) -> None:
+        await self.aclose()
+
+
+class AsyncTika:
+    """Asyncio entrypoint mirroring `Tika`, backed by a bounded thread pool.
+
+    At most `max_concurrency` calls run at once; further calls wait without blocking the event loop, which gives
+    natural backpressure. Cancelling a call that has not started yet drops it. Cancelling a call that is already
+    running interrupts its Java thread, which stops parsers at their next interruptible point.
+
+    Examples:
+        ::
+
+            async with AsyncTika(max_concurrency=8) as tika:
+                content, metadata = await tika.parse("document.pdf", output_format="txt")
+
+                stream, metadata = await tika.parse("huge.pdf", output_stream=True)
+                async for chunk in stream:
+                    await upload(chunk)
+    """
+
+    def __init__(self, tika: Tika | None = None, *, max_concurrency: int | None = None) -> None:
+        """Create an asyncio facade.
+
+        Args:
+            tika: The `Tika` instance to run calls on. Defaults to a new instance with the default configuration.
+            max_concurrency: Maximum number of calls running at once. Defaults to the number of CPUs.
+
+        Raises:
+            TikaInputArgumentsError: If `max_concurrency` is less than 1.
+        """
+        if max_concurrency is None:
+            max_concurrency = os.cpu_count() or 1
+        if max_concurrency < 1:
+            msg = f"max_concurrency must be at least 1, got {max_concurrency}"
+            raise TikaInputArgumentsError(msg)
+
+        self.tika = tika or Tika()
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="tika-async")
+
+    async def _run[R](self, func: Callable[..., R], /, *args: Any, **kwargs: Any) -> R:  # noqa: ANN401
+        loop = asyncio.get_running_loop()
+        await self._semaphore.acquire()
+
+        def release(_: Future[R]) -> None:
+            # the slot is only freed once the Java work has really stopped, not when the awaiting task is cancelled
+            with suppress(RuntimeError):  # the loop may already be closed
+                loop.call_soon_threadsafe(self._semaphore.release)
+
+        call = _InterruptibleCall(partial(func, *args, **kwargs))
+        try:
+            future = self._executor.submit(call)
+        except BaseException:
+            self._semaphore.release()
+            raise
+        future.add_done_callback(release)
+
+        try:
+            return await asyncio.shield(asyncio.wrap_future(future))
+        except asyncio.CancelledError:
+            if not future.cancel():
+                call.interrupt()
+            raise
+
+    async def detect_mime_type(
+        self,
+        obj: TikaInputType,
+        *,
+        io_mode: TikaIOMode = "stream",
+        timeout: float | None = None,  # noqa: ASYNC109 - bounds the Java-side work, unlike asyncio.timeout
+        header_only: bool = False,
+        header_size: int | None = None,
+    ) -> str:
+        """Detect the MIME type of a file, bytes, or stream. See `Tika.detect_mime_type`."""
+        return await self._run(
+            self.tika.detect_mime_type,
+            obj,
+            io_mode=io_mode,
+            timeout=timeout,
+            header_only=header_only,
+            header_size=header_size,
+        )
+
+    @overload
+    async def detect_language(
+        self, content: str, *, top_k: None = None, sample_chars: int | None = None
+    ) -> TikaDetectLanguageResult: ...
+
+    @overload
+    async def detect_language(
+        self, content: str, *, top_k: int, sample_chars: int | None = None
+    ) -> list[TikaDetectLanguageResult]: ...
+
+    async def detect_language(
+        self,
+        content: str,
+        *,
+        top_k: int | None = None,
+        sample_chars: int | None = None,
+    ) -> TikaDetectLanguageResult | list[TikaDetectLanguageResult]:
+        """Detect the natural language of text content. See `Tika.detect_language`."""
+        return await self._run(self.tika.detect_language, content, top_k=top_k, sample_chars=sample_chars)
+
+    async def warm_up(
+        self,
+        families: list[TikaWarmUpFamily] | None = None,
+        *,
+        iterations: int = 3,
+        output_format: TikaParseOutputFormat = "xhtml",
+    ) -> list[TikaWarmUpTiming]:
+        """Prime the parsers of the given document families by parsing small built-in samples. See `Tika.warm_up`."""
+        return await self._run(self.tika.warm_up, families, iterations=iterations, output_format=output_format)
+
+    async def unpack(self, obj: TikaInputType, output_dir: Path, **kwargs: Any) -> TikaUnpackResult:  # noqa: ANN401
+        """Extract embedded documents from a container document. Accepts the keyword arguments of `Tika.unpack`."""
+        return await self._run(self.tika.unpack, obj, output_dir, **kwargs)
+
+    @overload
+    async def parse(
+        self,
+        obj: TikaInputType,
+        *,
+        output_format: TikaParseOutputFormat = "xhtml",
+        input_file_name: str | Path | None = None,
+        content_type: str | None = None,
+        io_mode: TikaIOMode = "stream",
+        max_chars: int | None = None,
+        timeout: float | None = None,  # noqa: ASYNC109
+        detect_language: bool = False,
+        ocr: TikaOcrPolicy | None = None,
+    ) -> tuple[str, TikaMetadata]: ...
+
+    @overload
+    async def parse(
+        self,
+        obj: TikaInputType,
+        *,
+        output_file: Path | str,
+        output_format: TikaParseOutputFormat = "xhtml",
+        input_file_name: str | Path | None = None,
+        content_type: str | None = None,
+        io_mode: TikaIOMode = "stream",
+        max_chars: int | None = None,
+        timeout: float | None = None,  # noqa: ASYNC109
+        detect_language: bool = False,
+        ocr: TikaOcrPolicy | None = None,
+    ) -> tuple[Path, TikaMetadata]: ...
+
+    @overload
+    async def parse(
+        self,
+        obj: TikaInputType,
+        *,
+        output_stream: bool,
+        output_format: TikaParseOutputFormat = "xhtml",
+        input_file_name: str | Path | None = None,
+        content_type: str | None = None,
+        io_mode: TikaIOMode = "stream",
+        max_chars: int | None = None,
+        timeout: float | None = None,  # noqa: ASYNC109
+        detect_language: bool = False,
+        ocr: TikaOcrPolicy | None = None,
+        chunk_size: int = 64 * 1024,
+    ) -> tuple[AsyncTikaStream, TikaMetadata]: ...
+
+    async def parse(  # noqa: PLR0913
+        self,
+        obj: TikaInputType,
+        *,
+        output_stream: bool = False,
+        output_format: TikaParseOutputFormat = "xhtml",
+        output_file: Path | str | None = None,
+        input_file_name: str | Path | None = None,
+        content_type: str | None = None,
+        io_mode: TikaIOMode = "stream",
+        max_chars: int | None = None,
+        timeout: float | None = None,  # noqa: ASYNC109
+        detect_language: bool = False,
+        ocr: TikaOcrPolicy | None = None,
+        chunk_size: int = 64 * 1024,
+    ) -> tuple[str | Path | AsyncTikaStream, TikaMetadata]:
+        """Extract text content and metadata from documents. See `Tika.parse`.
+
+        Args:
+            obj: Input to parse: a path, bytes-like object or binary stream.
+            output_stream: Whether to return content as an `AsyncTikaStream` instead of a string.
+            output_format: "txt" for plain text or "xhtml" for structured format (default)
+            output_file: Save content to this path instead of returning it
+            input_file_name: Original filename if obj is bytes/stream
+            content_type: MIME type of input if known
+            io_mode: How to read file-backed inputs. See `Tika.parse`.
+            max_chars: Stop parsing once this many characters of text have been extracted. See `Tika.parse`.
+            timeout: Maximum number of seconds the parse may take. See `Tika.parse`.
+            detect_language: Detect the document language while parsing. See `Tika.parse`.
+            ocr: OCR policy of this parse. See `Tika.parse`.
+            chunk_size: Maximum size of the chunks yielded when iterating an `AsyncTikaStream`.
+
+        Returns:
+            Tuple of the content (string, output path or async stream) and the document metadata.
+        """
+        kwargs: dict[str, Any] = {
+            "output_format": output_format,
+            "input_file_name": input_file_name,
+            "content_type": content_type,
+            "io_mode": io_mode,
+            "max_chars": max_chars,
+            "timeout": timeout,
+            "detect_language": detect_language,
+            "ocr": ocr,
+        }
+        if output_stream:
+            stream, metadata = await self._run(self.tika.parse, obj, output_stream=True, **kwargs)
+            return AsyncTikaStream(self, stream, chunk_size), metadata
+        if output_file:
+            return await self._run(self.tika.parse, obj, output_file=output_file, **kwargs)
+        return await self._run(self.tika.parse, obj, **kwargs)
+
+    async def aclose(self) -> None:
+        """Wait for running calls to finish and shut down the executor."""
+        await asyncio.to_thread(self._executor.shutdown, wait=True, cancel_futures=True)
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, exc_type: object, exc_value: object, traceback: object) -> None:
+        await self.aclose()
@@ -0,0 +1,352 @@
+"""Caches that let `Tika` skip repeated work on inputs it has already seen. Re-exported from `tikara`."""
+
+import hashlib
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal, Self
+
+from tikara.data_types import TikaCacheStats, TikaInputType, TikaMetadata
+from tikara.error_handling import TikaInputArgumentsError
+from tikara.util.java import TIKA_VERSION, _is_binary_io, _is_buffer
+from tikara.util.tika import _read_header
+
+if TYPE_CHECKING:
+    from org.apache.tika.detect import Detector
+    from org.apache.tika.parser import Parser
+
+
+class TikaDetectionCache:
+    """Bounded LRU cache of MIME detection results, optionally backed by a SQLite database.
+
+    Pass an instance to `Tika(detection_cache=...)`. Paths are keyed by their identity on disk (resolved path, size,
+    modification time, inode and device), so unchanged files are never read again. Bytes are keyed by a SHA-256 hash
+    of the bytes the detector sees. Streams are only cached with `header_only=True`, where they are keyed by the hash
+    of their header; a full detection of a stream is never cached, since hashing it would consume the bytes the
+    detector still needs. Every key also includes a fingerprint of the detector configuration, so adding custom
+    detectors or MIME types, or upgrading Tika, never returns stale results.
+
+    With `path`, results are also written to a SQLite database and survive restarts, or can be shared between
+    processes on the same machine. The in-memory LRU is bounded by `max_entries`; the database is not.
+
+    The cache is thread-safe and can be shared between `Tika` instances.
+
+    Examples:
+        ::
+
+            cache = TikaDetectionCache(max_entries=50_000, path="detections.sqlite")
+            tika = Tika(detection_cache=cache)
+            tika.detect_mime_type("document.pdf")  # detected
+            tika.detect_mime_type("document.pdf")  # answered from the cache
+            print(cache.stats.hit_rate)
+    """
+
+    def __init__(self, max_entries: int = 100_000, *, path: Path | str | None = None) -> None:
+        """Create a detection cache.
+
+        Args:
+            max_entries: Maximum number of results kept in memory. The least recently used are dropped first.
+            path: SQLite database to persist results to. Created if it does not exist. Defaults to memory only.
+
+        Raises:
+            TikaInputArgumentsError: If `max_entries` is less than 1.
+        """
+        if max_entries < 1:
+            msg = f"max_entries must be at least 1, got {max_entries}"
+            raise TikaInputArgumentsError(msg)
+
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._db: sqlite3.Connection | None = None
+        if path is not None:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")
+            self._db.execute("CREATE TABLE IF NOT EXISTS detections (key TEXT PRIMARY KEY, mime_type TEXT NOT NULL)")
+            self._db.commit()
+
+    @property
+    def stats(self) -> TikaCacheStats:
+        """Hit and miss counters since the cache was created or last cleared."""
+        with self._lock:
+            return TikaCacheStats(hits=self._hits, misses=self._misses, entries=len(self._entries))
+
+    def get(self, key: str) -> str | None:
+        """Look up a detection result, falling back to the database on a memory miss."""
+        with self._lock:
+            mime_type = self._entries.get(key)
+            if mime_type is None and self._db is not None:
+                row = self._db.execute("SELECT mime_type FROM detections WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    mime_type = row[0]
+                    self._remember(key, mime_type)
+            elif mime_type is not None:
+                self._entries.move_to_end(key)
+
+            if mime_type is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+            return mime_type
+
+    def put(self, key: str, mime_type: str) -> None:
+        """Store a detection result."""
+        with self._lock:
+            self._remember(key, mime_type)
+            if self._db is not None:
+                self._db.execute("INSERT OR REPLACE INTO detections VALUES (?, ?)", (key, mime_type))
+                self._db.commit()
+
+    def _remember(self, key: str, mime_type: str) -> None:
+        self._entries[key] = mime_type
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached result, including those in the database, and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = 0
+            if self._db is not None:
+                self._db.execute("DELETE FROM detections")
+                self._db.commit()
+
+    def close(self) -> None:
+        """Close the database, if any. The in-memory cache stays usable."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type: object, exc_value: object, traceback: object) -> None:
+        self.close()
+
+
+class TikaParseCache:
+    """Content-addressed, size-bounded cache of parse results, stored in a SQLite database.
+
+    Pass an instance to `Tika(parse_cache=...)`. Results are keyed by the SHA-256 of the input's bytes together
+    with the parse options, the Tika version and a fingerprint of the parser configuration, so byte-identical inputs
+    are parsed once however they arrive and under whatever name. Entries hold the zlib-compressed content and the
+    serialized `TikaMetadata`. When the total size of the entries exceeds `max_bytes`, the least recently used are
+    evicted.
+
+    Hashing reads the whole input, which is far cheaper than parsing it but not free, so the cache pays off when a
+    good share of inputs repeat. String and file output are cached; streamed output is not.
+
+    The cache is thread-safe and can be shared between `Tika` instances, and between processes through `path`.
+
+    Examples:
+        ::
+
+            with TikaParseCache("parse-cache.sqlite", max_bytes=10 * 1024**3) as cache:
+                tika = Tika(parse_cache=cache)
+                for path in attachments:
+                    content, metadata = tika.parse(path, output_format="txt")
+                print(cache.stats)
+    """
+
+    def __init__(self, path: Path | str, *, max_bytes: int = 1024**3, compression_level: int = 6) -> None:
+        """Open or create a parse cache.
+
+        Args:
+            path: SQLite database holding the cache. Created if it does not exist.
+            max_bytes: Maximum total size of the stored entries, compressed, in bytes. Defaults to 1 GiB.
+            compression_level: zlib compression level of the stored content, from 0 (none) to 9 (smallest).
+
+        Raises:
+            TikaInputArgumentsError: If `max_bytes` is less than 1 or `compression_level` is out of range.
+        """
+        if max_bytes < 1:
+            msg = f"max_bytes must be at least 1, got {max_bytes}"
+            raise TikaInputArgumentsError(msg)
+        if not 0 <= compression_level <= 9:  # noqa: PLR2004
+            msg = f"compression_level must be between 0 and 9, got {compression_level}"
+            raise TikaInputArgumentsError(msg)
+
+        self.max_bytes = max_bytes
+        self._compression_level = compression_level
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS parses "
+            "(key TEXT PRIMARY KEY, content BLOB NOT NULL, metadata BLOB NOT NULL, size INTEGER NOT NULL, "
+            "accessed REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS parses_accessed ON parses (accessed)")
+        self._db.commit()
+
+    @property
+    def stats(self) -> TikaCacheStats:
+        """Hit and miss counters since the cache was opened or last cleared, and the current size of the cache."""
+        with self._lock:
+            entries, size = self._db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM parses").fetchone()
+            return TikaCacheStats(hits=self._hits, misses=self._misses, entries=entries, size_bytes=size)
+
+    def get(self, key: str) -> tuple[bytes, TikaMetadata] | None:
+        """Look up a parse result, returning the content as UTF-8 bytes and the metadata."""
+        with self._lock:
+            row = self._db.execute("SELECT content, metadata FROM parses WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._db.execute("UPDATE parses SET accessed = ? WHERE key = ?", (time.time(), key))
+            self._db.commit()
+        content, metadata = row
+        return zlib.decompress(content), TikaMetadata.model_validate_json(zlib.decompress(metadata))
+
+    def put(self, key: str, content: bytes, metadata: TikaMetadata) -> None:
+        """Store a parse result, evicting the least recently used entries if the cache grows past `max_bytes`."""
+        compressed_content = zlib.compress(content, self._compression_level)
+        compressed_metadata = zlib.compress(metadata.model_dump_json(by_alias=True).encode(), self._compression_level)
+        size = len(compressed_content) + len(compressed_metadata)
+        if size > self.max_bytes:
+            return  # would evict everything else and still not fit
+
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO parses VALUES (?, ?, ?, ?, ?)",
+                (key, compressed_content, compressed_metadata, size, time.time()),
+            )
+            (total,) = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM parses").fetchone()
+            while total > self.max_bytes:
+                evicted = self._db.execute(
+                    "SELECT key, size FROM parses WHERE key != ? ORDER BY accessed LIMIT 64", (key,)
+                ).fetchall()
+                if not evicted:
+                    break
+                for evicted_key, evicted_size in evicted:
+                    if total <= self.max_bytes:
+                        break
+                    self._db.execute("DELETE FROM parses WHERE key = ?", (evicted_key,))
+                    total -= evicted_size
+            self._db.commit()
+
+    def clear(self) -> None:
+        """Drop every cached result and reset the counters."""
+        with self._lock:
+            self._db.execute("DELETE FROM parses")
+            self._db.commit()
+            self._hits = self._misses = 0
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type: object, exc_value: object, traceback: object) -> None:
+        self.close()
+
+
+def _detector_fingerprint(
+    detector: "Detector", custom_mime_types: list[str] | None, *, config_file: Path | None = None
+) -> str:
+    """Summarize everything besides the input that can change a detection result.
+
+    The contents of the tika-config.xml, if any, are included too: its parameters never show up in class names.
+    """
+    from org.apache.tika.detect import CompositeDetector
+
+    parts = [TIKA_VERSION, str(detector.getClass().getName())]
+    if isinstance(detector, CompositeDetector):
+        parts.extend(str(child.getClass().getName()) for child in detector.getDetectors())
+    parts.extend(sorted(custom_mime_types or []))
+    if config_file is not None:
+        parts.append(hashlib.sha256(config_file.read_bytes()).hexdigest())
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+def _detection_cache_key(obj: TikaInputType, *, fingerprint: str, header_size: int | None) -> str | None:
+    """Build the cache key of a detection, or None if the input cannot be keyed without consuming it.
+
+    Args:
+        obj: The input being detected. When `header_size` is set, bytes and streams must already be reduced to
+            their header.
+        fingerprint: The detector fingerprint from `_detector_fingerprint`.
+        header_size: The header size of a header-only detection, or None for a full detection.
+    """
+    if isinstance(obj, str | Path):
+        try:
+            path = Path(obj).resolve()
+            stat = path.stat()
+        except OSError:
+            return None  # let detection report the problem
+        parts = ["path", str(path), str(stat.st_size), str(stat.st_mtime_ns), str(stat.st_ino), str(stat.st_dev)]
+        parts.append(str(header_size))
+    elif _is_buffer(obj):
+        # the detector sees exactly these bytes, so their hash identifies the result
+        parts = ["content", hashlib.sha256(_read_header(obj, memoryview(obj).nbytes)).hexdigest()]
+    else:
+        return None  # hashing a stream would consume bytes the detector still needs
+    return hashlib.sha256("\0".join([fingerprint, *parts]).encode()).hexdigest()
+
+
+def _parser_fingerprint(parser: "Parser", detector_fingerprint: str) -> str:
+    """Summarize everything besides the input and call options that can change a parse result."""
+    from org.apache.tika.parser import CompositeParser, ParseContext, ParserDecorator
+
+    context = ParseContext()
+    parts = [detector_fingerprint]
+    pending = [parser]
+    while pending:
+        current = pending.pop()
+        parts.append(str(current.getClass().getName()))
+        if isinstance(current, CompositeParser):
+            pending.extend(reversed(list(current.getAllComponentParsers())))
+        elif isinstance(current, ParserDecorator):
+            # decorators can narrow the types the wrapped parser handles, as parser selection does
+            parts.extend(sorted(str(media_type) for media_type in current.getSupportedTypes(context)))
+            pending.append(current.getWrappedParser())
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+def _content_digest(obj: TikaInputType) -> str | None:
+    """SHA-256 of an input's bytes, or None if the input cannot be read without consuming it.
+
+    Seekable streams are hashed from their current position, which is restored afterwards.
+    """
+    if isinstance(obj, str | Path):
+        try:
+            with Path(obj).open("rb") as f:
+                return hashlib.file_digest(f, "sha256").hexdigest()
+        except OSError:
+            return None  # let parsing report the problem
+    if _is_buffer(obj):
+        return hashlib.sha256(_read_header(obj, memoryview(obj).nbytes)).hexdigest()
+    if _is_binary_io(obj) and obj.seekable():
+        position = obj.tell()
+        try:
+            return hashlib.file_digest(obj, "sha256").hexdigest()
+        finally:
+            obj.seek(position)
+    return None
+
+
+def _parse_cache_key(
+    digest: str,
+    *,
+    fingerprint: str,
+    output_mode: Literal["string", "file"],
+    options: tuple[object, ...],
+) -> str:
+    """Build the cache key of a parse from the input digest, the parser fingerprint and the call options."""
+    parts = [TIKA_VERSION, fingerprint, digest, output_mode, *(repr(option) for option in options)]
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
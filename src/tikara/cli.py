@@ -0,0 +1,125 @@
+"""Command-line entrypoint, installed as `tikara` and runnable as `python -m tikara`."""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Sequence
+from pathlib import Path
+
+from tikara.error_handling import TikaInitializationError
+
+_STARTUP_SNIPPET = "from tikara import Tika; Tika()._get_tika()"
+"""Code timed by `tikara warmup --benchmark`: start the JVM and build the detector and parser."""
+
+
+def _exercise_tika(tika_jar: Path | None, extra_jars: list[Path]) -> None:
+    """Load the classes a typical run needs: the JVM, parsers, detectors and language models."""
+    from tikara.core import Tika
+
+    tika = Tika(lazy_load=False, tika_jar_override=tika_jar, extra_jars=extra_jars)
+    for output_format in ("txt", "xhtml"):
+        tika.warm_up(iterations=1, output_format=output_format)
+    tika.detect_language("The quick brown fox jumps over the lazy dog")
+
+
+def _record_archive(archive: Path, jar_args: list[str]) -> None:
+    """Record the class-data-sharing archive in a fresh JVM, then move it into place atomically."""
+    archive.parent.mkdir(parents=True, exist_ok=True)
+    partial = archive.with_name(f"{archive.name}.{os.getpid()}.tmp")
+    command = [sys.executable, "-m", "tikara", "warmup", "--dump-to", str(partial), *jar_args]
+    try:
+        subprocess.run(command, check=True)  # noqa: S603
+        if not partial.exists():
+            msg = "The JVM did not write a class-data-sharing archive. Dynamic archives need Java 13 or later."
+            raise TikaInitializationError(msg)
+        partial.replace(archive)
+    finally:
+        partial.unlink(missing_ok=True)
+
+
+def _time_startup(mode: str, runs: int) -> float:
+    """Median wall time, in seconds, of starting Tika in a new process with `TIKARA_CDS=mode`."""
+    from tikara.util.java import _CDS_MODE_ENV
+
+    env = {**os.environ, _CDS_MODE_ENV: mode}
+    timings: list[float] = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", _STARTUP_SNIPPET], check=True, env=env)  # noqa: S603
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def _warmup(args: argparse.Namespace) -> int:
+    # imported here so the rest of the command line does not pay for jpype
+    from tikara.util.java import _CDS_DUMP_ENV, _build_classpath, _cds_archive_path, _warmup_jar_args
+
+    tika_jar = Path(args.tika_jar) if args.tika_jar else None
+    extra_jars = [Path(jar) for jar in args.extra_jar]
+
+    if args.dump_to:
+        # this is the recording JVM started by `_record_archive`, which writes the archive when it exits
+        os.environ[_CDS_DUMP_ENV] = args.dump_to
+        _exercise_tika(tika_jar, extra_jars)
+        return 0
+
+    try:
+        classpath = _build_classpath(tika_jar, extra_jars)
+        archive = _cds_archive_path(classpath)
+        if archive.exists() and not args.force:
+            sys.stdout.write(f"Archive already exists: {archive}\n")
+        else:
+            _record_archive(archive, _warmup_jar_args(classpath))
+            sys.stdout.write(f"Wrote archive: {archive}\n")
+    finally:
+        if args.lock:
+            Path(args.lock).unlink(missing_ok=True)
+
+    if args.benchmark:
+        cold = _time_startup("off", args.runs)
+        warm = _time_startup("use", args.runs)
+        sys.stdout.write(
+            f"Startup without archive: {cold:.2f}s\n"
+            f"Startup with archive:    {warm:.2f}s\n"
+            f"Speed-up:                {cold / warm:.1f}x\n"
+        )
+    return 0
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the `tikara` command line.
+
+    Args:
+        argv: Command-line arguments, without the program name. Defaults to `sys.argv[1:]`.
+
+    Returns:
+        int: The process exit code.
+    """
+    parser = argparse.ArgumentParser(prog="tikara", description="Tikara command-line tools.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    warmup = commands.add_parser(
+        "warmup",
+        help="Record a class-data-sharing archive that makes later JVM starts faster.",
+        description=(
+            "Record a class-data-sharing (AppCDS) archive of the classes Tika loads, for this Tika version, JVM and "
+            "classpath. Every later Tika start with the same setup maps the archive instead of loading the classes "
+            "from the JAR. Set TIKARA_CDS=off to disable archives, or TIKARA_CDS=auto to record them automatically."
+        ),
+    )
+    warmup.add_argument("--tika-jar", help="Tika JAR to use instead of the bundled one, as in Tika(tika_jar_override)")
+    warmup.add_argument(
+        "--extra-jar", action="append", default=[], help="Extra JAR on the classpath, as in Tika(extra_jars)"
+    )
+    warmup.add_argument("--force", action="store_true", help="Record the archive even if it already exists")
+    warmup.add_argument("--benchmark", action="store_true", help="Report start-up time without and with the archive")
+    warmup.add_argument("--runs", type=int, default=3, help="Number of start-ups timed by --benchmark (default: 3)")
+    warmup.add_argument("--dump-to", help=argparse.SUPPRESS)
+    warmup.add_argument("--lock", help=argparse.SUPPRESS)
+    warmup.set_defaults(handler=_warmup)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
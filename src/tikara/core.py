@@ -1,38 +1,59 @@
 """Contains the core Tika entrypoint. Re-exported from `tikara` so no need to import anything from here externally."""
 
-from collections.abc import Callable
+import os
+import time
+from collections import deque
+from collections.abc import Callable, Generator, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from functools import partial
 from pathlib import Path
-from typing import TYPE_CHECKING, BinaryIO, Literal, overload
+from threading import RLock
+from typing import TYPE_CHECKING, Any, BinaryIO, overload
 
 from jpype import JProxy
 
+from tikara.cache import (
+    TikaDetectionCache,
+    TikaParseCache,
+    _content_digest,
+    _detection_cache_key,
+    _detector_fingerprint,
+    _parse_cache_key,
+    _parser_fingerprint,
+)
 from tikara.data_types import (
     TikaDetectLanguageResult,
     TikaInputType,
-    TikaLanguageConfidence,
+    TikaIOMode,
+    TikaJvmOptions,
+    TikaLanguageConfidence,  # noqa: F401 - kept importable from tikara.core
     TikaMetadata,
+    TikaOcrPolicy,
+    TikaParsedItem,
     TikaParseOutputFormat,
     TikaUnpackResult,
+    TikaWarmUpFamily,
+    TikaWarmUpTiming,
 )
 from tikara.error_handling import (
     TikaInputArgumentsError,
-    TikaInputFileNotFoundError,
-    TikaInputTypeError,
     TikaMimeTypeError,
-    TikaOutputModeError,
     wrap_exceptions,
 )
-from tikara.util.java import (
-    _is_binary_io,
-    _wrap_python_stream,
-    initialize_jvm,
-)
-from tikara.util.misc import _validate_and_prepare_output_file
+from tikara.session import TikaParseSession
+from tikara.util.java import _Deadline, _run_with_deadline, initialize_jvm
+from tikara.util.misc import _validate_and_prepare_output_file, _validate_input_file
+from tikara.util.samples import _WARM_UP_FAMILIES, _warm_up_sample
 from tikara.util.tika import (
+    _UNPACK_COPY_BUFFER_SIZE,
+    _build_default_parser,
+    _detect_mime_type,
     _get_metadata,
-    _handle_file_output,
-    _handle_stream_output,
-    _handle_string_output,
+    _load_tika_config,
+    _parse,
+    _ParseTemplate,
+    _read_header,
     _RecursiveEmbeddedDocumentExtractor,
     _tika_input_stream,
 )
@@ -46,6 +67,10 @@ if TYPE_CHECKING:
     from org.apache.tika.parser import Parser
 
 
+_LANGUAGE_SAMPLE_WINDOWS = 4
+"""Number of evenly spaced windows a long text is sampled from for language detection."""
+
+
 class Tika:
     """The main entrypoint class. Wraps management of the underlying Tika and JVM instances."""
 
@@ -54,98 +79,150 @@ class Tika:
         if self._j_tika_config:
             return self._j_tika_config
 
-        from org.apache.tika.config import TikaConfig as JTikaConfig
+        with self._init_lock:
+            if self._j_tika_config:
+                return self._j_tika_config
+
+            if self._config is not None:
+                self._j_tika_config = _load_tika_config(self._config)
+            else:
+                from org.apache.tika.config import TikaConfig as JTikaConfig
 
-        self._j_tika_config = JTikaConfig.getDefaultConfig()
+                self._j_tika_config = JTikaConfig.getDefaultConfig()
 
-        return self._j_tika_config
+            return self._j_tika_config
 
     @wrap_exceptions
     def _get_mime_type_registry(self) -> "MediaTypeRegistry":
         if self._media_type_registry:
             return self._media_type_registry
 
-        config = self._get_configuration()
+        with self._init_lock:
+            if self._media_type_registry:
+                return self._media_type_registry
 
-        self._media_type_registry = config.getMediaTypeRegistry()
+            config = self._get_configuration()
+            media_type_registry = config.getMediaTypeRegistry()
 
-        from org.apache.tika.mime import MediaType
+            from org.apache.tika.mime import MediaType
 
-        # if user has custom mime types, add them to the media type registry and validate them
-        for custom_mime_type in self._custom_mime_types or []:
-            try:
-                root_type, sub_type = custom_mime_type.split("/")
-                self._media_type_registry.addType(MediaType(root_type, sub_type))
-            except ValueError as e:
-                raise TikaMimeTypeError._from_mimetype(custom_mime_type) from e
-        return config.getMediaTypeRegistry()
+            # if user has custom mime types, add them to the media type registry and validate them
+            for custom_mime_type in self._custom_mime_types or []:
+                try:
+                    root_type, sub_type = custom_mime_type.split("/")
+                    media_type_registry.addType(MediaType(root_type, sub_type))
+                except ValueError as e:
+                    raise TikaMimeTypeError._from_mimetype(custom_mime_type) from e
 
-    @wrap_exceptions
-    def _get_language_detector(self) -> "LanguageDetector":
-        if self._language_detector:
-            return self._language_detector
+            # only publish the registry once every custom type is in place
+            self._media_type_registry = media_type_registry
+            return self._media_type_registry
+
+    @contextmanager
+    def _language_detector(self) -> Generator["LanguageDetector", None, None]:
+        """Check out an idle language detector, loading a new one if all are in use.
+
+        Detectors hold the text of the detection in progress, so each is used by one caller at a time. They are
+        returned to the pool afterwards, so the pool grows to the peak number of concurrent detections.
+        """
+        try:
+            language_detector = self._idle_language_detectors.pop()
+        except IndexError:
+            language_detector = self._load_language_detector()
+        try:
+            yield language_detector
+        finally:
+            self._idle_language_detectors.append(language_detector)
 
+    @wrap_exceptions
+    def _load_language_detector(self) -> "LanguageDetector":
         from org.apache.tika.language.detect import LanguageDetector
 
-        self._language_detector = LanguageDetector.getDefaultLanguageDetector()
-        self._language_detector.loadModels()
-        return self._language_detector
+        language_detector = LanguageDetector.getDefaultLanguageDetector()
+        language_detector.loadModels()
+        return language_detector
 
     @wrap_exceptions
     def _get_detector(self) -> "Detector":
         if self._detector:
             return self._detector
 
-        custom_detectors = (
-            self._custom_detectors() if callable(self._custom_detectors) else self._custom_detectors or []
-        )
+        with self._init_lock:
+            if self._detector:
+                return self._detector
 
-        from java.util import ArrayList as JArrayList
-        from org.apache.tika.detect import CompositeDetector, DefaultDetector
-
-        if not custom_detectors:
-            self._detector = DefaultDetector()
-        else:
-            media_type_registry = self._get_mime_type_registry()
-            self._detector = CompositeDetector(
-                media_type_registry,
-                JArrayList(
-                    [
-                        *custom_detectors,
-                        DefaultDetector(),
-                    ]
-                ),
+            custom_detectors = (
+                self._custom_detectors() if callable(self._custom_detectors) else self._custom_detectors or []
             )
-        return self._detector
+
+            from java.util import ArrayList as JArrayList
+            from org.apache.tika.detect import CompositeDetector, DefaultDetector
+
+            base_detector = self._get_configuration().getDetector() if self._config is not None else DefaultDetector()
+            if not custom_detectors:
+                self._detector = base_detector
+            else:
+                media_type_registry = self._get_mime_type_registry()
+                self._detector = CompositeDetector(
+                    media_type_registry,
+                    JArrayList(
+                        [
+                            *custom_detectors,
+                            base_detector,
+                        ]
+                    ),
+                )
+            return self._detector
 
     @wrap_exceptions
     def _get_parser(self) -> "Parser":
         if self._parser:
             return self._parser
 
-        custom_parsers = self._custom_parsers() if callable(self._custom_parsers) else self._custom_parsers or []
+        with self._init_lock:
+            if self._parser:
+                return self._parser
+
+            custom_parsers = self._custom_parsers() if callable(self._custom_parsers) else self._custom_parsers or []
 
-        from org.apache.tika.parser import AutoDetectParser, DefaultParser
+            from org.apache.tika.parser import AutoDetectParser, DefaultParser
 
-        detector = self._get_detector()
+            detector = self._get_detector()
+            if self._config is not None:
+                default_parser = self._get_configuration().getParser()
+            elif self._parsers is None and self._exclude_parsers is None:
+                default_parser = DefaultParser()
+            else:
+                default_parser = _build_default_parser(
+                    self._get_mime_type_registry(), self._parsers, self._exclude_parsers
+                )
 
-        self._parser = AutoDetectParser(detector, DefaultParser(), *custom_parsers)
+            # types no selected parser supports go to AutoDetectParser's fallback, which returns empty text
+            parser = AutoDetectParser(detector, default_parser, *custom_parsers)
+            if self._config is not None:
+                # carries the config's <autoDetectParserConfig>, like spooling and embedded-document limits
+                parser.setAutoDetectParserConfig(self._get_configuration().getAutoDetectParserConfig())
+            self._parser = parser
 
-        return self._parser
+            return self._parser
 
     @wrap_exceptions
     def _get_tika(self) -> "JTika":
         if self._tika:
             return self._tika
 
-        detector = self._get_detector()
-        parser = self._get_parser()
+        with self._init_lock:
+            if self._tika:
+                return self._tika
+
+            detector = self._get_detector()
+            parser = self._get_parser()
 
-        from org.apache.tika import Tika as JTika
+            from org.apache.tika import Tika as JTika
 
-        self._tika = JTika(detector, parser)
+            self._tika = JTika(detector, parser)
 
-        return self._tika
+            return self._tika
 
     @wrap_exceptions
     def __init__(  # noqa: PLR0913
@@ -157,6 +234,12 @@ class Tika:
         custom_mime_types: list[str] | None = None,
         extra_jars: list[Path] | None = None,
         tika_jar_override: Path | None = None,
+        detection_cache: TikaDetectionCache | None = None,
+        parse_cache: TikaParseCache | None = None,
+        jvm_options: TikaJvmOptions | None = None,
+        parsers: list[str] | None = None,
+        exclude_parsers: list[str] | None = None,
+        config: Path | str | None = None,
     ) -> None:
         """Initialize a new Tika wrapper instance.
 
@@ -175,10 +258,32 @@ class Tika:
                 Required when adding custom parsers/detectors that handle new MIME types.
             extra_jars: Additional JAR files to add to the JVM classpath. Useful for custom parsers/detectors. Defaults to None.
             tika_jar_override: Path to custom Tika JAR file to use instead of bundled version. Defaults to None.
+            detection_cache: Cache of `detect_mime_type` results, so repeated detections of unchanged files and
+                identical bytes skip Tika entirely. Can be shared between instances. Defaults to None (no caching).
+            parse_cache: Content-addressed cache of `parse` results, so byte-identical inputs are parsed only once.
+                Can be shared between instances. Defaults to None (no caching).
+            jvm_options: Heap, garbage collector and other settings for the JVM. Only take effect if this instance
+                starts the JVM, which happens once per process. Defaults to the options from `set_jvm_options`.
+            parsers: Build the default parser from only these of Tika's parsers, to cut startup time and memory.
+                Each entry is a MIME type pattern containing a "/", like "application/pdf" or
+                "application/vnd.openxmlformats-officedocument.*", or a parser class name, simple or fully
+                qualified, like "PDFParser" or "org.apache.tika.parser.microsoft.*". Documents of other types
+                parse to empty text. Custom parsers are always kept. Defaults to None (every parser).
+            exclude_parsers: Parsers or MIME types to leave out of the default parser, in the same format as
+                `parsers`. Defaults to None.
+            config: Path to a tika-config.xml, as used by tika-server and tika-app, to build the parser, detector and
+                MIME types from instead of Tika's defaults. The loaded config is shared by every instance using the
+                same file, and reloaded if the file changes. Custom parsers and detectors are added on top of it.
+                Cannot be combined with `parsers` or `exclude_parsers`; use `<parser-exclude>` in the config
+                instead. Defaults to None (Tika's default configuration).
 
         Raises:
             ValueError: If a custom MIME type is malformed (incorrect format).
             FileNotFoundError: If specified JAR files don't exist.
+            TikaInputArgumentsError: If `parsers` selects no parser at all, which is checked when the parser is
+                built, on first use unless `lazy_load` is False. Also if `config` is combined with `parsers` or
+                `exclude_parsers`.
+            TikaInitializationError: If `config` cannot be loaded.
 
         Examples:
             Basic usage::
@@ -196,6 +301,14 @@ class Tika:
                     custom_mime_types=["text/markdown"]
                 ... )
 
+            With a tika-config.xml::
+
+                tika = Tika(config=Path("tika-config.xml"))
+
+            Office documents only::
+
+                tika = Tika(parsers=["PDFParser", "org.apache.tika.parser.microsoft.*", "text/*"])
+
             With custom detector::
 
                 from custom_detector import MarkdownDetector
@@ -218,28 +331,50 @@ class Tika:
             - examples/custom_parser.ipynb: Custom parser implementation
             - examples/custom_detector.ipynb: Custom detector implementation
         """  # noqa: E501
-        initialize_jvm(tika_jar_override=tika_jar_override, extra_jars=extra_jars)
+        if config is not None and (parsers is not None or exclude_parsers is not None):
+            msg = "config cannot be combined with parsers or exclude_parsers; use <parser-exclude> in the config"
+            raise TikaInputArgumentsError(msg)
+
+        initialize_jvm(tika_jar_override=tika_jar_override, extra_jars=extra_jars, jvm_options=jvm_options)
 
         self._custom_mime_types: list[str] | None = custom_mime_types
         self._custom_parsers = custom_parsers
         self._custom_detectors = custom_detectors
+        self._parsers = parsers
+        self._exclude_parsers = exclude_parsers
+        self._config = _validate_input_file(config) if config is not None else None
 
+        # guards the lazy getters, so concurrent first use builds each component only once
+        self._init_lock = RLock()
         self._j_tika_config: JTikaConfig | None = None
         self._media_type_registry: MediaTypeRegistry | None = None
-        self._language_detector: LanguageDetector | None = None
+        # deque's append and pop are atomic, so detectors can be checked in and out without a lock
+        self._idle_language_detectors: deque[LanguageDetector] = deque()
         self._detector: Detector | None = None
         self._parser: Parser | None = None
         self._tika: JTika | None = None
+        self._detection_cache = detection_cache
+        self._detector_fingerprint: str | None = None
+        self._parse_cache = parse_cache
+        self._parser_fingerprint: str | None = None
 
         if not lazy_load:
             self._get_tika()
-            self._get_language_detector()
+            self._idle_language_detectors.append(self._load_language_detector())
 
     #
     # MimeType detection
     #
     @wrap_exceptions
-    def detect_mime_type(self, obj: TikaInputType) -> str:
+    def detect_mime_type(
+        self,
+        obj: TikaInputType,
+        *,
+        io_mode: TikaIOMode = "stream",
+        timeout: float | None = None,
+        header_only: bool = False,
+        header_size: int | None = None,
+    ) -> str:
         """Detect the MIME type of a file, bytes, or stream.
 
         Uses Apache Tika's MIME type detection capabilities which combine file extension examination,
@@ -249,8 +384,20 @@ class Tika:
         Args:
             obj: Input to detect MIME type for. Can be:
                 - Path or str: Filesystem path
-                - bytes: Raw content bytes
+                - bytes, bytearray, memoryview or mmap: Raw content, read by Java without copying (on JREs with
+                  java.net.http; others copy it once)
                 - BinaryIO: File-like object in binary mode
+            io_mode: How to read open files. "stream" (default) reads them as a stream. "mmap" has Tika open a
+                file stream positioned at its start as a file, and memory-maps other open files so the detector
+                reads from the OS page cache instead of through Python reads. Paths are always read by Tika as files.
+            timeout: Maximum number of seconds detection may take before `TikaTimeoutError` is raised. The
+                call returns at the deadline even if the detector does not stop. Defaults to no timeout.
+            header_only: Read at most `header_size` bytes from the start of the input and detect from those
+                alone. Nothing past the header is read, whatever the input type, so classifying large or remote
+                files costs a few KB of I/O each. Container formats that are told apart by their contents (such as
+                OOXML inside ZIP) then fall back to magic bytes and the file name. Ignores `io_mode`.
+            header_size: Number of bytes read when `header_only` is set. Defaults to the length the configured
+                MIME magic rules need.
 
         Returns:
             str: Detected MIME type in format "type/subtype" (e.g. "application/pdf")
@@ -259,6 +406,7 @@ class Tika:
             TypeError: If input type is not supported
             FileNotFoundError: If input file path does not exist
             ValueError: If detection fails
+            TikaInputArgumentsError: If `header_size` is not positive
 
         Examples:
             Path input::
@@ -278,6 +426,11 @@ class Tika:
                 bio = BytesIO(b"<html><body>Hello</body></html>")
                 tika.detect_mime_type(bio)
 
+            Header-only detection of a remote object::
+
+                with fs.open("bucket/archive/object.bin", "rb") as f:
+                    tika.detect_mime_type(f, header_only=True)
+
         Notes:
             - Supports all >1600 MIME types recognized by Apache Tika
             - Custom MIME types can be added via custom detectors
@@ -288,46 +441,69 @@ class Tika:
             - examples/detect_mime_type.ipynb: More detection examples
             - examples/custom_detector.ipynb: Adding custom MIME type detection
         """
-        from java.io import ByteArrayInputStream, InputStream
-        from java.nio.file import Path as JPath
-
-        input_stream: InputStream | None = None
-        input_file: Path | None = None
+        from org.apache.tika.metadata import Metadata, TikaCoreProperties
 
+        metadata = Metadata()
         if isinstance(obj, str | Path):
-            input_file = Path(obj)
-        elif isinstance(obj, bytes):
-            input_stream = ByteArrayInputStream(obj)
-        elif _is_binary_io(obj):
-            input_stream = _wrap_python_stream(obj)
+            # name-based detection only needs the file name, as with Tika's own detect(Path)
+            metadata.set(TikaCoreProperties.RESOURCE_NAME_KEY, Path(obj).name)
+
+        tika = self._get_tika()
+        if header_only:
+            if header_size is None:
+                header_size = self._get_configuration().getMimeRepository().getMinLength()
+            if header_size <= 0:
+                msg = f"header_size must be positive, got {header_size}"
+                raise TikaInputArgumentsError(msg)
+            if not isinstance(obj, str | Path):
+                obj = _read_header(obj, header_size)
         else:
-            raise TikaInputTypeError._from_input_type(type(obj))
+            header_size = None
 
-        if input_file and not input_file.exists():
-            raise TikaInputFileNotFoundError._from_file(input_file)
+        cache_key = None
+        if self._detection_cache is not None:
+            cache_key = _detection_cache_key(obj, fingerprint=self._get_detector_fingerprint(), header_size=header_size)
+            if cache_key is not None and (mime_type := self._detection_cache.get(cache_key)) is not None:
+                return mime_type
 
-        try:
-            tika = self._get_tika()
-
-            if input_stream:
-                return str(tika.detect(input_stream))
-            if input_file:
-                java_path = JPath.of(str(input_file))
-                return str(tika.detect(java_path))
-            msg = "Unsupported input type"
-            raise TikaInputArgumentsError from ValueError(msg)
-        finally:
-            if isinstance(input_stream, InputStream):
-                input_stream.close()
+        if header_size is not None and isinstance(obj, str | Path):
+            obj = _read_header(obj, header_size)
+            io_mode = "stream"
+
+        mime_type = _run_with_deadline(partial(_detect_mime_type, tika, obj, metadata, io_mode), timeout)
+
+        if cache_key is not None and self._detection_cache is not None:
+            self._detection_cache.put(cache_key, mime_type)
+        return mime_type
+
+    def _get_detector_fingerprint(self) -> str:
+        if self._detector_fingerprint is None:
+            self._detector_fingerprint = _detector_fingerprint(
+                self._get_detector(), self._custom_mime_types, config_file=self._config
+            )
+        return self._detector_fingerprint
 
     #
     # Language detection
     #
+    @overload
+    def detect_language(
+        self, content: str, *, top_k: None = None, sample_chars: int | None = None
+    ) -> TikaDetectLanguageResult: ...
+
+    @overload
+    def detect_language(
+        self, content: str, *, top_k: int, sample_chars: int | None = None
+    ) -> list[TikaDetectLanguageResult]: ...
+
     @wrap_exceptions
     def detect_language(
         self,
         content: str,
-    ) -> TikaDetectLanguageResult:
+        *,
+        top_k: int | None = None,
+        sample_chars: int | None = None,
+    ) -> TikaDetectLanguageResult | list[TikaDetectLanguageResult]:
         """Detect the natural language of text content using Apache Tika's language detection.
 
         Uses statistical language detection models to identify the most likely language. Higher confidence
@@ -335,16 +511,22 @@ class Tika:
 
         Args:
             content: Text content to analyze. Should be plain text, not markup/code.
+            top_k: If set, return up to this many candidate languages, best first, instead of only the best one.
+            sample_chars: If set, classify texts longer than this from a sample of this many characters, taken in
+                evenly spaced windows across the text, so long documents cost no more than short ones. Defaults to
+                None, classifying the full text.
 
         Returns:
             TikaDetectLanguageResult with fields:
                 language: ISO 639-1 language code (e.g. "en" for English)
                 confidence: Qualitative confidence level (HIGH/MEDIUM/LOW/NONE)
                 raw_score: Numeric confidence score between 0 and 1
+            With `top_k`, a list of such results ranked by score.
 
         Raises:
             ValueError: If content is empty
             RuntimeError: If language detection fails
+            TikaInputArgumentsError: If `top_k` or `sample_chars` is less than 1
 
         Examples:
             High confidence detection::
@@ -369,23 +551,104 @@ class Tika:
                 tika.detect_language("El rápido zorro marrón salta sobre el perro perezoso").language
                 'es'
 
+            Ranked candidates::
+
+                [r.language for r in tika.detect_language("Ich bin ein Berliner", top_k=3)]
+                ['de', 'nl', 'da']
+
         Notes:
             - Models are loaded lazily on first use unless lazy_load=False in constructor
             - Supports ~70 languages including all major European and Asian languages
             - Short or ambiguous content may result in lower confidence scores
             - Language models are memory-intensive; loaded models persist until JVM shutdown
+            - Detectors are not thread-safe, so concurrent calls each use their own, loaded on first need
 
         See Also:
             - examples/detect_language.ipynb: Additional language detection examples
         """
-        language_detector = self._get_language_detector()
-        result = language_detector.detect(content)
+        _validate_language_options(top_k=top_k, sample_chars=sample_chars)
+        return self._detect_language(content, top_k=top_k, sample_chars=sample_chars)
+
+    def _detect_language(
+        self, content: str, *, top_k: int | None, sample_chars: int | None
+    ) -> TikaDetectLanguageResult | list[TikaDetectLanguageResult]:
+        sample = _sample_text(content, sample_chars)
+        with self._language_detector() as language_detector:
+            if top_k is None:
+                return TikaDetectLanguageResult._from_java_language_result(language_detector.detect(sample))
+
+            language_detector.reset()
+            language_detector.addText(sample)
+            results = list(language_detector.detectAll())[:top_k]
+        return [TikaDetectLanguageResult._from_java_language_result(result) for result in results]
 
-        return TikaDetectLanguageResult(
-            language=str(result.getLanguage()),
-            confidence=TikaLanguageConfidence(str(result.getConfidence().name())),
-            raw_score=float(result.getRawScore()),
-        )
+    @overload
+    def detect_language_many(
+        self,
+        texts: Iterable[str],
+        *,
+        top_k: None = None,
+        sample_chars: int | None = None,
+        workers: int | None = None,
+    ) -> list[TikaDetectLanguageResult]: ...
+
+    @overload
+    def detect_language_many(
+        self,
+        texts: Iterable[str],
+        *,
+        top_k: int,
+        sample_chars: int | None = None,
+        workers: int | None = None,
+    ) -> list[list[TikaDetectLanguageResult]]: ...
+
+    @wrap_exceptions
+    def detect_language_many(
+        self,
+        texts: Iterable[str],
+        *,
+        top_k: int | None = None,
+        sample_chars: int | None = None,
+        workers: int | None = None,
+    ) -> list[TikaDetectLanguageResult] | list[list[TikaDetectLanguageResult]]:
+        """Detect the language of many texts, such as the chunks of a document.
+
+        Detectors are reused from text to text, so the per-text cost is only the detection itself.
+
+        Args:
+            texts: The texts to classify.
+            top_k: If set, return up to this many ranked candidates per text. See `detect_language`.
+            sample_chars: If set, classify long texts from a bounded sample. See `detect_language`. Defaults to the
+                full text.
+            workers: Number of threads to classify with. Each busy thread needs its own copy of the language
+                models, loaded the first time it is needed. Defaults to 1, classifying on the calling thread.
+
+        Returns:
+            One result per text, in input order, or one ranked list per text with `top_k`.
+
+        Raises:
+            TikaInputArgumentsError: If `top_k`, `sample_chars` or `workers` is less than 1
+
+        Examples:
+            ::
+
+                chunks = [chunk.text for chunk in splitter.split(content)]
+                languages = [result.language for result in tika.detect_language_many(chunks)]
+        """
+        _validate_language_options(top_k=top_k, sample_chars=sample_chars)
+        if workers is None:
+            workers = 1
+        if workers < 1:
+            msg = f"workers must be at least 1, got {workers}"
+            raise TikaInputArgumentsError(msg)
+
+        def detect(content: str) -> Any:  # noqa: ANN401
+            return self._detect_language(content, top_k=top_k, sample_chars=sample_chars)
+
+        if workers == 1:
+            return [detect(content) for content in texts]
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tika-language") as executor:
+            return list(executor.map(detect, texts))
 
     @staticmethod
     def _determine_root_file_output_path(
@@ -406,7 +669,7 @@ class Tika:
         return Path(output_dir, "root_input_file")
 
     @wrap_exceptions
-    def unpack(
+    def unpack(  # noqa: PLR0913
         self,
         obj: TikaInputType,
         output_dir: Path,
@@ -414,6 +677,9 @@ class Tika:
         max_depth: int = 1,
         input_file_name: str | Path | None = None,
         content_type: str | None = None,
+        copy_buffer_size: int = _UNPACK_COPY_BUFFER_SIZE,
+        io_mode: TikaIOMode = "stream",
+        timeout: float | None = None,
     ) -> TikaUnpackResult:
         """Extract embedded documents from a container document recursively.
 
@@ -423,7 +689,8 @@ class Tika:
         Args:
             obj: Input container document to extract from. Can be:
                 - Path or str: Filesystem path
-                - bytes: Raw content bytes
+                - bytes, bytearray, memoryview or mmap: Raw content, read by Java without copying (on JREs with
+                  java.net.http; others copy it once)
                 - BinaryIO: File-like object in binary mode
             output_dir: Directory to save extracted documents to. Created if doesn't exist.
             max_depth: Maximum recursion depth for nested containers. Default 1 extracts only
@@ -432,11 +699,22 @@ class Tika:
                 extraction and also helps name the output of the root file in the output_dir. Only necessary
                 if obj is bytes or stream.
             content_type: MIME type of input if known. Helps with metadata extraction.
+            copy_buffer_size: Size in bytes of the buffer used to copy each embedded document to disk. The copy
+                runs entirely inside the JVM. Defaults to 64 KiB.
+            io_mode: How to read open files. "stream" (default) reads them as a stream. "mmap" has Tika open a
+                file stream positioned at its start as a file, through its name or its `/proc/self/fd` link, so
+                container parsers read it in place instead of a spooled copy. Other open files are memory-mapped
+                and read from the mapping, but containers still spool those. Paths are always read by Tika as files.
+            timeout: Maximum number of seconds extraction may take. When it expires, the Java thread is
+                interrupted, the input is closed and `TikaTimeoutError` is raised straight away, even if the parser
+                does not stop. Such a parser finishes in the background, so files may still appear in `output_dir`
+                after the call returns. Files already written are left in place. Defaults to no timeout.
 
         Returns:
             TikaUnpackResult with fields:
                 root_metadata: Metadata of the root document
-                embedded_documents: List of TikaUnpackedItem objects representing extracted files
+                embedded_documents: List of TikaUnpackedItem objects representing extracted files, each with
+                    the number of bytes written and the time the copy took
 
         Raises:
             FileNotFoundError: If input file path doesn't exist
@@ -486,6 +764,7 @@ class Tika:
             parser=parser,
             output_dir=output_dir,
             max_depth=max_depth,
+            copy_buffer_size=copy_buffer_size,
         )
 
         pc.set(
@@ -496,13 +775,17 @@ class Tika:
             ),
         )
 
-        with _tika_input_stream(obj, metadata=tika_metadata) as input_stream:
-            parser.parse(input_stream, ch, tika_metadata, pc)
+        def unpack(deadline: _Deadline) -> TikaUnpackResult:
+            with _tika_input_stream(obj, metadata=tika_metadata, io_mode=io_mode) as input_stream:
+                deadline.add_closeable(input_stream)
+                parser.parse(input_stream, ch, tika_metadata, pc)
 
-            return TikaUnpackResult(
-                root_metadata=TikaMetadata._from_java_metadata(tika_metadata),
-                embedded_documents=extractor.get_results(),
-            )
+                return TikaUnpackResult(
+                    root_metadata=TikaMetadata._from_java_metadata(tika_metadata),
+                    embedded_documents=extractor.get_results(),
+                )
+
+        return _run_with_deadline(unpack, timeout)
 
     @overload
     def parse(
@@ -512,6 +795,11 @@ class Tika:
         output_format: TikaParseOutputFormat = "xhtml",
         input_file_name: str | Path | None = None,
         content_type: str | None = None,
+        io_mode: TikaIOMode = "stream",
+        max_chars: int | None = None,
+        timeout: float | None = None,
+        detect_language: bool = False,
+        ocr: TikaOcrPolicy | None = None,
     ) -> tuple[str, TikaMetadata]:
         """Extract content and metadata from a document, returning as a string.
 
@@ -544,6 +832,11 @@ class Tika:
         output_format: TikaParseOutputFormat = "xhtml",
         input_file_name: str | Path | None = None,
         content_type: str | None = None,
+        io_mode: TikaIOMode = "stream",
+        max_chars: int | None = None,
+        timeout: float | None = None,
+        detect_language: bool = False,
+        ocr: TikaOcrPolicy | None = None,
     ) -> tuple[Path, TikaMetadata]:
         """Extract content and metadata from a document, saving content to a file.
 
@@ -577,11 +870,20 @@ class Tika:
         output_format: TikaParseOutputFormat = "xhtml",
         input_file_name: str | Path | None = None,
         content_type: str | None = None,
+        io_mode: TikaIOMode = "stream",
+        max_chars: int | None = None,
+        timeout: float | None = None,
+        detect_language: bool = False,
+        ocr: TikaOcrPolicy | None = None,
     ) -> tuple[BinaryIO, TikaMetadata]:
         """Extract content and metadata from a document, returning content as a stream.
 
         Returns content as a binary stream for efficient processing of large documents.
-        Stream can be read incrementally without loading entire content into memory.
+        Parsing continues in the background while the stream is read, through a bounded buffer, so the
+        first bytes arrive quickly and memory use does not grow with the size of the document.
+
+        The returned metadata reflects what was known when the first output was produced. The complete
+        metadata is available from the stream's ``metadata`` attribute once it has been read to the end.
 
         Args:
             obj: Input document (path, bytes, or stream)
@@ -612,6 +914,11 @@ class Tika:
         output_file: Path | str | None = None,
         input_file_name: str | Path | None = None,
         content_type: str | None = None,
+        io_mode: TikaIOMode = "stream",
+        max_chars: int | None = None,
+        timeout: float | None = None,
+        detect_language: bool = False,
+        ocr: TikaOcrPolicy | None = None,
     ) -> tuple[str | Path | BinaryIO, TikaMetadata]:
         """Extract text content and metadata from documents.
 
@@ -621,7 +928,8 @@ class Tika:
         Args:
             obj: Input to parse. Can be:
                 - Path or str: Filesystem path
-                - bytes: Raw content bytes
+                - bytes, bytearray, memoryview or mmap: Raw content, read by Java without copying (on JREs with
+                  java.net.http; others copy it once)
                 - BinaryIO: File-like object in binary mode
             output_stream: Whether to return content as a stream instead of string
             output_format: Format for extracted text:
@@ -630,6 +938,31 @@ class Tika:
             output_file: Save content to this path instead of returning it
             input_file_name: Original filename if obj is bytes/stream
             content_type: MIME type of input if known
+            io_mode: How to read open files. "stream" (default) reads them as a stream. "mmap" has Tika open a
+                file stream positioned at its start as a file, through its name or its `/proc/self/fd` link, so
+                parsers that need random access (ZIP, OOXML, PDF) read it in place instead of a spooled copy.
+                Other open files, such as ones read part way, are memory-mapped and read from the mapping rather
+                than through Python reads, but those parsers still spool them. Paths are always read by Tika as
+                files.
+            max_chars: Stop parsing once this many characters of text have been extracted. The parser is
+                interrupted at the limit rather than run to the end, and the returned metadata has
+                `write_limit_reached` set. Markup in "xhtml" output does not count towards the limit.
+                Defaults to no limit.
+            timeout: Maximum number of seconds the parse may take. When it expires, the Java parsing thread is
+                interrupted and the input is closed, and `TikaTimeoutError` is raised straight away. A parser
+                stuck in CPU-bound work that ignores the interrupt is left to finish on a background thread, which
+                then releases its resources. With `output_stream`, the timeout bounds the background parse and the
+                error is raised from the stream's reads. Defaults to no timeout.
+            detect_language: Detect the language of the document text while parsing, and return it in
+                `metadata.detected_language`. The detector is fed the first 10,000 characters of text as the parser
+                produces them, so no second pass over the content is needed. Works with every output mode.
+            ocr: OCR policy of this parse, overriding the Tesseract and PDF parser configuration for this call only:
+                - "off": No OCR at all, the cheapest option for documents with a text layer
+                - "auto": OCR images, and only the PDF pages without a usable text layer
+                - "only": OCR PDF pages instead of extracting their text layer
+                - TesseractOptions: "auto" with OCR languages, timeout, DPI and resizing, and a choice of whether
+                  PDF pages that have text are skipped
+                Defaults to None, which keeps the configured behavior.
 
         Returns:
             Tuple containing:
@@ -643,6 +976,8 @@ class Tika:
             ValueError: If output_file needed but not provided
             FileNotFoundError: If input file doesn't exist
             TypeError: If input type not supported
+            TikaTimeoutError: If the parse takes longer than `timeout`
+            TikaInputArgumentsError: If `ocr` is not a valid policy
 
         Examples:
             Basic text extraction::
@@ -670,6 +1005,11 @@ class Tika:
                     output_format="txt"
                 ... )
 
+            Skip OCR for documents that have a text layer::
+
+                content, meta = tika.parse("scan-or-not.pdf", ocr="off")
+                content, meta = tika.parse("scan.pdf", ocr=TesseractOptions(language="eng+deu", timeout_seconds=60))
+
             Parse bytes with hints::
 
                 with open("doc.pdf", "rb") as f:
@@ -690,54 +1030,375 @@ class Tika:
         See Also:
             - examples/parsing.ipynb: More parsing examples
         """
-        output_mode: Literal["string", "file", "stream"]
-        if output_stream:
-            output_mode = "stream"
-        elif output_file:
-            output_mode = "file"
-        else:
-            output_mode = "string"
+        if self._parse_cache is not None and not output_stream:
+            return self._parse_cached(
+                self._parse_cache,
+                obj,
+                output_format=output_format,
+                output_file=output_file,
+                input_file_name=input_file_name,
+                content_type=content_type,
+                io_mode=io_mode,
+                max_chars=max_chars,
+                timeout=timeout,
+                detect_language=detect_language,
+                ocr=ocr,
+            )
 
-        output_file = _validate_and_prepare_output_file(output_file=output_file, output_format=output_format)
-        if output_mode == "file" and not output_file:
-            msg = "output_file is required when mode is 'file'"
-            raise TikaInputArgumentsError(msg)
+        return _parse(
+            _ParseTemplate(self._get_parser(), ocr),
+            obj,
+            output_stream=output_stream,
+            output_format=output_format,
+            output_file=output_file,
+            input_file_name=input_file_name,
+            content_type=content_type,
+            io_mode=io_mode,
+            max_chars=max_chars,
+            timeout=timeout,
+            language_detector=self._language_detector if detect_language else None,
+        )
+
+    def _parse_cached(  # noqa: PLR0913
+        self,
+        cache: TikaParseCache,
+        obj: TikaInputType,
+        *,
+        output_format: TikaParseOutputFormat,
+        output_file: Path | str | None,
+        input_file_name: str | Path | None,
+        content_type: str | None,
+        io_mode: TikaIOMode,
+        max_chars: int | None,
+        timeout: float | None,
+        detect_language: bool,
+        ocr: TikaOcrPolicy | None,
+    ) -> tuple[str | Path | BinaryIO, TikaMetadata]:
+        """Parse through `cache`: answer repeated inputs from it, and store the results of new ones."""
+        template = _ParseTemplate(self._get_parser(), ocr)
+        language_detector = self._language_detector if detect_language else None
+        digest = _content_digest(obj)
+        if digest is None:
+            return _parse(
+                template,
+                obj,
+                output_stream=False,
+                output_format=output_format,
+                output_file=output_file,
+                input_file_name=input_file_name,
+                content_type=content_type,
+                io_mode=io_mode,
+                max_chars=max_chars,
+                timeout=timeout,
+                language_detector=language_detector,
+            )
 
-        # Create initial metadata
-        metadata = _get_metadata(
-            obj=obj,
+        # the name only steers detection through its extension, so identical bytes under other names share an entry
+        resource_name = str(obj) if isinstance(obj, str | Path) else str(input_file_name) if input_file_name else None
+        key = _parse_cache_key(
+            digest,
+            fingerprint=self._get_parser_fingerprint(),
+            output_mode="file" if output_file else "string",
+            options=(
+                output_format,
+                Path(resource_name or "").suffix.lower(),
+                content_type,
+                max_chars,
+                detect_language,
+                ocr,
+            ),
+        )
+
+        if (cached := cache.get(key)) is not None:
+            content, metadata = cached
+            raw_metadata = {k: v for k, v in metadata.raw_metadata.items() if k != "resourceName"}
+            if resource_name:
+                raw_metadata["resourceName"] = resource_name
+            metadata = metadata.model_copy(update={"resource_name": resource_name, "raw_metadata": raw_metadata})
+            if output_file:
+                output_path = _validate_and_prepare_output_file(output_file, output_format)
+                assert output_path is not None  # noqa: S101
+                output_path.write_bytes(content)
+                return output_path, metadata
+            return content.decode(), metadata
+
+        result, metadata = _parse(
+            template,
+            obj,
+            output_stream=False,
+            output_format=output_format,
+            output_file=output_file,
             input_file_name=input_file_name,
             content_type=content_type,
+            io_mode=io_mode,
+            max_chars=max_chars,
+            timeout=timeout,
+            language_detector=language_detector,
         )
+        content = result.read_bytes() if isinstance(result, Path) else str(result).encode()
+        cache.put(key, content, metadata)
+        return result, metadata
 
-        parser = self._get_parser()
-        # Create input stream
-        with _tika_input_stream(obj, metadata=metadata) as input_stream:
-            match output_mode:
-                case "file":
-                    if not output_file:
-                        msg = "output_file is required when mode is 'file'"
-                        raise TikaInputArgumentsError(msg)
-                    return _handle_file_output(
-                        parser=parser,
-                        output_file=output_file,
-                        input_stream=input_stream,
-                        metadata=metadata,
-                        output_format=output_format,
-                    )
-                case "stream":
-                    return _handle_stream_output(
-                        parser=parser,
-                        input_stream=input_stream,
-                        metadata=metadata,
-                        output_format=output_format,
-                    )
-                case "string":
-                    return _handle_string_output(
-                        parser=parser,
-                        input_stream=input_stream,
-                        metadata=metadata,
-                        output_format=output_format,
+    def _get_parser_fingerprint(self) -> str:
+        if self._parser_fingerprint is None:
+            self._parser_fingerprint = _parser_fingerprint(self._get_parser(), self._get_detector_fingerprint())
+        return self._parser_fingerprint
+
+    @wrap_exceptions
+    def session(
+        self,
+        *,
+        output_format: TikaParseOutputFormat = "xhtml",
+        io_mode: TikaIOMode = "stream",
+        ocr: TikaOcrPolicy | None = None,
+    ) -> TikaParseSession:
+        """Create a session for parsing many documents with as little per-call setup as possible.
+
+        The session builds the parser and a template of its parse context up front, including the OCR configs of
+        `ocr`, so its `parse` only creates the objects specific to each document. Session parses do not use this
+        instance's `parse_cache`; every call runs the parser.
+
+        Args:
+            output_format: Default output format of the session's `parse`.
+            io_mode: Default io_mode of the session's `parse`.
+            ocr: Default OCR policy of the session's `parse`. See `parse`.
+
+        Returns:
+            TikaParseSession: A session bound to this instance's parser. Safe to share between threads.
+
+        Examples:
+            ::
+
+                session = tika.session(output_format="txt")
+                for path in paths:
+                    content, metadata = session.parse(path)
+        """
+        return TikaParseSession(
+            self._get_parser(),
+            output_format=output_format,
+            io_mode=io_mode,
+            ocr=ocr,
+            language_detector=self._language_detector,
+        )
+
+    @wrap_exceptions
+    def warm_up(
+        self,
+        families: Iterable[TikaWarmUpFamily] | None = None,
+        *,
+        iterations: int = 3,
+        output_format: TikaParseOutputFormat = "xhtml",
+    ) -> list[TikaWarmUpTiming]:
+        """Prime the parsers of the given document families by parsing small built-in samples.
+
+        `lazy_load=False` only builds the detector and parser objects. The first real PDF, DOCX or MSG still loads
+        hundreds of classes and runs interpreted until the JIT compiles the hot paths. Warming up pays that cost
+        ahead of time, so a worker can be put into rotation with its first requests as fast as later ones.
+
+        The samples are generated in memory and parsed straight through the parser, bypassing any parse cache.
+        Families whose sample needs Java classes missing from the classpath, as with a trimmed Tika jar, are
+        skipped and reported with `skipped` set.
+
+        Args:
+            families: Document families to warm up. Defaults to all of them.
+            iterations: Number of times each family's sample is parsed. More iterations give the JIT more
+                chances to compile the parser's hot paths.
+            output_format: Output format the samples are parsed to. Use the format real parses will use.
+
+        Returns:
+            list[TikaWarmUpTiming]: One entry per family, in the order given, with its first and last parse times.
+
+        Raises:
+            TikaInputArgumentsError: If `iterations` is less than 1 or a family is unknown.
+
+        Examples:
+            ::
+
+                tika = Tika(lazy_load=False)
+                for timing in tika.warm_up(["pdf", "docx", "xlsx", "msg"], iterations=5):
+                    print(f"{timing.family}: {timing.first_seconds:.3f}s -> {timing.last_seconds:.3f}s")
+        """
+        if iterations < 1:
+            msg = f"iterations must be at least 1, got {iterations}"
+            raise TikaInputArgumentsError(msg)
+        families = list(families) if families is not None else list(_WARM_UP_FAMILIES)
+        if unknown := [family for family in families if family not in _WARM_UP_FAMILIES]:
+            msg = f"Unknown warm-up families {unknown}, expected some of {list(_WARM_UP_FAMILIES)}"
+            raise TikaInputArgumentsError(msg)
+
+        from java.lang import ClassNotFoundException, NoClassDefFoundError
+
+        template = _ParseTemplate(self._get_parser())
+        timings: list[TikaWarmUpTiming] = []
+        for family in families:
+            try:
+                sample = _warm_up_sample(family)
+            except (ImportError, ClassNotFoundException, NoClassDefFoundError) as e:
+                skipped = f"the {family} sample needs Java classes missing from the classpath: {e}"
+                timings.append(
+                    TikaWarmUpTiming(
+                        family=family,
+                        iterations=0,
+                        first_seconds=0.0,
+                        last_seconds=0.0,
+                        total_seconds=0.0,
+                        skipped=skipped,
                     )
-                case _:
-                    raise TikaOutputModeError._from_output_mode(output_mode)
+                )
+                continue
+            durations: list[float] = []
+            metadata: TikaMetadata | None = None
+            for _ in range(iterations):
+                start = time.perf_counter()
+                _, metadata = _parse(
+                    template,
+                    sample,
+                    output_stream=False,
+                    output_format=output_format,
+                    output_file=None,
+                    input_file_name=None,
+                    content_type=None,
+                    io_mode="stream",
+                )
+                durations.append(time.perf_counter() - start)
+            timings.append(
+                TikaWarmUpTiming(
+                    family=family,
+                    mime_type=metadata.content_type if metadata else None,
+                    iterations=iterations,
+                    first_seconds=durations[0],
+                    last_seconds=durations[-1],
+                    total_seconds=sum(durations),
+                )
+            )
+        return timings
+
+    def parse_many(  # noqa: PLR0913
+        self,
+        inputs: Iterable[TikaInputType],
+        *,
+        workers: int | None = None,
+        ordered: bool = False,
+        output_format: TikaParseOutputFormat = "xhtml",
+        io_mode: TikaIOMode = "stream",
+        max_chars: int | None = None,
+        ocr: TikaOcrPolicy | None = None,
+    ) -> Iterator[TikaParsedItem]:
+        """Parse many documents concurrently, returning content as strings.
+
+        Parses run on a pool of threads. Java releases the GIL while it parses, so a single process can keep every
+        core busy. Inputs are consumed lazily and only a bounded number are in flight at once, so `inputs` can be
+        an arbitrarily long generator.
+
+        Args:
+            inputs: Documents to parse. Each can be any input accepted by `parse`.
+            workers: Number of parses to run at once. Defaults to the number of CPUs.
+            ordered: Whether to yield results in input order. By default results are yielded as soon as they
+                complete, which keeps all workers busy even when one document is slow.
+            output_format: "txt" for plain text or "xhtml" for structured format (default)
+            io_mode: How to read file-backed inputs. See `parse`.
+            max_chars: Maximum number of characters of text to extract per document. See `parse`.
+            ocr: OCR policy of every parse. See `parse`.
+
+        Returns:
+            Iterator[TikaParsedItem]: One result per input, with the input's `index`. Failures are not raised: the
+                exception is returned in the item's `error` field and the rest of the batch carries on.
+
+        Raises:
+            TikaInputArgumentsError: If `workers` is less than 1. Raised by the call itself, before iteration.
+
+        Examples:
+            ::
+
+                tika = Tika()
+                for item in tika.parse_many(Path("docs").glob("*.pdf"), workers=8, output_format="txt"):
+                    if item.ok:
+                        index_document(item.content, item.metadata)
+                    else:
+                        print(f"Input {item.index} failed: {item.error}")
+
+        Notes:
+            - Stopping iteration early cancels inputs that have not started yet
+            - Streams passed as inputs must not be shared between items
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers < 1:
+            msg = f"workers must be at least 1, got {workers}"
+            raise TikaInputArgumentsError(msg)
+
+        # build the shared parser once up front rather than on every worker's first call
+        self._get_parser()
+        return self._parse_many(
+            inputs,
+            workers=workers,
+            ordered=ordered,
+            output_format=output_format,
+            io_mode=io_mode,
+            max_chars=max_chars,
+            ocr=ocr,
+        )
+
+    def _parse_many(  # noqa: PLR0913
+        self,
+        inputs: Iterable[TikaInputType],
+        *,
+        workers: int,
+        ordered: bool,
+        output_format: TikaParseOutputFormat,
+        io_mode: TikaIOMode,
+        max_chars: int | None,
+        ocr: TikaOcrPolicy | None,
+    ) -> Iterator[TikaParsedItem]:
+        def parse_one(index: int, obj: TikaInputType) -> TikaParsedItem:
+            try:
+                content, metadata = self.parse(
+                    obj, output_format=output_format, io_mode=io_mode, max_chars=max_chars, ocr=ocr
+                )
+            except Exception as e:  # noqa: BLE001
+                return TikaParsedItem(index=index, error=e)
+            return TikaParsedItem(index=index, content=content, metadata=metadata)
+
+        max_in_flight = workers * 2
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tika-parse")
+        try:
+            pending: deque[Future[TikaParsedItem]] = deque()
+            for index, obj in enumerate(inputs):
+                pending.append(executor.submit(parse_one, index, obj))
+                while len(pending) >= max_in_flight:
+                    yield from _drain(pending, ordered=ordered)
+            while pending:
+                yield from _drain(pending, ordered=ordered)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _drain(pending: "deque[Future[TikaParsedItem]]", *, ordered: bool) -> Iterator[TikaParsedItem]:
+    """Wait for the next result(s) in `pending`, removing and yielding them."""
+    if ordered:
+        yield pending.popleft().result()
+        return
+
+    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+    for future in done:
+        pending.remove(future)
+        yield future.result()
+
+
+def _validate_language_options(*, top_k: int | None, sample_chars: int | None) -> None:
+    if top_k is not None and top_k < 1:
+        msg = f"top_k must be at least 1, got {top_k}"
+        raise TikaInputArgumentsError(msg)
+    if sample_chars is not None and sample_chars < 1:
+        msg = f"sample_chars must be at least 1, got {sample_chars}"
+        raise TikaInputArgumentsError(msg)
+
+
+def _sample_text(content: str, sample_chars: int | None) -> str:
+    """Take `sample_chars` characters from evenly spaced windows across `content`, or all of it if shorter."""
+    if sample_chars is None or len(content) <= sample_chars:
+        return content
+    windows = min(_LANGUAGE_SAMPLE_WINDOWS, sample_chars)
+    window = sample_chars // windows
+    stride = (len(content) - window) // max(windows - 1, 1)
+    return "\n".join(content[i * stride : i * stride + window] for i in range(windows))
@@ -2,18 +2,31 @@
 
 import contextlib
 import logging
+from collections.abc import Callable
 from enum import StrEnum, unique
+from functools import cache
+from mmap import mmap
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, BinaryIO, Literal, Self
+from typing import TYPE_CHECKING, Any, BinaryIO, Literal, Self, get_args
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 if TYPE_CHECKING:
+    from org.apache.tika.language.detect import LanguageResult
     from org.apache.tika.metadata import Metadata, Property
 
 
 TikaParseOutputFormat = Literal["txt", "xhtml"]
-TikaInputType = str | Path | bytes | BinaryIO
+TikaInputType = str | Path | bytes | bytearray | memoryview | mmap | BinaryIO
+TikaIOMode = Literal["stream", "mmap"]
+
+_WRITE_LIMIT_REACHED_KEY = "X-TIKA:write_limit_reached"
+"""Metadata key set to "true" when a parse was stopped early by its `max_chars` limit."""
+
+# result of language detection run during a parse, under the keys Tika's own language filters use
+_DETECTED_LANGUAGE_KEY = "X-TIKA:detected_language"
+_DETECTED_LANGUAGE_CONFIDENCE_KEY = "X-TIKA:detected_language_confidence"
+_DETECTED_LANGUAGE_RAW_SCORE_KEY = "X-TIKA:detected_language_confidence_raw"
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +48,14 @@ class TikaDetectLanguageResult(BaseModel):
     confidence: TikaLanguageConfidence
     raw_score: float
 
+    @classmethod
+    def _from_java_language_result(cls, result: "LanguageResult") -> Self:
+        return cls(
+            language=str(result.getLanguage()),
+            confidence=TikaLanguageConfidence(str(result.getConfidence().name())),
+            raw_score=float(result.getRawScore()),
+        )
+
 
 def _get_metadata_key_mappings() -> dict[str, list["Property | str"]]:
     from org.apache.tika.metadata import (
@@ -58,6 +79,7 @@ def _get_metadata_key_mappings() -> dict[str, list["Property | str"]]:
     return {
         # Processing Metadata
         "parse_time_millis": [TikaCoreProperties.PARSE_TIME_MILLIS],
+        "write_limit_reached": [_WRITE_LIMIT_REACHED_KEY],
         "encoding": [
             Metadata.CONTENT_ENCODING,
             TikaCoreProperties.DETECTED_ENCODING,
@@ -196,6 +218,12 @@ class TikaMetadata(BaseModel):
     # Processing Metadata
     encoding: str | None = Field(default=None, description="The detected encoding of the document")
     compression: str | None = Field(default=None, description="The compression type")
+    write_limit_reached: bool = Field(
+        default=False, description="Whether the content was truncated because the parse hit its `max_chars` limit"
+    )
+    detected_language: TikaDetectLanguageResult | None = Field(
+        default=None, description="The language of the document text, when parsed with `detect_language=True`"
+    )
 
     # Document Counts
     paragraph_count: int | None = Field(default=None, description="The number of paragraphs in the document")
@@ -310,57 +338,33 @@ class TikaMetadata(BaseModel):
     )
 
     @classmethod
-    def _from_java_metadata(cls, metadata: "Metadata") -> Self:  # noqa: C901, PLR0912
-        from org.apache.tika.metadata import Property
-
-        mappings: dict[str, list[Property | str]] = _get_metadata_key_mappings()
+    def _from_java_metadata(cls, metadata: "Metadata") -> Self:
         raw_metadata: dict[str, Any] = cls._metadata_to_dict(metadata)
         data: dict[str, Any] = {"raw_metadata": raw_metadata}
 
-        for field_name, tika_keys in mappings.items():
-            for key in tika_keys:
+        for field_name, lookup_keys, convert in _get_metadata_conversion_plan():
+            for lookup_key in lookup_keys:
+                if lookup_key not in raw_metadata:
+                    continue
                 try:
-                    # Handle Property objects vs string keys
-                    lookup_key = key.getName() if isinstance(key, Property) else key
-                    if lookup_key in raw_metadata:
-                        value = raw_metadata[lookup_key]
-
-                        # Handle specific type conversions
-                        if field_name in cls.__annotations__:
-                            field_type = cls.__annotations__[field_name]
-                            if "int" in str(field_type) and value:
-                                with contextlib.suppress(ValueError, TypeError):
-                                    value = int(value)
-                            elif "float" in str(field_type) and value:
-                                with contextlib.suppress(ValueError, TypeError):
-                                    value = float(value)
-                            elif "list[int]" in str(field_type) and value:
-                                with contextlib.suppress(ValueError, TypeError):
-                                    if isinstance(value, str):
-                                        value = [int(x) for x in value.split(",")]
-                                    elif isinstance(value, list | tuple):
-                                        value = [int(x) for x in value]
-
-                            elif "list[str]" in str(field_type) and value:
-                                with contextlib.suppress(ValueError, TypeError):
-                                    if isinstance(value, str):
-                                        value = value.split(",")
-                                        value = [x.strip() for x in value]
-                                    elif isinstance(value, list | tuple):
-                                        value = [str(x) for x in value]
-                            else:
-                                # fallback to string if unable to convert to a more specific type
-                                with contextlib.suppress(ValueError, TypeError):
-                                    value = str(value)
-
-                        if not value:
-                            logger.warning(f"Unable to decode value for {field_name}. Skipping.")
-
-                        data[field_name] = value or None
-                        break  # Use first matching value
+                    value = raw_metadata[lookup_key]
+                    if value:
+                        value = convert(value)
+                    if not value:
+                        logger.warning(f"Unable to decode value for {field_name}. Skipping.")
+                    data[field_name] = value or None
                 except Exception as e:  # noqa: BLE001
                     # don't let one field error stop the rest of the processing
                     logger.warning(f"Error processing field {field_name}: {e}")
+                break  # Use first matching value
+
+        if language := raw_metadata.get(_DETECTED_LANGUAGE_KEY):
+            with contextlib.suppress(ValueError, KeyError):
+                data["detected_language"] = TikaDetectLanguageResult(
+                    language=language,
+                    confidence=TikaLanguageConfidence(raw_metadata[_DETECTED_LANGUAGE_CONFIDENCE_KEY]),
+                    raw_score=float(raw_metadata[_DETECTED_LANGUAGE_RAW_SCORE_KEY]),
+                )
 
         return cls(**data)
 
@@ -369,11 +373,72 @@ class TikaMetadata(BaseModel):
         return {str(key): str(metadata.get(key)) for key in metadata.names()}
 
 
+def _convert_int(value: str) -> int | str:
+    with contextlib.suppress(ValueError, TypeError):
+        return int(value)
+    return value
+
+
+def _convert_int_or_int_list(value: str) -> list[int] | int | str:
+    with contextlib.suppress(ValueError, TypeError):
+        return int(value)
+    with contextlib.suppress(ValueError, TypeError):
+        return [int(x) for x in value.split(",")]
+    return value
+
+
+def _convert_float(value: str) -> float | str:
+    with contextlib.suppress(ValueError, TypeError):
+        return float(value)
+    return value
+
+
+def _convert_str_list(value: str) -> list[str]:
+    return [x.strip() for x in value.split(",")]
+
+
+def _select_converter(annotation: Any) -> Callable[[str], Any]:  # noqa: ANN401
+    """Pick the conversion for a raw metadata string from the declared type of the field it fills."""
+    field_types = set(get_args(annotation)) or {annotation}
+    if list[int] in field_types:
+        return _convert_int_or_int_list
+    if int in field_types:
+        return _convert_int
+    if float in field_types:
+        return _convert_float
+    if list[str] in field_types:
+        return _convert_str_list
+    return str
+
+
+@cache
+def _get_metadata_conversion_plan() -> tuple[tuple[str, tuple[str, ...], Callable[[str], Any]], ...]:
+    """Build, once per process, the steps that turn raw Tika metadata into `TikaMetadata` fields.
+
+    Each step is a field name, the raw metadata keys to take its value from in order of preference, and the
+    conversion for the field's type. Java Property names are resolved here so parsing never needs to cross into
+    the JVM for them again.
+    """
+    from org.apache.tika.metadata import Property
+
+    fields = {field.alias or name: field for name, field in TikaMetadata.model_fields.items()}
+    return tuple(
+        (
+            field_name,
+            tuple(str(key.getName()) if isinstance(key, Property) else key for key in tika_keys),
+            _select_converter(fields[field_name].annotation) if field_name in fields else str,
+        )
+        for field_name, tika_keys in _get_metadata_key_mappings().items()
+    )
+
+
 class TikaUnpackedItem(BaseModel):
     """Individual unpacked embedded document."""
 
     metadata: TikaMetadata = Field(description="The metadata of the unpacked document")
     file_path: Path = Field(description="The path to the unpacked file in the output directory")
+    bytes_copied: int = Field(default=0, description="The number of bytes written to the unpacked file")
+    copy_time_millis: float = Field(default=0.0, description="The time spent copying the unpacked file to disk")
 
 
 class TikaUnpackResult(BaseModel):
@@ -381,3 +446,126 @@ class TikaUnpackResult(BaseModel):
 
     root_metadata: TikaMetadata = Field(description="The metadata of the root input document")
     embedded_documents: list[TikaUnpackedItem] = Field(default_factory=list)
+
+
+class TikaParsedItem(BaseModel):
+    """Outcome of parsing one input of a batch."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    index: int = Field(description="The position of the input in the batch")
+    content: str | None = Field(default=None, description="The extracted content, or None if parsing failed")
+    metadata: TikaMetadata | None = Field(default=None, description="The document metadata, or None if parsing failed")
+    error: Exception | None = Field(default=None, description="The error raised while parsing this input, if any")
+
+    @property
+    def ok(self) -> bool:
+        """Whether the input was parsed successfully."""
+        return self.error is None
+
+
+class TikaCacheStats(BaseModel):
+    """Counters describing how well a cache is doing."""
+
+    hits: int = Field(default=0, description="The number of lookups answered from the cache")
+    misses: int = Field(default=0, description="The number of lookups that had to do the work")
+    entries: int = Field(default=0, description="The number of entries currently in the cache")
+    size_bytes: int = Field(default=0, description="The total size of the cached entries, for size-bounded caches")
+
+    @property
+    def hit_rate(self) -> float:
+        """The share of lookups answered from the cache, or 0.0 before the first lookup."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+TikaGarbageCollector = Literal["G1", "Parallel", "Serial", "Z", "Shenandoah"]
+
+_JVM_SIZE_PATTERN = r"^\d+[kKmMgGtT]?$"
+
+
+class TikaJvmOptions(BaseModel):
+    """Typed options for the JVM that runs Tika.
+
+    JVM options only take effect when the JVM starts, which happens once per process: pass them to the first
+    `Tika(...)` created, or set them beforehand with `set_jvm_options`. `TIKA_JVM_ARGS` is still honored and is
+    applied after these options, so its flags win.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    heap_min: str | None = Field(
+        default=None, pattern=_JVM_SIZE_PATTERN, description='The initial heap size, like "512m" (-Xms)'
+    )
+    heap_max: str | None = Field(
+        default=None,
+        pattern=r"^(\d+[kKmMgGtT]?|auto)$",
+        description='The maximum heap size, like "4g" (-Xmx), or "auto" to size it from the container memory limit',
+    )
+    heap_fraction: float = Field(
+        default=0.5,
+        gt=0,
+        le=1,
+        description='The share of the container memory limit, or of physical memory, the heap may use with "auto"',
+    )
+    gc: TikaGarbageCollector | None = Field(default=None, description="The garbage collector to use")
+    thread_stack_size: str | None = Field(
+        default=None, pattern=_JVM_SIZE_PATTERN, description='The stack size of each Java thread, like "1m" (-Xss)'
+    )
+    system_properties: dict[str, str] = Field(
+        default_factory=dict, description="Java system properties to set (-Dkey=value)"
+    )
+    extra_args: list[str] = Field(default_factory=list, description="Additional JVM arguments, passed as given")
+
+
+TikaWarmUpFamily = Literal["txt", "html", "xml", "json", "csv", "rtf", "eml", "pdf", "docx", "xlsx", "xls", "msg"]
+
+
+class TikaWarmUpTiming(BaseModel):
+    """Timings of warming up the parser for one family of documents."""
+
+    family: TikaWarmUpFamily = Field(description="The document family that was warmed up")
+    mime_type: str | None = Field(default=None, description="The MIME type Tika detected for the family's sample")
+    iterations: int = Field(description="The number of times the sample was parsed")
+    first_seconds: float = Field(description="The time taken by the first, coldest parse")
+    last_seconds: float = Field(description="The time taken by the last parse, the closest to steady state")
+    total_seconds: float = Field(description="The time taken by all parses together")
+    skipped: str | None = Field(
+        default=None,
+        description="Why the family was skipped, such as its sample needing Java classes a trimmed Tika jar leaves out."
+        " Skipped families report no iterations and zero times",
+    )
+
+
+class TesseractOptions(BaseModel):
+    """Per-call OCR settings for `parse(ocr=...)`, applied through Tika's `TesseractOCRConfig` and `PDFParserConfig`.
+
+    Settings left as None keep the value from the Tesseract and PDF parser configuration in effect.
+    """
+
+    model_config = ConfigDict(frozen=True)
+
+    language: str | None = Field(
+        default=None,
+        pattern=r"^[A-Za-z_]+(\+[A-Za-z_]+)*$",
+        description='Tesseract language packs to use, joined with "+", like "eng+deu"',
+    )
+    timeout_seconds: int | None = Field(default=None, gt=0, description="Maximum time Tesseract may spend per image")
+    dpi: int | None = Field(
+        default=None, ge=72, le=1200, description="Resolution PDF pages are rendered at before they are OCRed"
+    )
+    resize: int | None = Field(
+        default=None,
+        ge=100,
+        le=900,
+        multiple_of=100,
+        description="Percentage images are scaled by before OCR, with Tesseract's ImageMagick preprocessing",
+    )
+    skip_pages_with_text: bool = Field(
+        default=True,
+        description="Only OCR PDF pages without a usable text layer, instead of OCRing every page on top of its text",
+    )
+
+
+TikaOcrStrategy = Literal["off", "auto", "only"]
+TikaOcrPolicy = TikaOcrStrategy | TesseractOptions
@@ -4,8 +4,6 @@ from collections.abc import Callable
 from functools import wraps
 from pathlib import Path
 
-from jpype.types import JException
-
 
 class TikaError(Exception):
     """Base class for all exceptions raised by Tikara."""
@@ -61,6 +59,15 @@ class TikaOutputModeError(TikaInputArgumentsError):
         return cls(f"Invalid output mode: {output_mode}")
 
 
+class TikaTimeoutError(TikaError):
+    """Raised when an operation is stopped because it ran longer than its timeout."""
+
+    @classmethod
+    def _from_timeout(cls, timeout: float) -> "TikaTimeoutError":
+        """Create a new instance from the timeout that expired."""
+        return cls(f"Operation timed out after {timeout} seconds")
+
+
 class TikaInitializationError(TikaError):
     """Raised when the Tika server fails to initialize."""
 
@@ -83,18 +90,20 @@ def wrap_exceptions[**P, R](func: Callable[P, R]) -> Callable[P, R]:
         """Invoke the wrapped function, converting Java exceptions to TikaError."""
         try:
             return func(*args, **kwargs)
-        except JException as e:
-            from java.nio.file import NoSuchFileException, NotDirectoryException
-
-            if isinstance(e, NoSuchFileException | NotDirectoryException):
-                raise TikaInputFileNotFoundError from e
-
-            raise TikaError(str(e)) from e
         except TikaError:
             raise
         except FileNotFoundError as e:
             raise TikaInputFileNotFoundError(str(e)) from e
         except Exception as e:
+            # jpype is only imported once an error needs it, so importing tikara stays cheap
+            from jpype.types import JException
+
+            if isinstance(e, JException):
+                from java.nio.file import NoSuchFileException, NotDirectoryException
+
+                if isinstance(e, NoSuchFileException | NotDirectoryException):
+                    raise TikaInputFileNotFoundError from e
+
             raise TikaError(str(e)) from e
 
     return wrapper
@@ -0,0 +1,476 @@
+"""Multi-process parsing with a pool of warm worker JVMs."""
+
+import multiprocessing
+import os
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import suppress
+from multiprocessing.connection import Connection, wait
+from multiprocessing.process import BaseProcess
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Self
+
+from pydantic import BaseModel
+
+from tikara.data_types import (
+    TikaInputType,
+    TikaJvmOptions,
+    TikaOcrPolicy,
+    TikaParsedItem,
+    TikaParseOutputFormat,
+    TikaWarmUpFamily,
+)
+from tikara.error_handling import TikaError, TikaInitializationError, TikaInputArgumentsError, TikaInputTypeError
+from tikara.util.java import _is_binary_io, _is_buffer
+
+if TYPE_CHECKING:
+    from org.apache.tika.detect import Detector
+    from org.apache.tika.parser import Parser
+
+# the JVM does not survive fork, so workers are always spawned
+_MP_CONTEXT = multiprocessing.get_context("spawn")
+
+
+class _SharedBufferRef(BaseModel):
+    """Points a worker at an input the parent copied into shared memory."""
+
+    name: str
+    size: int
+
+
+class _ParseTask(BaseModel):
+    index: int
+    source: str | _SharedBufferRef
+    output_format: TikaParseOutputFormat
+    max_chars: int | None = None
+    ocr: TikaOcrPolicy | None = None
+
+
+class _ParseResult(BaseModel):
+    item: TikaParsedItem
+    retiring: bool = False
+
+
+class _WorkerOptions(BaseModel):
+    tika_kwargs: dict[str, Any]
+    max_tasks: int | None
+    max_heap_growth: int | None
+    warm_up: list[TikaWarmUpFamily] | None = None
+
+
+def _used_heap() -> int:
+    from java.lang import Runtime
+
+    runtime = Runtime.getRuntime()
+    return int(runtime.totalMemory() - runtime.freeMemory())
+
+
+def _parse_task(tika: Any, task: _ParseTask) -> TikaParsedItem:  # noqa: ANN401
+    shared: SharedMemory | None = None
+    try:
+        if isinstance(task.source, _SharedBufferRef):
+            shared = SharedMemory(name=task.source.name)
+            view = shared.buf[: task.source.size]
+            try:
+                content, metadata = tika.parse(
+                    view, output_format=task.output_format, max_chars=task.max_chars, ocr=task.ocr
+                )
+            finally:
+                view.release()
+        else:
+            content, metadata = tika.parse(
+                task.source, output_format=task.output_format, max_chars=task.max_chars, ocr=task.ocr
+            )
+    except Exception as e:  # noqa: BLE001
+        # Java causes cannot cross the process boundary, so only the Tikara error is sent back
+        error = e if isinstance(e, TikaError) else TikaError(str(e))
+        return TikaParsedItem(index=task.index, error=error)
+    finally:
+        if shared is not None:
+            shared.close()
+    return TikaParsedItem(index=task.index, content=content, metadata=metadata)
+
+
+def _share_input(obj: TikaInputType) -> tuple[SharedMemory, int]:
+    """Copy an in-memory input or binary stream once into a new shared memory segment.
+
+    Seekable streams are read straight into the segment. Other streams are read whole first, since their size is
+    only known once they end.
+
+    Args:
+        obj: The input, other than a path.
+
+    Returns:
+        tuple[SharedMemory, int]: The segment, which the caller must unlink, and the size of the input in it.
+
+    Raises:
+        TikaInputTypeError: If the input is neither a buffer nor a binary stream.
+    """
+    if _is_binary_io(obj) and obj.seekable():
+        start = obj.tell()
+        size = obj.seek(0, os.SEEK_END) - start
+        obj.seek(start)
+        # a zero-sized segment cannot be created
+        shared = SharedMemory(create=True, size=max(size, 1))
+        try:
+            filled = 0
+            with shared.buf[:size] as view:
+                while filled < size and (count := obj.readinto(view[filled:])):
+                    filled += count
+        except BaseException:
+            shared.close()
+            shared.unlink()
+            raise
+        return shared, filled
+
+    if _is_binary_io(obj):
+        obj = obj.read()
+    if not _is_buffer(obj):
+        raise TikaInputTypeError._from_input_type(type(obj))
+    with memoryview(obj).cast("B") as view:
+        shared = SharedMemory(create=True, size=max(view.nbytes, 1))
+        shared.buf[: view.nbytes] = view
+        return shared, view.nbytes
+
+
+def _worker_main(conn: Connection, options: _WorkerOptions) -> None:
+    """Entry point of a worker process: start a warm Tika, then parse tasks until told to stop or retiring."""
+    from tikara.core import Tika
+
+    try:
+        tika = Tika(lazy_load=False, **options.tika_kwargs)
+        if options.warm_up is not None:
+            tika.warm_up(options.warm_up or None)
+    except Exception as e:  # noqa: BLE001
+        conn.send(TikaInitializationError(str(e)))
+        return
+    baseline_heap = _used_heap()
+    conn.send(None)
+
+    tasks_done = 0
+    while (task := conn.recv()) is not None:
+        item = _parse_task(tika, task)
+        tasks_done += 1
+        retiring = (options.max_tasks is not None and tasks_done >= options.max_tasks) or (
+            options.max_heap_growth is not None and _used_heap() - baseline_heap > options.max_heap_growth
+        )
+        conn.send(_ParseResult(item=item, retiring=retiring))
+        if retiring:
+            return
+
+
+class _Worker:
+    """Parent-side handle of one worker process and the task it is running."""
+
+    def __init__(self, options: _WorkerOptions) -> None:
+        self.conn, child_conn = _MP_CONTEXT.Pipe()
+        self.process: BaseProcess = _MP_CONTEXT.Process(
+            target=_worker_main, args=(child_conn, options), name="tika-worker", daemon=True
+        )
+        self.process.start()
+        child_conn.close()
+        self.ready = False
+        self.task: _ParseTask | None = None
+        self.shared: SharedMemory | None = None
+
+    def wait_ready(self) -> None:
+        """Block until the worker's JVM is warm.
+
+        Raises:
+            TikaInitializationError: If the worker failed to start Tika.
+        """
+        if self.ready:
+            return
+        try:
+            error = self.conn.recv()
+        except EOFError as e:
+            msg = f"Tika worker process exited during startup (exit code {self.process.exitcode})"
+            raise TikaInitializationError(msg) from e
+        if error is not None:
+            raise error
+        self.ready = True
+
+    def poll_ready(self) -> bool:
+        """Check, without blocking, whether the worker's JVM is warm."""
+        if not self.ready and self.conn.poll():
+            self.wait_ready()
+        return self.ready
+
+    def submit(self, task: _ParseTask, shared: SharedMemory | None) -> None:
+        self.task = task
+        self.shared = shared
+        self.conn.send(task)
+
+    def finish_task(self) -> None:
+        """Forget the current task, releasing the shared memory holding its input."""
+        self.task = None
+        if self.shared is not None:
+            self.shared.close()
+            self.shared.unlink()
+            self.shared = None
+
+    def stop(self, timeout: float | None = 5) -> None:
+        self.finish_task()
+        if self.process.is_alive():
+            with suppress(OSError):
+                self.conn.send(None)
+            self.process.join(timeout)
+            if self.process.is_alive():
+                self.process.terminate()
+                self.process.join()
+        self.conn.close()
+
+
+class TikaProcessPool:
+    """A pool of worker processes, each running its own warm JVM and `Tika` instance.
+
+    Threads (see `Tika.parse_many`) share one interpreter, so metadata conversion, validation and string handling
+    stay bound to a single core. A process pool scales those parts too, at the cost of one JVM per worker.
+
+    Inputs are sent to workers as paths, or copied once into shared memory for in-memory inputs. Results are
+    streamed back as each document finishes. Workers are replaced after a set number of documents or once their
+    Java heap has grown by a set amount, which bounds the impact of parsers that leak.
+
+    Examples:
+        ::
+
+            with TikaProcessPool(workers=16, max_tasks_per_worker=1000) as pool:
+                for item in pool.parse_many(Path("docs").rglob("*.pdf"), output_format="txt"):
+                    if item.ok:
+                        index_document(item.content, item.metadata)
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        workers: int | None = None,
+        *,
+        max_tasks_per_worker: int | None = None,
+        max_heap_growth: int | None = None,
+        custom_parsers: Callable[[], list["Parser"]] | None = None,
+        custom_detectors: Callable[[], list["Detector"]] | None = None,
+        custom_mime_types: list[str] | None = None,
+        extra_jars: list[Path] | None = None,
+        tika_jar_override: Path | None = None,
+        jvm_options: TikaJvmOptions | None = None,
+        warm_up: bool | list[TikaWarmUpFamily] = False,
+        parsers: list[str] | None = None,
+        exclude_parsers: list[str] | None = None,
+        config: Path | str | None = None,
+    ) -> None:
+        """Create a pool. Worker processes are started on first use, or when entering the context manager.
+
+        Args:
+            workers: Number of worker processes. Defaults to the number of CPUs.
+            max_tasks_per_worker: Replace a worker after it has parsed this many documents. Defaults to never.
+            max_heap_growth: Replace a worker once its used Java heap has grown by this many bytes since it
+                started. Defaults to never.
+            custom_parsers: Callable returning custom parsers, run in every worker. Must be picklable, like a
+                module-level function; Java objects cannot be sent to other processes.
+            custom_detectors: Callable returning custom detectors, run in every worker. Must be picklable.
+            custom_mime_types: Additional MIME types to register in every worker.
+            extra_jars: Additional JAR files for the workers' classpath.
+            tika_jar_override: Path to custom Tika JAR file to use instead of bundled version.
+            jvm_options: Options for every worker's JVM. With `heap_max="auto"`, `heap_fraction` is divided between
+                the workers, so together they stay within the container memory limit.
+            warm_up: Have each worker, including replacements for retired ones, run `Tika.warm_up` before it takes
+                its first task: True for every document family, or a list of families. Defaults to no warm-up.
+            parsers: Restrict every worker's default parser to these parsers or MIME types. See `Tika`.
+            exclude_parsers: Parsers or MIME types to leave out of every worker's default parser. See `Tika`.
+            config: Path to a tika-config.xml every worker builds its parser and detector from. See `Tika`.
+
+        Raises:
+            TikaInputArgumentsError: If a limit is not positive.
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        for name, value in (
+            ("workers", workers),
+            ("max_tasks_per_worker", max_tasks_per_worker),
+            ("max_heap_growth", max_heap_growth),
+        ):
+            if value is not None and value < 1:
+                msg = f"{name} must be at least 1, got {value}"
+                raise TikaInputArgumentsError(msg)
+        self._size = workers
+
+        if jvm_options is not None and jvm_options.heap_max == "auto":
+            # the workers share the container, so they split its heap budget
+            jvm_options = jvm_options.model_copy(update={"heap_fraction": jvm_options.heap_fraction / self._size})
+
+        self._options = _WorkerOptions(
+            tika_kwargs={
+                "custom_parsers": custom_parsers,
+                "custom_detectors": custom_detectors,
+                "custom_mime_types": custom_mime_types,
+                "extra_jars": extra_jars,
+                "tika_jar_override": tika_jar_override,
+                "jvm_options": jvm_options,
+                "parsers": parsers,
+                "exclude_parsers": exclude_parsers,
+                "config": config,
+            },
+            max_tasks=max_tasks_per_worker,
+            max_heap_growth=max_heap_growth,
+            # an empty list tells the worker to warm up every family
+            warm_up=([] if warm_up is True else list(warm_up)) if warm_up else None,
+        )
+        self._workers: list[_Worker] = []
+
+    def start(self) -> None:
+        """Start any missing worker processes and wait until their JVMs are warm.
+
+        Raises:
+            TikaInitializationError: If a worker fails to start Tika.
+        """
+        new_workers = [_Worker(self._options) for _ in range(self._size - len(self._workers))]
+        self._workers.extend(new_workers)
+        try:
+            for worker in new_workers:
+                worker.wait_ready()
+        except BaseException:
+            self.close()
+            raise
+
+    def close(self) -> None:
+        """Stop all worker processes."""
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            worker.stop()
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(self, exc_type: object, exc_value: object, traceback: object) -> None:
+        self.close()
+
+    def parse_many(
+        self,
+        inputs: Iterable[TikaInputType],
+        *,
+        ordered: bool = False,
+        output_format: TikaParseOutputFormat = "xhtml",
+        max_chars: int | None = None,
+        ocr: TikaOcrPolicy | None = None,
+    ) -> Iterator[TikaParsedItem]:
+        """Parse many documents across the worker processes, returning content as strings.
+
+        Args:
+            inputs: Documents to parse. Paths are opened by the workers. bytes, bytearray, memoryview, mmap and
+                binary streams are copied once into shared memory, seekable streams straight from their reads.
+            ordered: Whether to yield results in input order. By default results are yielded as they complete.
+                When ordered, no new document is started while more than twice as many results as there are
+                workers are waiting on an earlier, slower document.
+            output_format: "txt" for plain text or "xhtml" for structured format (default)
+            max_chars: Maximum number of characters of text to extract per document. See `Tika.parse`.
+            ocr: OCR policy of every parse. See `Tika.parse`.
+
+        Yields:
+            TikaParsedItem: One result per input, with the input's `index`. Failures, including a worker process
+                dying mid-document, are returned in the item's `error` field rather than raised.
+        """
+        self.start()
+        if not ordered:
+            yield from self._run(enumerate(inputs), output_format, max_chars, ocr)
+            return
+
+        reorder: dict[int, TikaParsedItem] = {}
+        # a slow document holds back every result after it, so no new work is taken while too many are waiting
+        max_held = 2 * self._size
+        next_index = 0
+        for item in self._run(enumerate(inputs), output_format, max_chars, ocr, hold=lambda: len(reorder) > max_held):
+            reorder[item.index] = item
+            while next_index in reorder:
+                yield reorder.pop(next_index)
+                next_index += 1
+
+    def _run(
+        self,
+        inputs: Iterator[tuple[int, TikaInputType]],
+        output_format: TikaParseOutputFormat,
+        max_chars: int | None,
+        ocr: TikaOcrPolicy | None,
+        hold: Callable[[], bool] | None = None,
+    ) -> Iterator[TikaParsedItem]:
+        """Run the inputs on the workers, yielding results as they complete.
+
+        Args:
+            inputs: The inputs, with their indexes.
+            output_format: Output format of every parse.
+            max_chars: Character limit of every parse.
+            ocr: OCR policy of every parse.
+            hold: Called before each round of submissions; while it returns True, no new input is submitted and
+                only the tasks in flight are collected.
+        """
+        exhausted = False
+        try:
+            while True:
+                # holding with nothing in flight would never be released
+                held = hold is not None and hold() and any(worker.task is not None for worker in self._workers)
+                for worker in self._workers:
+                    if exhausted or held or not worker.poll_ready() or worker.task is not None:
+                        continue
+                    if (next_input := next(inputs, None)) is None:
+                        exhausted = True
+                        break
+                    index, obj = next_input
+                    try:
+                        self._submit(worker, index, obj, output_format=output_format, max_chars=max_chars, ocr=ocr)
+                    except Exception as e:  # noqa: BLE001
+                        yield TikaParsedItem(index=index, error=e if isinstance(e, TikaError) else TikaError(str(e)))
+
+                busy = [worker for worker in self._workers if worker.task is not None]
+                warming = [worker for worker in self._workers if not worker.ready]
+                if not busy and (exhausted or not warming):
+                    return
+                yield from self._collect(busy, warming)
+        finally:
+            # results of abandoned tasks must not leak into the next batch, so their workers are replaced
+            for worker in [worker for worker in self._workers if worker.task is not None]:
+                self._workers.remove(worker)
+                worker.stop(timeout=0)
+
+    @staticmethod
+    def _submit(  # noqa: PLR0913
+        worker: _Worker,
+        index: int,
+        obj: TikaInputType,
+        *,
+        output_format: TikaParseOutputFormat,
+        max_chars: int | None,
+        ocr: TikaOcrPolicy | None,
+    ) -> None:
+        shared: SharedMemory | None = None
+        source: str | _SharedBufferRef
+        if isinstance(obj, str | Path):
+            source = str(Path(obj).absolute())
+        else:
+            shared, size = _share_input(obj)
+            source = _SharedBufferRef(name=shared.name, size=size)
+        task = _ParseTask(index=index, source=source, output_format=output_format, max_chars=max_chars, ocr=ocr)
+        worker.submit(task, shared)
+
+    def _collect(self, busy: list[_Worker], warming: list[_Worker]) -> Iterator[TikaParsedItem]:
+        """Wait for a busy worker to finish or a new one to warm up, replacing workers that retired or died."""
+        by_handle: dict[Any, _Worker] = {worker.conn: worker for worker in warming}
+        for worker in busy:
+            by_handle[worker.conn] = worker
+            by_handle[worker.process.sentinel] = worker
+
+        finished: set[_Worker] = {by_handle[handle] for handle in wait(list(by_handle))}
+        for worker in finished:
+            task = worker.task
+            if task is None:
+                # warmed up; picked up on the next round of submissions
+                continue
+            try:
+                result: _ParseResult = worker.conn.recv()
+            except (EOFError, OSError):
+                msg = f"Tika worker process exited unexpectedly (exit code {worker.process.exitcode})"
+                result = _ParseResult(item=TikaParsedItem(index=task.index, error=TikaError(msg)), retiring=True)
+            worker.finish_task()
+            if result.retiring:
+                # the replacement warms up in the background while the other workers carry on
+                worker.stop()
+                self._workers[self._workers.index(worker)] = _Worker(self._options)
+            yield result.item
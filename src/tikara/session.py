@@ -0,0 +1,167 @@
+"""Reusable parse sessions that keep per-call setup to a minimum. Created with `Tika.session()`."""
+
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO, overload
+
+from tikara.data_types import TikaInputType, TikaIOMode, TikaMetadata, TikaOcrPolicy, TikaParseOutputFormat
+from tikara.error_handling import TikaInputArgumentsError, wrap_exceptions
+from tikara.util.tika import _parse, _ParseTemplate
+
+if TYPE_CHECKING:
+    from org.apache.tika.language.detect import LanguageDetector
+    from org.apache.tika.parser import Parser
+
+
+class TikaParseSession:
+    """A parser and parse context template prepared once and reused for every `parse` call.
+
+    The session holds the document-independent part of every ParseContext: the parser, set for recursion into
+    embedded documents, and the Tesseract and PDF parser configs of the session's OCR policy. Each call copies
+    those entries into a fresh context and only creates the per-document objects (metadata, input stream and
+    handler). A call that passes its own `ocr` builds a one-off template instead. The saving over `Tika.parse` is
+    small, since the parse toolkit behind every parse context is already shared by the whole process; it mostly
+    spares building the OCR configs on each call.
+
+    Session parses bypass the owning `Tika`'s `parse_cache`: every call runs the parser, and nothing is stored.
+    Use `Tika.parse` for inputs that may repeat.
+
+    Sessions hold no per-document state and can be shared between threads.
+
+    Examples:
+        ::
+
+            tika = Tika()
+            session = tika.session(output_format="txt", ocr="off")
+            for path in Path("notes").glob("*.txt"):
+                content, metadata = session.parse(path)
+    """
+
+    def __init__(
+        self,
+        parser: "Parser",
+        *,
+        output_format: TikaParseOutputFormat = "xhtml",
+        io_mode: TikaIOMode = "stream",
+        ocr: TikaOcrPolicy | None = None,
+        language_detector: "Callable[[], AbstractContextManager[LanguageDetector]] | None" = None,
+    ) -> None:
+        """Create a session. Use `Tika.session()` rather than calling this directly.
+
+        Args:
+            parser: The fully configured parser to use for every call.
+            output_format: Default output format of `parse`.
+            io_mode: Default io_mode of `parse`.
+            ocr: Default OCR policy of `parse`. Its configs are built once, here.
+            language_detector: Checks out a language detector for `parse(detect_language=True)`. Without one,
+                language detection is unavailable.
+        """
+        self._template = _ParseTemplate(parser, ocr)
+        self._language_detector = language_detector
+        self.output_format: TikaParseOutputFormat = output_format
+        self.io_mode: TikaIOMode = io_mode
+
+    @property
+    def ocr(self) -> TikaOcrPolicy | None:
+        """Default OCR policy of `parse`."""
+        return self._template.ocr
+
+    @overload
+    def parse(
+        self,
+        obj: TikaInputType,
+        *,
+        output_format: TikaParseOutputFormat | None = None,
+        input_file_name: str | Path | None = None,
+        content_type: str | None = None,
+        io_mode: TikaIOMode | None = None,
+        max_chars: int | None = None,
+        timeout: float | None = None,
+        detect_language: bool = False,
+        ocr: TikaOcrPolicy | None = None,
+    ) -> tuple[str, TikaMetadata]: ...
+
+    @overload
+    def parse(
+        self,
+        obj: TikaInputType,
+        *,
+        output_file: Path | str,
+        output_format: TikaParseOutputFormat | None = None,
+        input_file_name: str | Path | None = None,
+        content_type: str | None = None,
+        io_mode: TikaIOMode | None = None,
+        max_chars: int | None = None,
+        timeout: float | None = None,
+        detect_language: bool = False,
+        ocr: TikaOcrPolicy | None = None,
+    ) -> tuple[Path, TikaMetadata]: ...
+
+    @overload
+    def parse(
+        self,
+        obj: TikaInputType,
+        *,
+        output_stream: bool,
+        output_format: TikaParseOutputFormat | None = None,
+        input_file_name: str | Path | None = None,
+        content_type: str | None = None,
+        io_mode: TikaIOMode | None = None,
+        max_chars: int | None = None,
+        timeout: float | None = None,
+        detect_language: bool = False,
+        ocr: TikaOcrPolicy | None = None,
+    ) -> tuple[BinaryIO, TikaMetadata]: ...
+
+    @wrap_exceptions
+    def parse(  # noqa: PLR0913
+        self,
+        obj: TikaInputType,
+        *,
+        output_stream: bool = False,
+        output_format: TikaParseOutputFormat | None = None,
+        output_file: Path | str | None = None,
+        input_file_name: str | Path | None = None,
+        content_type: str | None = None,
+        io_mode: TikaIOMode | None = None,
+        max_chars: int | None = None,
+        timeout: float | None = None,
+        detect_language: bool = False,
+        ocr: TikaOcrPolicy | None = None,
+    ) -> tuple[str | Path | BinaryIO, TikaMetadata]:
+        """Extract text content and metadata from a document, with the same semantics as `Tika.parse`.
+
+        Args:
+            obj: Input to parse: a path, bytes-like object or binary stream.
+            output_stream: Whether to return content as a stream instead of string
+            output_format: Format for extracted text. Defaults to the session's format.
+            output_file: Save content to this path instead of returning it
+            input_file_name: Original filename if obj is bytes/stream
+            content_type: MIME type of input if known
+            io_mode: How to read file-backed inputs. Defaults to the session's mode.
+            max_chars: Stop parsing once this many characters of text have been extracted. See `Tika.parse`.
+            timeout: Maximum number of seconds the parse may take. See `Tika.parse`.
+            detect_language: Detect the document language while parsing. See `Tika.parse`.
+            ocr: OCR policy of this parse. Defaults to the session's policy. See `Tika.parse`.
+
+        Returns:
+            Tuple of the content (string, output path or stream) and the document metadata.
+        """
+        if detect_language and self._language_detector is None:
+            msg = "detect_language requires a session created with Tika.session()"
+            raise TikaInputArgumentsError(msg)
+        template = self._template if ocr is None else _ParseTemplate(self._template.parser, ocr)
+        return _parse(
+            template,
+            obj,
+            output_stream=output_stream,
+            output_format=output_format or self.output_format,
+            output_file=output_file,
+            input_file_name=input_file_name,
+            content_type=content_type,
+            io_mode=io_mode or self.io_mode,
+            max_chars=max_chars,
+            timeout=timeout,
+            language_detector=self._language_detector if detect_language else None,
+        )
@@ -1,27 +1,55 @@
 """Java and JVM utilities mostly focused on I/O operations."""
 
+import hashlib
+import logging
 import os
-from collections.abc import Generator, Iterable
-from concurrent.futures import ThreadPoolExecutor
-from contextlib import contextmanager
-from io import BufferedIOBase, UnsupportedOperation
+import select
+import shlex
+import subprocess
+import sys
+import threading
+import time
+from collections.abc import Callable, Generator, Iterable, Iterator
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextlib import ExitStack, contextmanager, suppress
+from functools import cache
+from io import BufferedIOBase, BufferedReader, RawIOBase, UnsupportedOperation
+from mmap import ACCESS_READ, mmap
 from pathlib import Path
+from stat import S_ISREG
 from typing import TYPE_CHECKING, Any, BinaryIO, Self, TypeGuard, cast, override
 
 import jpype
 import jpype.imports
-from jpype.types import JArray, JChar, JString
+from jpype import JImplements, JOverride
+from jpype.nio import convertToDirectBuffer
+from jpype.types import JArray, JByte, JString
 
-from tikara.error_handling import TikaInitializationError, wrap_exceptions
+from tikara.error_handling import (
+    TikaInitializationError,
+    TikaInputArgumentsError,
+    TikaTimeoutError,
+    wrap_exceptions,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Buffer
+
     from java.io import (
         ByteArrayOutputStream,
+        Closeable,
         FileOutputStream,
         InputStream,
-        PipedInputStream,
+        OutputStream,
         Reader,
     )
+    from java.lang import Thread as JThread
+    from java.nio import ByteBuffer
+
+    from tikara.data_types import TikaJvmOptions
+
+logger = logging.getLogger(__name__)
 
 #
 # JVM utilities
@@ -54,16 +82,8 @@ def get_jars() -> list[Path]:
     return [Path(tikara_path, f"jars/tika-{package}-{TIKA_VERSION}.jar") for package in packages]
 
 
-@wrap_exceptions
-def initialize_jvm(tika_jar_override: Path | None = None, extra_jars: list[Path] | None = None) -> None:
-    """
-    Initialize the JVM.
-
-    Tries to start the JVM with the Tika JAR file(s) in the classpath.
-    If the JVM is already started, checks if the Tika JAR file(s) are in the classpath.
-    """
-    custom_jvm_args = os.environ.get("TIKA_JVM_ARGS", "")
-
+def _build_classpath(tika_jar_override: Path | None = None, extra_jars: list[Path] | None = None) -> list[Path]:
+    """Resolve the JVM classpath: the bundled or overridden Tika JAR followed by any extra JARs."""
     classpath: list[Path] = get_jars()
     if tika_jar_override:
         if not tika_jar_override.exists():
@@ -76,11 +96,57 @@ def initialize_jvm(tika_jar_override: Path | None = None, extra_jars: list[Path]
                 msg = f"Extra JAR file not found at: {jar}"
                 raise TikaInitializationError from FileNotFoundError(msg)
             classpath.append(jar)
+    return classpath
+
+
+_jvm_options: "TikaJvmOptions | None" = None
+"""Process-wide JVM options set with `set_jvm_options`, used when the JVM starts."""
+
+
+def set_jvm_options(options: "TikaJvmOptions | None") -> None:
+    """Set the JVM options used when the JVM starts, for every `Tika` that does not pass its own.
+
+    The JVM starts once per process, with the first `Tika` created, so call this before then. Later calls only take
+    effect in processes that have not started their JVM yet.
+
+    Args:
+        options: The options to use, or None to go back to the JVM defaults.
+    """
+    global _jvm_options  # noqa: PLW0603
+    _jvm_options = options
+
+
+@wrap_exceptions
+def initialize_jvm(
+    tika_jar_override: Path | None = None,
+    extra_jars: list[Path] | None = None,
+    jvm_options: "TikaJvmOptions | None" = None,
+) -> None:
+    """
+    Initialize the JVM.
+
+    Tries to start the JVM with the Tika JAR file(s) in the classpath.
+    If the JVM is already started, checks if the Tika JAR file(s) are in the classpath.
+    Uses the class-data-sharing archive for this classpath if one exists, see `_cds_jvm_args`.
+    The JVM is started with `jvm_options`, else the options from `set_jvm_options`, followed by the arguments in
+    the `TIKA_JVM_ARGS` environment variable, split like a shell command line.
+    """
+    custom_jvm_args = shlex.split(os.environ.get("TIKA_JVM_ARGS", ""))
+
+    classpath = _build_classpath(tika_jar_override, extra_jars)
 
     if not jpype.isJVMStarted():
-        jpype.startJVM(custom_jvm_args, classpath=classpath)
+        jpype.startJVM(
+            *_jvm_options_args(jvm_options or _jvm_options),
+            *custom_jvm_args,
+            *_cds_jvm_args(classpath),
+            classpath=classpath,
+        )
         return
 
+    if jvm_options is not None:
+        logger.warning("The JVM is already running, so jvm_options are ignored. Pass them to the first Tika created.")
+
     existing_classpath = str(jpype.java.lang.System.getProperty("java.class.path"))
 
     if "tika" not in existing_classpath.casefold():
@@ -88,78 +154,382 @@ def initialize_jvm(tika_jar_override: Path | None = None, extra_jars: list[Path]
         raise TikaInitializationError from RuntimeError(msg)
 
 
+_GC_FLAGS: dict[str, str] = {
+    "G1": "-XX:+UseG1GC",
+    "Parallel": "-XX:+UseParallelGC",
+    "Serial": "-XX:+UseSerialGC",
+    "Z": "-XX:+UseZGC",
+    "Shenandoah": "-XX:+UseShenandoahGC",
+}
+
+_CGROUP_MEMORY_LIMIT_FILES = (
+    Path("/sys/fs/cgroup/memory.max"),  # cgroup v2
+    Path("/sys/fs/cgroup/memory/memory.limit_in_bytes"),  # cgroup v1
+)
+
+_NO_CGROUP_LIMIT = 1 << 60
+"""Limits above this are cgroup v1's way of saying "unlimited"."""
+
+
+def _container_memory_limit() -> int | None:
+    """The memory limit of the container this process runs in, in bytes, or None if there is none."""
+    for limit_file in _CGROUP_MEMORY_LIMIT_FILES:
+        try:
+            value = limit_file.read_text().strip()
+        except OSError:
+            continue
+        if value.isdigit() and int(value) < _NO_CGROUP_LIMIT:
+            return int(value)
+        return None  # "max", or v1's huge sentinel
+    return None
+
+
+def _jvm_options_args(options: "TikaJvmOptions | None") -> list[str]:
+    """Translate `TikaJvmOptions` into JVM command-line arguments."""
+    if options is None:
+        return []
+
+    args: list[str] = []
+    if options.heap_min:
+        args.append(f"-Xms{options.heap_min}")
+    if options.heap_max == "auto":
+        if (limit := _container_memory_limit()) is not None:
+            args.append(f"-Xmx{int(limit * options.heap_fraction) // (1024 * 1024)}m")
+        else:
+            # no container limit, so let the JVM take its share of physical memory
+            args.append(f"-XX:MaxRAMPercentage={options.heap_fraction * 100:g}")
+    elif options.heap_max:
+        args.append(f"-Xmx{options.heap_max}")
+    if options.gc:
+        args.append(_GC_FLAGS[options.gc])
+    if options.thread_stack_size:
+        args.append(f"-Xss{options.thread_stack_size}")
+    args.extend(f"-D{key}={value}" for key, value in options.system_properties.items())
+    args.extend(options.extra_args)
+    return args
+
+
+#
+# Class-data sharing
+#
+_CDS_MODE_ENV = "TIKARA_CDS"
+"""Environment variable selecting how class-data-sharing archives are used: "use" (default), "auto" or "off"."""
+
+_CDS_DUMP_ENV = "TIKARA_CDS_DUMP"
+"""Environment variable set by `tikara warmup` in the process recording the archive, naming the file to write."""
+
+_CDS_STALE_LOCK_SECONDS = 15 * 60
+"""Age after which the lock of an archive being created is considered abandoned."""
+
+
+def _cache_dir() -> Path:
+    """Directory for tikara's generated files: `TIKARA_CACHE_DIR`, else `$XDG_CACHE_HOME/tikara` or `~/.cache`."""
+    if custom_dir := os.environ.get("TIKARA_CACHE_DIR"):
+        return Path(custom_dir)
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "tikara"
+
+
+def _cds_archive_path(classpath: list[Path]) -> Path:
+    """Path of the class-data-sharing archive for `classpath`, whether or not it exists yet.
+
+    An archive is only valid for the exact JVM build and classpath it was recorded with, so the name is derived
+    from the Tika version, the JVM library and every JAR on the classpath, including their sizes and mtimes.
+    """
+    jvm_path = Path(jpype.getDefaultJVMPath())
+    jvm_stat = jvm_path.stat()
+    parts = [TIKA_VERSION, str(jvm_path), str(jvm_stat.st_size), str(jvm_stat.st_mtime_ns)]
+    for jar in classpath:
+        jar_stat = jar.stat()
+        parts.extend([str(jar.resolve()), str(jar_stat.st_size), str(jar_stat.st_mtime_ns)])
+    digest = hashlib.sha256("\0".join(parts).encode()).hexdigest()[:16]
+    return _cache_dir() / f"tika-{TIKA_VERSION}-{digest}.jsa"
+
+
+def _cds_jvm_args(classpath: list[Path]) -> list[str]:
+    """JVM options that make the JVM map the class-data-sharing archive for `classpath`.
+
+    Loading Tika's classes from a pre-parsed archive instead of the JAR cuts JVM and parser start-up time severely.
+    Archives are created by `tikara warmup`. With `TIKARA_CDS=auto`, a missing archive is created in a background
+    process the first time a JVM starts without one, and used from the next start on. `TIKARA_CDS=off` disables
+    archives. Unsupported JVMs ignore the options and start normally.
+    """
+    # accept the options on JVMs that do not know them, rather than failing to start
+    compat = "-XX:+IgnoreUnrecognizedVMOptions"
+    if dump_path := os.environ.get(_CDS_DUMP_ENV):
+        return [compat, f"-XX:ArchiveClassesAtExit={dump_path}"]
+
+    mode = os.environ.get(_CDS_MODE_ENV, "use").casefold()
+    if mode == "off":
+        return []
+    try:
+        archive = _cds_archive_path(classpath)
+    except (OSError, jpype.JVMNotFoundException):
+        return []
+    if archive.exists():
+        return [compat, f"-XX:SharedArchiveFile={archive}", "-Xshare:auto"]
+    if mode == "auto":
+        _start_background_warmup(classpath, archive)
+    return []
+
+
+def _start_background_warmup(classpath: list[Path], archive: Path) -> None:
+    """Launch `tikara warmup` for `classpath` in a detached process, unless one is already running."""
+    lock = archive.with_suffix(".lock")
+    with suppress(OSError):
+        archive.parent.mkdir(parents=True, exist_ok=True)
+        if lock.exists() and time.time() - lock.stat().st_mtime > _CDS_STALE_LOCK_SECONDS:
+            lock.unlink(missing_ok=True)
+        # creating the lock exclusively makes sure only one process records the archive
+        os.close(os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+        command = [sys.executable, "-m", "tikara", "warmup", "--lock", str(lock), *_warmup_jar_args(classpath)]
+        subprocess.Popen(  # noqa: S603
+            command,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+
+
+def _warmup_jar_args(classpath: list[Path]) -> list[str]:
+    """Command-line arguments making `tikara warmup` rebuild `classpath`."""
+    tika_jar, *extra_jars = classpath
+    args = [] if classpath[:1] == get_jars() else ["--tika-jar", str(tika_jar)]
+    for jar in extra_jars:
+        args.extend(["--extra-jar", str(jar)])
+    return args
+
+
+class _Deadline:
+    """Bounds the Java work done on the current thread by a timeout.
+
+    When the timeout expires, a timer thread interrupts the Java thread that entered the context and closes every
+    registered resource, so parsers blocked on I/O fail fast rather than running on. Leaving the context then raises
+    `TikaTimeoutError`, and clears the thread's interrupt flag so it can be reused. A `None` timeout does nothing.
+
+    This is best-effort on its own: a parser stuck in a CPU-bound loop neither reads its input nor checks the
+    interrupt flag, so the context is not left until the parser returns. Use `_run_with_deadline` to return to the
+    caller on time regardless.
+    """
+
+    def __init__(self, timeout: float | None) -> None:
+        self._timeout = timeout
+        self._lock = threading.Lock()
+        self._closeables: list[Closeable] = []
+        self._thread: JThread | None = None
+        self._timer: threading.Timer | None = None
+        self._done = False
+        self.expired = False
+
+    def add_closeable(self, closeable: "Closeable") -> None:
+        """Register a resource to close if the timeout expires."""
+        with self._lock:
+            self._closeables.append(closeable)
+
+    def _expire(self) -> None:
+        with self._lock:
+            if self._done:
+                return
+            self.expired = True
+            if self._thread is not None:
+                self._thread.interrupt()
+            closeables = list(self._closeables)
+        for closeable in closeables:
+            with suppress(Exception):
+                closeable.close()
+
+    def __enter__(self) -> Self:
+        if self._timeout is None:
+            return self
+        if self._timeout <= 0:
+            msg = f"timeout must be positive, got {self._timeout}"
+            raise TikaInputArgumentsError(msg)
+
+        from java.lang import Thread as JThread
+
+        self._thread = JThread.currentThread()
+        self._timer = threading.Timer(self._timeout, self._expire)
+        self._timer.daemon = True
+        self._timer.start()
+        return self
+
+    def __exit__(self, exc_type: object, exc_value: BaseException | None, traceback: object) -> None:
+        if self._timer is None:
+            return
+        self._timer.cancel()
+        with self._lock:
+            self._done = True
+        if self.expired:
+            from java.lang import Thread as JThread
+
+            # clear the interrupt so the thread comes back usable
+            JThread.interrupted()
+            raise self.timeout_error() from exc_value
+
+    def timeout_error(self) -> TikaTimeoutError:
+        """The error raised for this deadline once it has expired."""
+        assert self._timeout is not None  # noqa: S101
+        return TikaTimeoutError._from_timeout(self._timeout)
+
+
+def _run_with_deadline[R](work: Callable[[_Deadline], R], timeout: float | None) -> R:
+    """Run `work` under a `_Deadline`, returning to the caller when the timeout expires even if `work` has not.
+
+    With a timeout, `work` runs on a JVM-attached daemon thread while the caller waits. When the deadline expires,
+    the worker is interrupted and its registered resources are closed as usual, but the caller gets
+    `TikaTimeoutError` straight away instead of waiting for a CPU-bound parser to notice. `work` keeps ownership of
+    whatever it opened and releases it on the worker thread once it does return. Without a timeout, `work` runs
+    inline.
+
+    Args:
+        work: The work to run. It is passed the deadline to register its closeable resources with.
+        timeout: Seconds the caller waits for `work`. None waits indefinitely.
+
+    Returns:
+        R: What `work` returned.
+
+    Raises:
+        TikaInputArgumentsError: If `timeout` is not positive.
+        TikaTimeoutError: If `work` did not finish within `timeout`.
+    """
+    if timeout is None:
+        with _Deadline(None) as deadline:
+            return work(deadline)
+    if timeout <= 0:
+        msg = f"timeout must be positive, got {timeout}"
+        raise TikaInputArgumentsError(msg)
+
+    future: Future[R] = Future()
+
+    def run() -> None:
+        from java.lang import Thread as JThread
+
+        JThread.attachAsDaemon()
+        try:
+            with _Deadline(timeout) as deadline:
+                result = work(deadline)
+        except BaseException as e:  # noqa: BLE001
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+        finally:
+            JThread.detach()
+
+    threading.Thread(target=run, name="tika-deadline", daemon=True).start()
+    try:
+        return future.result(timeout)
+    except FutureTimeoutError:
+        raise TikaTimeoutError._from_timeout(timeout) from None
+
+
 #
 # Java I/O utilities
 #
+class _JavaRawInputStream(RawIOBase):
+    """Unbuffered Python view of a Java InputStream.
+
+    Each `readinto` hands the caller's buffer to Java as a direct ByteBuffer, so bytes are copied once, inside the
+    JVM, with no intermediate Java array or Python object per call.
+    """
+
+    def __init__(self, java_stream: "InputStream") -> None:
+        super().__init__()
+        from java.nio.channels import Channels
+
+        self._stream = java_stream
+        self._channel = Channels.newChannel(java_stream)
+
+    @override
+    def readable(self) -> bool:
+        return True
+
+    @override
+    def readinto(self, buffer: "Buffer") -> int:
+        target = memoryview(buffer).cast("B")
+        if not target.nbytes:
+            return 0
+        read_count = self._channel.read(convertToDirectBuffer(target))
+        return 0 if read_count == -1 else int(read_count)
+
+    @override
+    def close(self) -> None:
+        if not self.closed:
+            try:
+                self._stream.close()
+            finally:
+                super().close()
+
+
 class _JavaReaderWrapper(BinaryIO):
-    """Wrapper for Java Reader to make it compatible with Python I/O streams."""
+    """Binary Python stream over a Java InputStream or Reader.
 
-    def __init__(self, java_reader: "Reader", buffer_size: int = 8192) -> None:
+    Readers are encoded to UTF-8 on the Java side. All reads, including `readline` and iteration, go through a
+    single reusable buffer, and reads larger than the buffer are copied straight into the caller's memory.
+    """
+
+    def __init__(self, source: "Reader | InputStream", buffer_size: int = 64 * 1024) -> None:
         super().__init__()
-        from java.io import BufferedReader
+        from java.io import Reader
+        from java.nio.charset import StandardCharsets
+        from org.apache.commons.io.input import ReaderInputStream
+
+        if isinstance(source, Reader):
+            source = ReaderInputStream(source, StandardCharsets.UTF_8)
 
-        if not isinstance(java_reader, BufferedReader):
-            java_reader = BufferedReader(java_reader)
+        self._buffered = BufferedReader(_JavaRawInputStream(source), buffer_size)
 
-        self._reader = java_reader
-        self._buffer_size = buffer_size
-        self._buffer = b""
-        self._closed = False
+    def _on_eof(self) -> None:
+        """Hook called whenever a read comes back empty because the underlying stream is exhausted."""
 
     @override
     def readable(self) -> bool:
-        return self._reader.ready()
+        return not self.closed
 
     @override
-    def read(self, size: int | None = None) -> bytes:
-        size = -1 if size is None else size
-
-        if size == 0:
-            return b""
-
-        # If we want all remaining data
-
-        if size < 0:
-            chunks: list[bytes] = [self._buffer]
-            while True:
-                char_buffer = JArray(JChar)(self._buffer_size)  # type: ignore  # noqa: PGH003
-                read_count = self._reader.read(char_buffer)
-                if read_count == -1:
-                    break
-                java_str = JString(char_buffer, 0, read_count)  # Create a proper Java String
-                python_str = str(java_str)  # This properly handles surrogate pairs
-                chunks.append(python_str.encode("utf-8"))
-            self._buffer = b""
-            return b"".join(chunks)
-
-        # If we have enough in buffer, return from there
-        if len(self._buffer) >= size:
-            data = self._buffer[:size]
-            self._buffer = self._buffer[size:]
-            return data
-
-        # Need to read more
-        char_buffer = JArray(JChar)(self._buffer_size)  # type: ignore  # noqa: PGH003
-        read_count = self._reader.read(char_buffer)
-        if read_count == -1:
-            # EOF - return whatever is left in buffer
-            data = self._buffer
-            self._buffer = b""
-            return data
-
-        self._buffer += "".join(char_buffer[:read_count]).encode("utf-8")
-        return self.read(size)  # Recursively try again with new data
+    def read(self, size: int | None = -1) -> bytes:
+        data = self._buffered.read(size)
+        if not data and size != 0:
+            self._on_eof()
+        return data
+
+    def read1(self, size: int = -1) -> bytes:
+        """Read up to `size` bytes with at most one read from the underlying Java stream."""
+        data = self._buffered.read1(size)
+        if not data and size != 0:
+            self._on_eof()
+        return data
+
+    def readinto(self, buffer: "Buffer") -> int:
+        """Read bytes into a pre-allocated, writable buffer. Returns the number of bytes read."""
+        read_count = self._buffered.readinto(buffer)
+        if not read_count and memoryview(buffer).nbytes:
+            self._on_eof()
+        return read_count
+
+    def readinto1(self, buffer: "Buffer") -> int:
+        """Like `readinto`, but with at most one read from the underlying Java stream."""
+        read_count = self._buffered.readinto1(buffer)
+        if not read_count and memoryview(buffer).nbytes:
+            self._on_eof()
+        return read_count
+
+    def peek(self, size: int = 0) -> bytes:
+        """Return buffered bytes without advancing the position."""
+        return self._buffered.peek(size)
+
+    def iter_chunks(self, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """Iterate over the stream in chunks of at most `chunk_size` bytes."""
+        while chunk := self.read(chunk_size):
+            yield chunk
 
     @override
     def close(self) -> None:
-        if not self._closed:
-            self._reader.close()
-            self._closed = True
+        self._buffered.close()
 
     @property
     @override
     def closed(self) -> bool:
-        return self._closed
+        return self._buffered.closed
 
     @override
     def seekable(self) -> bool:
@@ -176,21 +546,33 @@ class _JavaReaderWrapper(BinaryIO):
 
     @override
     def readline(self, size: int | None = -1) -> bytes:
-        java_str = self._reader.readLine()
-        if not java_str:
-            return b""
-        return str(java_str + "\n").encode("utf-8")
+        line = self._buffered.readline(-1 if size is None else size)
+        if not line and size != 0:
+            self._on_eof()
+        return line
 
     @override
     def readlines(self, hint: int | None = -1) -> list[bytes]:
-        lines = []
-        while True:
-            line = self.readline()
-            if not line:
-                break
+        hint = -1 if hint is None else hint
+        lines: list[bytes] = []
+        total = 0
+        while line := self.readline():
             lines.append(line)
+            total += len(line)
+            if 0 < hint <= total:
+                break
         return lines
 
+    @override
+    def __iter__(self) -> Iterator[bytes]:
+        return self
+
+    @override
+    def __next__(self) -> bytes:
+        if line := self.readline():
+            return line
+        raise StopIteration
+
     @override
     def write(self, s: Any) -> int:
         msg = "Reader is not writable"
@@ -215,28 +597,329 @@ class _JavaReaderWrapper(BinaryIO):
         raise UnsupportedOperation(msg)
 
 
-def _wrap_python_stream(python_stream: BinaryIO) -> "PipedInputStream":
-    """Wrap a Python binary stream as a Java PipedInputStream.
+@JImplements("java.util.concurrent.Flow$Subscription", deferred=True)
+class _BufferSubscription:
+    """Holds the Python buffer behind a `_wrap_python_buffer` stream until Java closes the stream.
+
+    The stream calls `request` as it moves past each batch of buffers and `cancel` when it is closed, a couple of
+    calls per stream in all. Reads never reach Python.
+    """
+
+    def __init__(self, view: memoryview) -> None:
+        self._view = view
+
+    @JOverride
+    def request(self, n: int) -> None:
+        pass  # the whole buffer is handed over up front
+
+    @JOverride
+    def cancel(self) -> None:
+        # Java may still hold the direct buffer until it is collected, which keeps the memory valid meanwhile
+        with suppress(BufferError):
+            self._view.release()
+
+
+def _is_buffer(obj: Any) -> TypeGuard["bytes | bytearray | memoryview | mmap"]:  # noqa: ANN401
+    """Type guard for in-memory inputs that support the buffer protocol.
 
     Args:
-        python_stream (BinaryIO): The Python binary stream to wrap.
+        obj (Any): The object to check.
 
     Returns:
-        PipedInputStream: The Java PipedInputStream that reads from the Python stream.
+        TypeGuard[bytes | bytearray | memoryview | mmap]: Asserts if the object is a supported buffer.
+    """
+    return isinstance(obj, bytes | bytearray | memoryview | mmap)
+
+
+@cache
+def _has_http_module() -> bool:
+    """Check whether the JRE includes the java.net.http module, which jlinked and minimal runtimes may leave out."""
+    from java.lang import ModuleLayer
+
+    return bool(ModuleLayer.boot().findModule("java.net.http").isPresent())
+
+
+def _wrap_python_buffer(obj: "Buffer") -> "InputStream":
+    """Expose a Python buffer to Java as an InputStream, without copying it where the JRE allows.
+
+    The buffer is handed to Java once as a direct ByteBuffer, and read by a pure-Java stream, so reads copy only
+    the requested range into the caller's array and never take the GIL. The JDK's only public InputStream over
+    ByteBuffers is the one behind `HttpResponse.BodySubscribers.ofInputStream`, which is fed the buffer and
+    completed straight away. The Python object must stay alive and unchanged until the stream is closed.
+
+    On a JRE without the java.net.http module, the buffer is instead copied once, by Java, into the byte array of
+    a ByteArrayInputStream.
+
+    Args:
+        obj: Any object supporting the buffer protocol, like bytes, bytearray, memoryview or mmap. Non-contiguous
+            views are copied once, since a direct buffer needs one contiguous block of memory.
+
+    Returns:
+        InputStream: A Java InputStream reading from the buffer's memory.
+    """
+    view = memoryview(obj)
+    if not view.c_contiguous:
+        view = memoryview(view.tobytes())
+    view = view.cast("B")
+
+    if not _has_http_module():
+        from java.io import ByteArrayInputStream
+
+        array = JArray(JByte)(view.nbytes)
+        if view.nbytes:
+            convertToDirectBuffer(view).get(array)
+        # Java may still hold the direct buffer until it is collected, which keeps the memory valid meanwhile
+        with suppress(BufferError):
+            view.release()
+        return ByteArrayInputStream(array)
+
+    from java.net.http import HttpResponse
+    from java.util import List as JList
+
+    subscriber = HttpResponse.BodySubscribers.ofInputStream()
+    subscriber.onSubscribe(_BufferSubscription(view))
+    if view.nbytes:
+        subscriber.onNext(JList.of(convertToDirectBuffer(view)))
+    subscriber.onComplete()
+    return subscriber.getBody().toCompletableFuture().join()
+
+
+def _is_mappable(obj: Any) -> TypeGuard[BinaryIO]:  # noqa: ANN401
+    """Check whether an input is an open binary stream backed by a regular file that can be memory-mapped.
+
+    Paths are not mappable here: Tika opens them itself, so parsers that need a file use the original rather than
+    a spooled copy.
+
+    Args:
+        obj (Any): The object to check.
+
+    Returns:
+        TypeGuard[BinaryIO]: Asserts if the object is a binary stream with a real file descriptor.
+    """
+    if not _is_binary_io(obj):
+        return False
+    try:
+        obj.fileno()
+    except (OSError, UnsupportedOperation):
+        return False
+    return True
+
+
+_PROC_FD_DIR = Path("/proc/self/fd")
+"""Linux directory of links to this process's open files. Opening a link opens the file anew, at its own position."""
+
+
+def _file_path(file: BinaryIO) -> Path | None:
+    """Find a path that opens the same regular file as an open binary stream positioned at its start.
+
+    The stream's `name` is used when it still names that file, otherwise its `/proc/self/fd` link, which also
+    covers unnamed and deleted files on Linux. Files are compared by device and inode, so a renamed or replaced
+    path is never mistaken for the open file.
+
+    Args:
+        file: A binary stream with a real file descriptor. It is neither read nor moved.
+
+    Returns:
+        Path | None: The path, or None if the stream is not at the start of a regular file or no path opens it.
+    """
+    try:
+        file_stat = os.fstat(file.fileno())
+        if not S_ISREG(file_stat.st_mode) or file.tell() != 0:
+            return None
+    except (OSError, UnsupportedOperation, ValueError):
+        return None
+
+    name = getattr(file, "name", None)
+    candidates = [Path(os.fsdecode(name))] if isinstance(name, str | bytes) else []
+    candidates.append(_PROC_FD_DIR / str(file.fileno()))
+    for candidate in candidates:
+        with suppress(OSError):
+            if os.path.samestat(candidate.stat(), file_stat):
+                return candidate
+    return None
+
+
+def _close_mapping(mapped: mmap) -> None:
+    # Java may still hold a view when an error unwinds a parse; the GC closes the mapping once it is released
+    with suppress(BufferError):
+        mapped.close()
+
+
+@contextmanager
+def _map_file(file: BinaryIO) -> Generator[memoryview, None, None]:
+    """Memory-map an open file read-only for the duration of the context.
+
+    Pages are loaded by the OS on first access, so parsers can read any part of the file without it being read
+    through the heap first.
+
+    Args:
+        file: A binary stream with a real file descriptor. It is mapped from its current position to the end of
+            the file, and is not closed.
+
+    Yields:
+        memoryview: A read-only view of the mapped bytes.
+    """
+    with ExitStack() as stack:
+        offset = file.tell()
+        size = os.fstat(file.fileno()).st_size
+        if size <= offset:
+            # empty files cannot be mapped
+            yield memoryview(b"")
+            return
+
+        mapped = mmap(file.fileno(), 0, access=ACCESS_READ)
+        stack.callback(_close_mapping, mapped)
+        view = memoryview(mapped)[offset:]
+        try:
+            yield view
+        finally:
+            view.release()
+
+
+_NON_BLOCKING_POLL_INTERVAL = 0.05
+"""Longest time in seconds a read waits on a non-blocking Python stream before checking the channel is still open."""
+
+
+class _PythonStreamChannel:
+    """Shared state for the Java channels over Python binary streams.
+
+    Reads are pulled on demand on the calling Java thread: the Python stream fills one reused buffer through
+    `readinto1` (or `readinto`), which is exposed to Java once as a direct ByteBuffer and copied from there into the
+    caller's buffer. A single raw read is enough, so bytes reach Java as soon as the stream has them. Non-blocking
+    streams are waited on until data arrives, since Java channel streams treat an empty read as a reason to retry.
+    The Python stream is never closed by the channel; it belongs to the caller.
     """
-    from java.io import PipedInputStream, PipedOutputStream
 
-    input_stream = PipedInputStream(8192)
-    output_stream = PipedOutputStream(input_stream)
-    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tika-pipe")
+    def __init__(self, stream: BinaryIO, buffer_size: int = 64 * 1024) -> None:
+        self._stream = stream
+        self._readinto = getattr(stream, "readinto1", stream.readinto)
+        self._view = memoryview(bytearray(buffer_size))
+        self._buffer = convertToDirectBuffer(self._view)
+        self._open = True
+
+    def _read(self, dst: "ByteBuffer") -> int:
+        self._ensure_open()
+        count = min(int(dst.remaining()), self._view.nbytes)
+        if count <= 0:
+            return 0
+        while (read_count := self._readinto(self._view[:count])) is None:
+            # non-blocking stream with nothing available yet
+            self._wait_readable()
+            self._ensure_open()
+        if read_count == 0:
+            return -1
+        src = self._buffer.duplicate()
+        src.limit(read_count)
+        dst.put(src)
+        return read_count
+
+    def _wait_readable(self) -> None:
+        try:
+            fd = self._stream.fileno()
+        except (OSError, UnsupportedOperation, ValueError):
+            time.sleep(_NON_BLOCKING_POLL_INTERVAL)
+            return
+        # bounded, so a channel closed by a deadline is noticed
+        select.select([fd], [], [], _NON_BLOCKING_POLL_INTERVAL)
+
+    def _close(self) -> None:
+        if self._open:
+            self._open = False
+            self._buffer = None
+            with suppress(BufferError):
+                self._view.release()
+
+    def _ensure_open(self) -> None:
+        if not self._open:
+            from java.nio.channels import ClosedChannelException
+
+            raise ClosedChannelException
+
+
+@JImplements("java.nio.channels.ReadableByteChannel", deferred=True)
+class _StreamChannel(_PythonStreamChannel):
+    """Forward-only Java channel over a non-seekable Python binary stream."""
+
+    @JOverride
+    def read(self, dst: "ByteBuffer") -> int:
+        return self._read(dst)
+
+    @JOverride
+    def isOpen(self) -> bool:  # noqa: N802
+        return self._open
+
+    @JOverride
+    def close(self) -> None:
+        self._close()
+
+
+@JImplements("java.nio.channels.SeekableByteChannel", deferred=True)
+class _SeekableStreamChannel(_PythonStreamChannel):
+    """Read-only Java channel over a seekable Python binary stream.
+
+    Positions are those of the Python stream, so skipping forward is a seek rather than a read.
+    """
+
+    @JOverride
+    def read(self, dst: "ByteBuffer") -> int:
+        return self._read(dst)
+
+    @JOverride
+    def write(self, src: "ByteBuffer") -> int:
+        from java.nio.channels import NonWritableChannelException
+
+        raise NonWritableChannelException
+
+    @JOverride
+    def position(self, new_position: int | None = None) -> "int | Self":
+        self._ensure_open()
+        if new_position is None:
+            return self._stream.tell()
+        self._stream.seek(int(new_position))
+        return self
+
+    @JOverride
+    def size(self) -> int:
+        self._ensure_open()
+        current = self._stream.tell()
+        try:
+            return self._stream.seek(0, os.SEEK_END)
+        finally:
+            self._stream.seek(current)
 
-    def pipe_data() -> None:
-        with output_stream:
-            while chunk := python_stream.read(8192):
-                output_stream.write(bytearray(chunk))  # pyright: ignore[reportCallIssue, reportArgumentType]
+    @JOverride
+    def truncate(self, size: int) -> Self:
+        from java.nio.channels import NonWritableChannelException
 
-    executor.submit(pipe_data)
-    return input_stream
+        raise NonWritableChannelException
+
+    @JOverride
+    def isOpen(self) -> bool:  # noqa: N802
+        return self._open
+
+    @JOverride
+    def close(self) -> None:
+        self._close()
+
+
+def _wrap_python_stream(python_stream: BinaryIO) -> "InputStream":
+    """Wrap a Python binary stream as a Java InputStream.
+
+    The returned stream reads from the Python stream on demand, on whichever Java thread consumes it, so no pump
+    thread or pipe is involved. Skipping seeks when the Python stream is seekable. Mark and reset are left to
+    TikaInputStream, which buffers streams that do not support them.
+
+    Args:
+        python_stream (BinaryIO): The Python binary stream to wrap. It is not closed with the Java stream.
+
+    Returns:
+        InputStream: The Java InputStream that reads from the Python stream.
+    """
+    from java.nio.channels import Channels
+
+    if python_stream.seekable():
+        return Channels.newInputStream(_SeekableStreamChannel(python_stream))
+    return Channels.newInputStream(_StreamChannel(python_stream))
 
 
 def read_to_string(source: "Reader | ByteArrayOutputStream") -> str:
@@ -329,6 +1012,22 @@ def input_stream_to_file(input_stream: "InputStream", output_file: Path) -> Path
     return output_file
 
 
+def _copy_stream(source: "InputStream", sink: "OutputStream", buffer: "JArray") -> int:
+    """Copy a Java InputStream into a Java OutputStream entirely on the Java side.
+
+    Args:
+        source: The stream to read from until EOF.
+        sink: The stream to write to. Not closed.
+        buffer: The Java `byte[]` to copy through. Its length sets the size of each read and write.
+
+    Returns:
+        int: The number of bytes copied.
+    """
+    from org.apache.commons.io import IOUtils
+
+    return int(IOUtils.copyLarge(source, sink, buffer))
+
+
 def input_stream_as_binary_stream(java_input_stream: "InputStream") -> BinaryIO:
     """Convert a Java InputStream to a Python binary stream.
 
@@ -338,10 +1037,7 @@ def input_stream_as_binary_stream(java_input_stream: "InputStream") -> BinaryIO:
     Returns:
         BinaryIO: The Python binary stream that reads from the Java InputStream.
     """
-    from java.io import InputStreamReader
-
-    reader = InputStreamReader(java_input_stream)
-    return _JavaReaderWrapper(reader)
+    return _JavaReaderWrapper(java_input_stream)
 
 
 def reader_as_binary_stream(source: "Reader | ByteArrayOutputStream") -> BinaryIO:
@@ -353,10 +1049,10 @@ def reader_as_binary_stream(source: "Reader | ByteArrayOutputStream") -> BinaryI
     Returns:
         BinaryIO: The Python binary stream that reads from the source.
     """
-    from java.io import ByteArrayOutputStream
+    from java.io import ByteArrayInputStream, ByteArrayOutputStream
 
     if isinstance(source, ByteArrayOutputStream):
-        return _JavaReaderWrapper(output_stream_to_reader(source))
+        return _JavaReaderWrapper(ByteArrayInputStream(source.toByteArray()))  # type: ignore  # noqa: PGH003
     return _JavaReaderWrapper(source)
 
 
@@ -0,0 +1,221 @@
+"""Small synthetic documents used to warm up parsers. Built on demand, so nothing is shipped with the package."""
+
+import io
+import zipfile
+from collections.abc import Callable
+from functools import cache
+from typing import get_args
+
+from tikara.data_types import TikaWarmUpFamily
+
+_TEXT = "Hello, world! The quick brown fox jumps over the lazy dog."
+
+_OOXML_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"'
+    ' Target="{target}"/>'
+    "</Relationships>"
+)
+_OOXML_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    "{overrides}"
+    "</Types>"
+)
+
+
+def _zip(parts: dict[str, str]) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, text in parts.items():
+            archive.writestr(name, text)
+    return buffer.getvalue()
+
+
+def _override(part: str, content_type: str) -> str:
+    return f'<Override PartName="/{part}" ContentType="{content_type}"/>'
+
+
+def _text() -> bytes:
+    return f"{_TEXT}\n".encode()
+
+
+def _html() -> bytes:
+    return f"<html><head><title>Hello</title></head><body><h1>Hello</h1><p>{_TEXT}</p></body></html>".encode()
+
+
+def _xml() -> bytes:
+    return f'<?xml version="1.0" encoding="UTF-8"?><greeting lang="en">{_TEXT}</greeting>'.encode()
+
+
+def _json() -> bytes:
+    return f'{{"greeting": "{_TEXT}", "count": 1}}'.encode()
+
+
+def _csv() -> bytes:
+    return f'greeting,count\n"{_TEXT}",1\n'.encode()
+
+
+def _rtf() -> bytes:
+    return f"{{\\rtf1\\ansi\\deff0{{\\fonttbl{{\\f0 Helvetica;}}}}\\f0 {_TEXT}\\par}}".encode()
+
+
+def _eml() -> bytes:
+    return (
+        "From: Alice <alice@example.com>\r\n"
+        "To: Bob <bob@example.com>\r\n"
+        "Subject: Hello\r\n"
+        "Date: Thu, 1 Jan 2026 00:00:00 +0000\r\n"
+        "MIME-Version: 1.0\r\n"
+        "Content-Type: text/plain; charset=utf-8\r\n"
+        "\r\n"
+        f"{_TEXT}\r\n"
+    ).encode()
+
+
+def _pdf() -> bytes:
+    stream = f"BT /F1 12 Tf 72 720 Td ({_TEXT}) Tj ET".encode()
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        (
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R"
+            b" /Resources << /Font << /F1 5 0 R >> >> >>"
+        ),
+        b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    pdf = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(pdf)
+
+
+def _docx() -> bytes:
+    main = "application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"
+    return _zip(
+        {
+            "[Content_Types].xml": _OOXML_CONTENT_TYPES.format(overrides=_override("word/document.xml", main)),
+            "_rels/.rels": _OOXML_RELS.format(target="word/document.xml"),
+            "word/document.xml": (
+                '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+                '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"><w:body>'
+                f"<w:p><w:r><w:t>{_TEXT}</w:t></w:r></w:p>"
+                "<w:tbl><w:tr><w:tc><w:p><w:r><w:t>Hello</w:t></w:r></w:p></w:tc></w:tr></w:tbl>"
+                "</w:body></w:document>"
+            ),
+        }
+    )
+
+
+def _xlsx() -> bytes:
+    spreadsheet = "application/vnd.openxmlformats-officedocument.spreadsheetml"
+    main = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+    relationships = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+    return _zip(
+        {
+            "[Content_Types].xml": _OOXML_CONTENT_TYPES.format(
+                overrides=_override("xl/workbook.xml", f"{spreadsheet}.sheet.main+xml")
+                + _override("xl/worksheets/sheet1.xml", f"{spreadsheet}.worksheet+xml")
+                + _override("xl/sharedStrings.xml", f"{spreadsheet}.sharedStrings+xml")
+                + _override("xl/styles.xml", f"{spreadsheet}.styles+xml")
+            ),
+            "_rels/.rels": _OOXML_RELS.format(target="xl/workbook.xml"),
+            "xl/workbook.xml": (
+                f'<workbook xmlns="{main}" xmlns:r="{relationships}">'
+                '<sheets><sheet name="Sheet1" sheetId="1" r:id="rId1"/></sheets></workbook>'
+            ),
+            "xl/_rels/workbook.xml.rels": (
+                '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+                f'<Relationship Id="rId1" Type="{relationships}/worksheet" Target="worksheets/sheet1.xml"/>'
+                f'<Relationship Id="rId2" Type="{relationships}/sharedStrings" Target="sharedStrings.xml"/>'
+                f'<Relationship Id="rId3" Type="{relationships}/styles" Target="styles.xml"/>'
+                "</Relationships>"
+            ),
+            "xl/worksheets/sheet1.xml": (
+                f'<worksheet xmlns="{main}"><sheetData><row r="1">'
+                '<c r="A1" t="s"><v>0</v></c><c r="B1"><v>42</v></c><c r="C1"><f>B1*2</f><v>84</v></c>'
+                "</row></sheetData></worksheet>"
+            ),
+            "xl/sharedStrings.xml": f'<sst xmlns="{main}" count="1" uniqueCount="1"><si><t>{_TEXT}</t></si></sst>',
+            "xl/styles.xml": (
+                f'<styleSheet xmlns="{main}">'
+                '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+                '<fills count="1"><fill><patternFill patternType="none"/></fill></fills>'
+                '<borders count="1"><border/></borders>'
+                '<cellStyleXfs count="1"><xf/></cellStyleXfs>'
+                '<cellXfs count="1"><xf xfId="0"/></cellXfs>'
+                "</styleSheet>"
+            ),
+        }
+    )
+
+
+def _xls() -> bytes:
+    from java.io import ByteArrayOutputStream
+    from org.apache.poi.hssf.usermodel import HSSFWorkbook
+
+    workbook = HSSFWorkbook()
+    row = workbook.createSheet("Sheet1").createRow(0)
+    row.createCell(0).setCellValue(_TEXT)
+    row.createCell(1).setCellValue(42.0)
+    output = ByteArrayOutputStream()
+    workbook.write(output)
+    workbook.close()
+    return bytes(output.toByteArray())
+
+
+def _msg() -> bytes:
+    from java.io import ByteArrayInputStream, ByteArrayOutputStream
+    from org.apache.poi.poifs.filesystem import POIFSFileSystem
+
+    # an Outlook message is an OLE2 file of MAPI property streams, named by property id and type (001F: UTF-16)
+    streams = {
+        "__substg1.0_001A001F": "IPM.Note".encode("utf-16-le"),
+        "__substg1.0_0037001F": "Hello".encode("utf-16-le"),
+        "__substg1.0_0C1A001F": "Alice".encode("utf-16-le"),
+        "__substg1.0_0E04001F": "Bob".encode("utf-16-le"),
+        "__substg1.0_1000001F": _TEXT.encode("utf-16-le"),
+        # the top-level property stream is a 32 byte header followed by fixed-size properties, here none
+        "__properties_version1.0": bytes(32),
+    }
+    filesystem = POIFSFileSystem()
+    for name, data in streams.items():
+        filesystem.createDocument(ByteArrayInputStream(data), name)
+    output = ByteArrayOutputStream()
+    filesystem.writeFilesystem(output)
+    filesystem.close()
+    return bytes(output.toByteArray())
+
+
+_SAMPLE_BUILDERS: dict[TikaWarmUpFamily, Callable[[], bytes]] = {
+    "txt": _text,
+    "html": _html,
+    "xml": _xml,
+    "json": _json,
+    "csv": _csv,
+    "rtf": _rtf,
+    "eml": _eml,
+    "pdf": _pdf,
+    "docx": _docx,
+    "xlsx": _xlsx,
+    "xls": _xls,
+    "msg": _msg,
+}
+
+_WARM_UP_FAMILIES: tuple[TikaWarmUpFamily, ...] = get_args(TikaWarmUpFamily)
+
+
+@cache
+def _warm_up_sample(family: TikaWarmUpFamily) -> bytes:
+    """Build, once per process, a small document of `family` that exercises its parser's usual code paths."""
+    return _SAMPLE_BUILDERS[family]()
@@ -1,31 +1,289 @@
 """Collection of utility function and classes for interacting with the underlying Apache Tika library."""
 
 import logging
-from collections.abc import Generator
-from contextlib import contextmanager
+import threading
+import time
+from collections.abc import Callable, Generator
+from contextlib import AbstractContextManager, ExitStack, contextmanager
+from fnmatch import fnmatchcase
+from functools import cache
 from pathlib import Path
-from typing import TYPE_CHECKING, BinaryIO, Protocol, Self
-
-from jpype import JImplements, JOverride
-
-from tikara.data_types import TikaMetadata, TikaParseOutputFormat, TikaUnpackedItem
-from tikara.error_handling import TikaInputTypeError, TikaOutputFormatError
-from tikara.util.java import _file_output_stream, _is_binary_io, _wrap_python_stream, reader_as_binary_stream
-from tikara.util.misc import _validate_input_file
+from typing import TYPE_CHECKING, Any, BinaryIO, Protocol, Self, get_args, override
+
+from jpype import JArray, JByte, JException, JImplements, JOverride
+
+from tikara.data_types import (
+    _DETECTED_LANGUAGE_CONFIDENCE_KEY,
+    _DETECTED_LANGUAGE_KEY,
+    _DETECTED_LANGUAGE_RAW_SCORE_KEY,
+    _WRITE_LIMIT_REACHED_KEY,
+    TesseractOptions,
+    TikaInputType,
+    TikaIOMode,
+    TikaMetadata,
+    TikaOcrPolicy,
+    TikaOcrStrategy,
+    TikaParseOutputFormat,
+    TikaUnpackedItem,
+)
+from tikara.error_handling import (
+    TikaError,
+    TikaInitializationError,
+    TikaInputArgumentsError,
+    TikaInputTypeError,
+    TikaOutputFormatError,
+    TikaTimeoutError,
+)
+from tikara.util.java import (
+    _copy_stream,
+    _Deadline,
+    _file_output_stream,
+    _file_path,
+    _is_binary_io,
+    _is_buffer,
+    _is_mappable,
+    _JavaReaderWrapper,
+    _map_file,
+    _run_with_deadline,
+    _wrap_python_buffer,
+    _wrap_python_stream,
+)
+from tikara.util.misc import _validate_and_prepare_output_file, _validate_input_file
 
 logger = logging.getLogger(__name__)
 
 
 if TYPE_CHECKING:
     from java.io import (
+        FileOutputStream,
+        FileWriter,
         InputStream,
+        OutputStream,
     )
+    from java.lang import Class as JClass
+    from java.util import ArrayList as JArrayList
+    from org.apache.tika import Tika as JTika
+    from org.apache.tika.config import ServiceLoader, TikaConfig
     from org.apache.tika.io import TikaInputStream
+    from org.apache.tika.language.detect import LanguageDetector
     from org.apache.tika.metadata import Metadata
+    from org.apache.tika.mime import MediaTypeRegistry
     from org.apache.tika.parser import ParseContext, Parser
+    from org.apache.tika.parser.ocr import TesseractOCRConfig
+    from org.apache.tika.parser.pdf import PDFParserConfig
     from org.xml.sax import ContentHandler
 
 
+_UNPACK_COPY_BUFFER_SIZE = 64 * 1024
+"""Default size in bytes of the buffer used to copy embedded documents to disk."""
+
+_LANGUAGE_SAMPLE_CHARS = 10_000
+"""Number of characters of text fed to language detection during parses."""
+
+
+class _ParseToolkit:
+    """Java classes and handler factories needed on every parse, resolved once per process.
+
+    Resolving Java classes through JPype's import hooks costs a lookup per name, which adds up for small documents
+    when it happens on each call. Get the shared instance with `_get_parse_toolkit`.
+    """
+
+    def __init__(self) -> None:
+        from java.io import FileOutputStream, FileWriter, OutputStreamWriter, StringWriter
+        from org.apache.tika.exception import WriteLimitReachedException
+        from org.apache.tika.language.detect import LanguageHandler
+        from org.apache.tika.parser import ParseContext, Parser
+        from org.apache.tika.parser.ocr import TesseractOCRConfig
+        from org.apache.tika.parser.pdf import PDFParserConfig
+        from org.apache.tika.sax import (  # type: ignore # noqa: PGH003
+            BodyContentHandler,
+            RichTextContentHandler,
+            TeeContentHandler,
+            ToXMLContentHandler,
+            WriteOutContentHandler,
+        )
+        from org.xml.sax import ContentHandler
+
+        self._file_output_stream = FileOutputStream
+        self._file_writer = FileWriter
+        self._output_stream_writer = OutputStreamWriter
+        self._string_writer = StringWriter
+        self._parse_context = ParseContext
+        self._parser_class = Parser
+        self._body_content_handler = BodyContentHandler
+        self._rich_text_content_handler = RichTextContentHandler
+        self._to_xml_content_handler = ToXMLContentHandler
+        self._content_handler_class = ContentHandler
+        self._write_out_content_handler = WriteOutContentHandler
+        self._write_limit_reached_exception = WriteLimitReachedException
+        self._language_handler = LanguageHandler
+        self._tee_content_handler = TeeContentHandler
+        self._tesseract_ocr_config = TesseractOCRConfig
+        self._pdf_parser_config = PDFParserConfig
+
+    def context_entries(self, parser: "Parser", ocr: TikaOcrPolicy | None = None) -> tuple[tuple[Any, Any], ...]:
+        """Build the ParseContext entries that do not depend on the document. See `_ParseTemplate`.
+
+        Args:
+            parser: The parser running the parse, set for recursion into embedded documents.
+            ocr: If set, the OCR policy of the parse. See `ocr_configs`.
+
+        Returns:
+            The (class, value) pairs to set on each ParseContext.
+        """
+        entries: list[tuple[Any, Any]] = [(self._parser_class, parser)]
+        if ocr is not None:
+            tesseract_config, pdf_config = self.ocr_configs(ocr)
+            entries += [(self._tesseract_ocr_config, tesseract_config), (self._pdf_parser_config, pdf_config)]
+        return tuple(entries)
+
+    def new_context(
+        self,
+        template: "_ParseTemplate",
+        handler: "ContentHandler",
+        max_chars: int | None = None,
+        language_detector: "LanguageDetector | None" = None,
+    ) -> "tuple[ContentHandler, ParseContext]":
+        """Create the ParseContext for one parse, starting from the entries of `template`.
+
+        Args:
+            template: The parser and document-independent context entries of the parse.
+            handler: The handler receiving the output.
+            max_chars: If set, stop the parse once this many characters of text have been written.
+            language_detector: If set, also feed the first `_LANGUAGE_SAMPLE_CHARS` characters of text to this
+                detector as the parse produces them. `run` records the detected language in the metadata.
+
+        Returns:
+            The handler to pass to the parser, wrapped to enforce `max_chars` if set, and the context.
+        """
+        pc = self._parse_context()
+        for key, value in template.entries:
+            pc.set(key, value)
+        if language_detector is not None:
+            language_handler = self._language_handler(language_detector)
+            # stop feeding the detector once it has a full sample, without stopping the parse
+            sampler = self._write_out_content_handler(language_handler, _LANGUAGE_SAMPLE_CHARS, False, pc)  # noqa: FBT003
+            handler = self._tee_content_handler(handler, sampler)
+            pc.set(self._language_handler, language_handler)
+        if max_chars is not None:
+            # throwOnWriteLimitReached, so the parser stops at the limit instead of running to the end
+            handler = self._write_out_content_handler(handler, max_chars, True, pc)  # noqa: FBT003
+        pc.set(self._content_handler_class, handler)
+        return handler, pc
+
+    def ocr_configs(self, ocr: TikaOcrPolicy) -> "tuple[TesseractOCRConfig, PDFParserConfig]":
+        """Build the per-call Tesseract and PDF parser configs that apply an OCR policy.
+
+        Tika merges these with the configured defaults, taking only the settings made here, so everything else
+        keeps its configured value. "off" skips OCR entirely, "auto" OCRs images and only the PDF pages without a
+        usable text layer, and "only" OCRs PDF pages instead of extracting their text.
+        """
+        tesseract_config = self._tesseract_ocr_config()
+        pdf_config = self._pdf_parser_config()
+        match ocr:
+            case "off":
+                tesseract_config.setSkipOcr(True)
+                pdf_config.setOcrStrategy("no_ocr")
+            case "auto":
+                pdf_config.setOcrStrategy("auto")
+            case "only":
+                pdf_config.setOcrStrategy("ocr_only")
+            case TesseractOptions():
+                pdf_config.setOcrStrategy("auto" if ocr.skip_pages_with_text else "ocr_and_text_extraction")
+                if ocr.language is not None:
+                    tesseract_config.setLanguage(ocr.language)
+                if ocr.timeout_seconds is not None:
+                    tesseract_config.setTimeoutSeconds(ocr.timeout_seconds)
+                if ocr.dpi is not None:
+                    pdf_config.setOcrDPI(ocr.dpi)
+                if ocr.resize is not None:
+                    tesseract_config.setEnableImagePreprocessing(True)
+                    tesseract_config.setResize(ocr.resize)
+            case _:
+                _validate_ocr_policy(ocr)
+        return tesseract_config, pdf_config
+
+    def run(
+        self,
+        parser: "Parser",
+        input_stream: "InputStream",
+        handler: "ContentHandler",
+        metadata: "Metadata",
+        pc: "ParseContext",
+    ) -> None:
+        """Run a parse, treating a reached write limit as a normal, truncated end of the document.
+
+        The parser stops as soon as the limit is hit. Everything written up to that point is kept, and the metadata
+        is flagged as truncated (`TikaMetadata.write_limit_reached`).
+        """
+        try:
+            parser.parse(input_stream, handler, metadata, pc)
+        except JException as e:
+            if not self._write_limit_reached_exception.isWriteLimitReached(e):
+                raise
+            metadata.set(_WRITE_LIMIT_REACHED_KEY, "true")
+
+        language_handler = pc.get(self._language_handler)
+        if language_handler is not None:
+            result = language_handler.getLanguage()
+            if str(result.getLanguage()):
+                metadata.set(_DETECTED_LANGUAGE_KEY, str(result.getLanguage()))
+                metadata.set(_DETECTED_LANGUAGE_CONFIDENCE_KEY, str(result.getConfidence().name()))
+                metadata.set(_DETECTED_LANGUAGE_RAW_SCORE_KEY, str(result.getRawScore()))
+
+    def string_handler(self, output_format: TikaParseOutputFormat) -> "ContentHandler":
+        """Create a handler buffering the output in memory. Unknown formats fall back to plain text."""
+        if output_format == "xhtml":
+            return self._to_xml_content_handler("UTF-8")
+        return self._body_content_handler(self._rich_text_content_handler(self._string_writer()))
+
+    def file_handler(
+        self, output_format: TikaParseOutputFormat, output_file: Path
+    ) -> "tuple[ContentHandler, FileOutputStream | FileWriter]":
+        """Create a handler writing to `output_file`, along with the output the caller must close."""
+        if output_format == "xhtml":
+            output = self._file_output_stream(str(output_file))
+            return self._to_xml_content_handler(output, "UTF-8"), output
+        if output_format == "txt":
+            output = self._file_writer(str(output_file))
+            return self._body_content_handler(output), output
+        raise TikaOutputFormatError._from_output_format(output_format)
+
+    def stream_handler(self, output_format: TikaParseOutputFormat, sink: "OutputStream") -> "ContentHandler":
+        """Create a handler writing UTF-8 output to `sink`."""
+        if output_format == "xhtml":
+            return self._to_xml_content_handler(sink, "UTF-8")
+        return self._body_content_handler(self._output_stream_writer(sink, "UTF-8"))
+
+
+def _validate_ocr_policy(ocr: object) -> None:
+    """Raise TikaInputArgumentsError unless `ocr` is a valid `parse(ocr=...)` value, None included."""
+    if ocr is not None and not isinstance(ocr, TesseractOptions) and ocr not in get_args(TikaOcrStrategy):
+        msg = f"ocr must be one of {list(get_args(TikaOcrStrategy))} or TesseractOptions, got {ocr!r}"
+        raise TikaInputArgumentsError(msg)
+
+
+@cache
+def _get_parse_toolkit() -> _ParseToolkit:
+    """Get the process-wide `_ParseToolkit`. The JVM must be running."""
+    return _ParseToolkit()
+
+
+class _ParseTemplate:
+    """The document-independent part of a parse: its parser, and the ParseContext entries every parse starts from.
+
+    Creating a template resolves the OCR policy into Tesseract and PDF parser configs. Parsers only read those,
+    merging them into copies of their defaults, so one template can back any number of parses, concurrently too.
+    `TikaParseSession` builds its template once and reuses it, so its parses skip that setup.
+    """
+
+    def __init__(self, parser: "Parser", ocr: TikaOcrPolicy | None = None) -> None:
+        _validate_ocr_policy(ocr)
+        self.parser = parser
+        self.ocr = ocr
+        self.entries = _get_parse_toolkit().context_entries(parser, ocr)
+
+
 class _RecursiveEmbeddedDocumentExtractor(Protocol):
     """
     Extracts embedded documents from a parent document using Apache Tika.
@@ -83,6 +341,7 @@ class _RecursiveEmbeddedDocumentExtractor(Protocol):
         parser: "Parser",
         output_dir: Path,
         max_depth: int,
+        copy_buffer_size: int = _UNPACK_COPY_BUFFER_SIZE,
     ) -> Self:
         """Create a new instance of the underlying Java extractor class.
 
@@ -91,6 +350,7 @@ class _RecursiveEmbeddedDocumentExtractor(Protocol):
             parser (Parser): The parser to use.
             output_dir (Path): The output directory to write unpacked embedded documents to.
             max_depth (int): The maximum depth to recurse when unpacking embedded documents.
+            copy_buffer_size (int): Size in bytes of the buffer used to copy each embedded document to disk.
 
         Returns:
             Self: The new instance of the extractor that can be passed to the Java side.
@@ -106,6 +366,7 @@ class _RecursiveEmbeddedDocumentExtractor(Protocol):
                 parser: "Parser",
                 output_dir: Path,
                 max_depth: int,
+                copy_buffer_size: int,
             ) -> None:
                 self.output_dir = output_dir
                 self._max_depth = max_depth
@@ -113,6 +374,8 @@ class _RecursiveEmbeddedDocumentExtractor(Protocol):
                 self._parser = parser
                 self._results: list[TikaUnpackedItem] = []
                 self._context = parse_context
+                # reused for every embedded document so the copy loop never allocates
+                self._copy_buffer = JArray(JByte)(copy_buffer_size)  # type: ignore  # noqa: PGH003
 
             @JOverride
             def parseEmbedded(  # noqa: N802
@@ -133,17 +396,17 @@ class _RecursiveEmbeddedDocumentExtractor(Protocol):
 
                     output_path = Path(self.output_dir, str(name))
 
+                    started = time.perf_counter()
                     with _file_output_stream(output_path) as fos, _tika_input_stream(stream) as tika_stream:
-                        while True:
-                            bytes_read = tika_stream.read()
-                            if bytes_read == -1:
-                                break
-                            fos.write(bytes_read)
+                        bytes_copied = _copy_stream(tika_stream, fos, self._copy_buffer)
+                    copy_time_millis = (time.perf_counter() - started) * 1000
 
                     self._results.append(
                         TikaUnpackedItem(
                             file_path=output_path,
                             metadata=TikaMetadata._from_java_metadata(metadata),
+                            bytes_copied=bytes_copied,
+                            copy_time_millis=copy_time_millis,
                         )
                     )
 
@@ -167,11 +430,161 @@ class _RecursiveEmbeddedDocumentExtractor(Protocol):
             def get_results(self) -> list[TikaUnpackedItem]:
                 return self._results
 
-        return RecursiveEmbeddedDocumentExtractorImpl(parse_context, parser, output_dir, max_depth)
+        return RecursiveEmbeddedDocumentExtractorImpl(parse_context, parser, output_dir, max_depth, copy_buffer_size)
+
+
+def _is_mime_selector(selector: str) -> bool:
+    """Whether a `parsers`/`exclude_parsers` selector is a MIME type pattern rather than a parser class name."""
+    return "/" in selector
+
+
+def _matches_class(class_name: str, selectors: list[str]) -> bool:
+    """Whether a parser class matches any selector, by fully qualified or simple name, with glob wildcards."""
+    simple_name = class_name.rsplit(".", 1)[-1]
+    return any(fnmatchcase(class_name, selector) or fnmatchcase(simple_name, selector) for selector in selectors)
+
+
+def _matches_type(media_type: str, selectors: list[str]) -> bool:
+    return any(fnmatchcase(media_type, selector) for selector in selectors)
+
+
+def _excluded_parser_classes(
+    loader: "ServiceLoader",
+    parsers: list[str] | None,
+    exclude_parsers: list[str],
+) -> "JArrayList[JClass]":
+    """Parser classes that can be left out by name alone, without being instantiated."""
+    from java.lang import Class as JClass
+    from java.lang import Thread as JThread
+    from java.util import ArrayList as JArrayList
+    from org.apache.tika.parser import Parser as JParser
+
+    # a parser only chosen by MIME type has to be built to learn its types, so nothing is excluded for it here
+    include_classes = None if parsers is None or any(map(_is_mime_selector, parsers)) else parsers
+    exclude_classes = [selector for selector in exclude_parsers if not _is_mime_selector(selector)]
+
+    class_loader = JThread.currentThread().getContextClassLoader()
+    excluded = JArrayList()
+    for class_name in map(str, loader.identifyStaticServiceProviders(JParser)):
+        if _matches_class(class_name, exclude_classes) or (
+            include_classes is not None and not _matches_class(class_name, include_classes)
+        ):
+            try:
+                excluded.add(JClass.forName(class_name, False, class_loader))  # noqa: FBT003
+            except JException:
+                continue  # the service loader skips providers that cannot be loaded, too
+    return excluded
+
+
+def _narrow_parser(
+    parser: "Parser",
+    context: "ParseContext",
+    parsers: list[str] | None,
+    exclude_parsers: list[str],
+) -> "Parser | None":
+    """Restrict a parser to the selected MIME types, or None if it is left with none."""
+    from java.util import HashSet as JHashSet
+    from org.apache.tika.mime import MediaType
+    from org.apache.tika.parser import ParserDecorator
+
+    supported = [str(media_type) for media_type in parser.getSupportedTypes(context)]
+    kept = supported
+    if parsers is not None and not _matches_class(str(parser.getClass().getName()), parsers):
+        kept = [media_type for media_type in kept if _matches_type(media_type, parsers)]
+    kept = [media_type for media_type in kept if not _matches_type(media_type, exclude_parsers)]
+    if not kept:
+        return None
+    if len(kept) == len(supported):
+        return parser
+    return ParserDecorator.withTypes(parser, JHashSet([MediaType.parse(media_type) for media_type in kept]))
+
+
+def _build_default_parser(
+    registry: "MediaTypeRegistry",
+    parsers: list[str] | None,
+    exclude_parsers: list[str] | None,
+) -> "Parser":
+    """Build Tika's default parser, restricted to the selected parsers.
+
+    Selectors containing a "/" are MIME type patterns like "application/pdf" or "image/*". Others are parser class
+    names, fully qualified or simple, like "PDFParser" or "org.apache.tika.parser.microsoft.*". Class-name selectors
+    are applied to the service-loader entries before anything is instantiated, so parsers that are not selected are
+    never constructed. MIME type selectors need each candidate parser's supported types, so candidates are built
+    and then narrowed down with `ParserDecorator`.
+
+    Args:
+        registry: The media type registry of the configuration, including custom MIME types.
+        parsers: Selectors of the parsers or MIME types to keep, or None to keep every parser.
+        exclude_parsers: Selectors of the parsers or MIME types to drop.
+
+    Returns:
+        Parser: A `DefaultParser`, or a `CompositeParser` of narrowed parsers when MIME type selectors are used.
+
+    Raises:
+        TikaInputArgumentsError: If a selector is empty, or `parsers` selects no parser at all.
+    """
+    exclude_parsers = exclude_parsers or []
+    if any(not selector.strip() for selector in [*(parsers or []), *exclude_parsers]):
+        msg = "Parser selectors must not be empty"
+        raise TikaInputArgumentsError(msg)
+
+    from java.util import ArrayList as JArrayList
+    from org.apache.tika.config import ServiceLoader
+    from org.apache.tika.parser import CompositeParser, DefaultParser, ParseContext
+
+    loader = ServiceLoader()
+    default_parser = DefaultParser(registry, loader, _excluded_parser_classes(loader, parsers, exclude_parsers))
+    component_parsers = default_parser.getAllComponentParsers()
+    result: Parser = default_parser
+    if any(map(_is_mime_selector, [*(parsers or []), *exclude_parsers])):
+        context = ParseContext()
+        narrowed = [_narrow_parser(parser, context, parsers, exclude_parsers) for parser in component_parsers]
+        component_parsers = JArrayList([parser for parser in narrowed if parser is not None])
+        result = CompositeParser(registry, component_parsers)
+
+    if parsers is not None and component_parsers.isEmpty():
+        msg = f"parsers={parsers} does not select any parser"
+        raise TikaInputArgumentsError(msg)
+    return result
+
+
+_TIKA_CONFIGS: dict[tuple[str, int, int], "TikaConfig"] = {}
+"""Loaded tika-config.xml files, keyed by resolved path, size and modification time."""
+_TIKA_CONFIGS_LOCK = threading.Lock()
+
+
+def _load_tika_config(path: Path | str) -> "TikaConfig":
+    """Load a tika-config.xml file, sharing one `TikaConfig` between all instances using the same file.
+
+    Loading a config builds every parser and detector it declares, so it is done once per version of the file.
+    An edited file, with a new size or modification time, is loaded afresh and replaces the older version.
+
+    Raises:
+        TikaInputFileNotFoundError: If the file does not exist.
+        TikaInitializationError: If Tika cannot load the file.
+    """
+    resolved = _validate_input_file(path).resolve()
+    stat = resolved.stat()
+    key = (str(resolved), stat.st_size, stat.st_mtime_ns)
+    with _TIKA_CONFIGS_LOCK:
+        if (config := _TIKA_CONFIGS.get(key)) is not None:
+            return config
+
+        from org.apache.tika.config import TikaConfig
+
+        try:
+            config = TikaConfig(str(resolved))
+        except JException as e:
+            msg = f"Failed to load Tika config {resolved}: {e}"
+            raise TikaInitializationError(msg) from e
+        for stale in [cached for cached in _TIKA_CONFIGS if cached[0] == key[0]]:
+            del _TIKA_CONFIGS[stale]
+        _TIKA_CONFIGS[key] = config
+        return config
 
 
 def _get_metadata(
-    obj: str | bytes | Path | BinaryIO,
+    obj: TikaInputType,
     input_stream: "TikaInputStream | None" = None,
     input_file_name: str | Path | None = None,
     content_type: str | None = None,
@@ -202,155 +615,425 @@ def _get_metadata(
     return metadata
 
 
+def _read_header(obj: TikaInputType, size: int) -> bytes | memoryview:
+    """Read at most `size` bytes from the start of an input, and nothing more.
+
+    Paths are opened and read directly. Binary streams are read from their current position, which is restored
+    afterwards when the stream is seekable. In-memory inputs are sliced without copying.
+
+    Args:
+        obj (TikaInputType): The input to read from.
+        size (int): Maximum number of bytes to read.
+
+    Returns:
+        bytes | memoryview: The header, shorter than `size` if the input is.
+    """
+    if isinstance(obj, str | Path):
+        _validate_input_file(obj)
+        with Path(obj).open("rb", buffering=0) as f:
+            return _read_prefix(f, size)
+    if _is_buffer(obj):
+        view = memoryview(obj)
+        view = view.cast("B") if view.c_contiguous else memoryview(view.tobytes())
+        return view[:size]
+    if _is_binary_io(obj):
+        if not obj.seekable():
+            return _read_prefix(obj, size)
+        position = obj.tell()
+        try:
+            return _read_prefix(obj, size)
+        finally:
+            obj.seek(position)
+    raise TikaInputTypeError._from_input_type(type(obj))
+
+
+def _read_prefix(stream: BinaryIO, size: int) -> bytes:
+    """Read up to `size` bytes, retrying short reads until the stream is exhausted."""
+    chunks: list[bytes] = []
+    remaining = size
+    while remaining > 0 and (chunk := stream.read(remaining)):
+        chunks.append(chunk)
+        remaining -= len(chunk)
+    return b"".join(chunks)
+
+
 @contextmanager
 def _tika_input_stream(
-    obj: "str | bytes | Path | BinaryIO | InputStream", *, metadata: "Metadata | None" = None
+    obj: "TikaInputType | InputStream",
+    *,
+    metadata: "Metadata | None" = None,
+    io_mode: TikaIOMode = "stream",
 ) -> Generator["TikaInputStream", None, None]:
     """Wrap arbitrary input objects as TikaInputStreams.
 
+    In-memory inputs (bytes, bytearray, memoryview, mmap) are read by Java directly from their memory, without
+    being copied into a Java byte array first, unless the JRE lacks the java.net.http module.
+
     Args:
-        obj (str | bytes | Path | BinaryIO): The input object to wrap.
+        obj (TikaInputType | InputStream): The input object to wrap.
         metadata (Metadata | None): The metadata to associate with the input stream. Defaults to empty metadata.
+        io_mode (TikaIOMode): How to read open files. With "mmap", a binary stream at the start of a regular file
+            is handed to Tika as that file's path (its name, or its `/proc/self/fd` link), so parsers that need
+            random access read the file in place instead of a spooled copy. Other open files are memory-mapped and
+            read from the mapping rather than through Python reads; container parsers still spool those to a
+            temporary file. Paths are always opened by Tika as files. Other inputs are unaffected. Defaults to
+            "stream".
 
     Yields:
         TikaInputStream: The wrapped input stream.
     """
-    from java.io import ByteArrayInputStream, Closeable, InputStream, PipedInputStream
+    from java.io import Closeable, InputStream
     from java.nio.file import Path as JPath
     from org.apache.tika.io import TemporaryResources, TikaInputStream
     from org.apache.tika.metadata import Metadata
 
     metadata = metadata or Metadata()
 
-    input_obj: PipedInputStream | ByteArrayInputStream | InputStream | JPath
-    if isinstance(obj, str | Path):
-        _validate_input_file(obj)
-        input_obj = JPath.of(str(obj))  # technically supports network resources
-    elif isinstance(obj, bytes):
-        input_obj = ByteArrayInputStream(obj)
-    elif isinstance(obj, InputStream):
-        input_obj = obj
-    elif _is_binary_io(obj):
-        input_obj = _wrap_python_stream(obj)
-    else:
-        raise TikaInputTypeError._from_input_type(type(obj))
+    with ExitStack() as stack:
+        file_path = None
+        if io_mode == "mmap" and _is_mappable(obj):
+            file_path = _file_path(obj)
+            obj = file_path or stack.enter_context(_map_file(obj))
+
+        input_obj: InputStream | JPath
+        if isinstance(obj, str | Path):
+            _validate_input_file(obj)
+            input_obj = JPath.of(str(obj))  # technically supports network resources
+        elif _is_buffer(obj):
+            input_obj = _wrap_python_buffer(obj)
+        elif isinstance(obj, InputStream):
+            input_obj = obj
+        elif _is_binary_io(obj):
+            input_obj = _wrap_python_stream(obj)
+        else:
+            raise TikaInputTypeError._from_input_type(type(obj))
 
-    try:
+        if isinstance(input_obj, Closeable):
+            stack.callback(input_obj.close)
         if isinstance(input_obj, InputStream):
-            yield TikaInputStream.get(input_obj, TemporaryResources(), metadata)
+            tika_stream = TikaInputStream.get(input_obj, TemporaryResources(), metadata)
         else:
-            yield TikaInputStream.get(input_obj, metadata)
-    finally:
-        if isinstance(input_obj, Closeable):
-            input_obj.close()
+            # an open file's path, possibly an fd link, is kept out of the metadata, as for any other stream
+            tika_stream = TikaInputStream.get(input_obj, metadata if file_path is None else Metadata())
+        # closing the TikaInputStream also closes its TemporaryResources, deleting any spooled files
+        stack.callback(tika_stream.close)
+        yield tika_stream
 
 
-def _handle_file_output(
-    parser: "Parser",
+def _detect_mime_type(
+    tika: "JTika",
+    obj: TikaInputType,
+    metadata: "Metadata",
+    io_mode: TikaIOMode,
+    deadline: _Deadline,
+) -> str:
+    """Detect the MIME type of `obj`, closing its input if `deadline` expires. Backs `Tika.detect_mime_type`."""
+    with _tika_input_stream(obj, metadata=metadata, io_mode=io_mode) as input_stream:
+        deadline.add_closeable(input_stream)
+        return str(tika.detect(input_stream, metadata))
+
+
+def _handle_file_output(  # noqa: PLR0913
+    template: _ParseTemplate,
     output_file: Path,
     input_stream: "InputStream",
     metadata: "Metadata",
     output_format: TikaParseOutputFormat,
+    *,
+    max_chars: int | None = None,
+    language_detector: "LanguageDetector | None" = None,
 ) -> tuple[Path, TikaMetadata]:
     """Handle parsing with file output."""
-    from java.io import FileOutputStream, FileWriter
-    from org.apache.tika.parser import (
-        ParseContext,
-        Parser,
-    )
-    from org.apache.tika.sax import (
-        BodyContentHandler,
-        ToXMLContentHandler,
-    )
-    from org.xml.sax import ContentHandler
-
-    output: FileOutputStream | FileWriter | None = None
+    toolkit = _get_parse_toolkit()
+    ch, output = toolkit.file_handler(output_format, output_file)
     try:
-        if output_format == "xhtml":
-            output = FileOutputStream(str(output_file))
-            ch = ToXMLContentHandler(output, "UTF-8")
-        elif output_format == "txt":
-            output = FileWriter(str(output_file))
-            ch = BodyContentHandler(output)
-        else:
-            raise TikaOutputFormatError._from_output_format(output_format)
-
-        pc = ParseContext()
-        pc.set(Parser, parser)
-        pc.set(ContentHandler, ch)
-
-        parser.parse(input_stream, ch, metadata, pc)
+        limited_ch, pc = toolkit.new_context(template, ch, max_chars, language_detector)
+        toolkit.run(template.parser, input_stream, limited_ch, metadata, pc)
 
         return output_file, TikaMetadata._from_java_metadata(metadata)
     finally:
-        if output:
-            output.close()
+        output.close()
 
 
-def _handle_stream_output(
-    parser: "Parser",
+_STREAM_PIPE_SIZE = 64 * 1024
+"""Size in bytes of the read buffer over the pipe between a streaming parse and its reader."""
+
+
+class _StreamingParse(threading.Thread):
+    """Runs a parse on a JVM-attached background thread that writes its output into a bounded pipe.
+
+    The thread owns the sink end of the pipe and every resource in `resources` (input streams, temporary files),
+    and closes all of them once the parse finishes, whether it succeeded or not. Closing the sink is what tells the
+    reader that the output is complete.
+    """
+
+    def __init__(
+        self,
+        parse: Callable[[_Deadline], None],
+        sink: "OutputStream",
+        resources: ExitStack,
+        timeout: float | None = None,
+    ) -> None:
+        super().__init__(name="tika-parse-stream", daemon=True)
+        self._parse = parse
+        self._sink = sink
+        self._resources = resources
+        self.deadline = _Deadline(timeout)
+        # closing the sink at the deadline ends the reader's output even if the parser never notices the interrupt
+        self.deadline.add_closeable(sink)
+        self.error: BaseException | None = None
+
+    @override
+    def run(self) -> None:
+        from java.lang import Thread as JThread
+
+        JThread.attachAsDaemon()
+        try:
+            with self.deadline:
+                self._parse(self.deadline)
+        except BaseException as e:  # noqa: BLE001
+            self.error = e
+        finally:
+            try:
+                self._sink.close()
+            finally:
+                self._resources.close()
+                JThread.detach()
+
+    def wait(self) -> None:
+        """Wait for the parse to end once the reader has seen the end of its output.
+
+        If the deadline expired, `TikaTimeoutError` is raised straight away instead: the parser may still be running,
+        and the thread releases its resources whenever it does return.
+        """
+        if self.deadline.expired:
+            raise self.deadline.timeout_error()
+        self.join()
+
+    def raise_error(self) -> None:
+        """Re-raise the exception that ended the parse, if any."""
+        if self.error is not None:
+            raise self.error
+
+
+class _ParseOutputStream(_JavaReaderWrapper):
+    """Binary stream over the output of a `_StreamingParse`.
+
+    Reads block until the parser has produced more output. Once the output is exhausted, any error the parser hit
+    part-way through is raised from the read, and `metadata` holds the metadata as of the end of the parse.
+    """
+
+    def __init__(self, java_stream: "InputStream", producer: _StreamingParse, metadata: "Metadata") -> None:
+        super().__init__(java_stream)
+        self._producer = producer
+        self._java_metadata = metadata
+        self._metadata: TikaMetadata | None = None
+
+    @property
+    def metadata(self) -> TikaMetadata:
+        """Metadata of the parsed document. Complete once the stream has been read to the end."""
+        if self._metadata is not None:
+            return self._metadata
+        metadata = _snapshot_metadata(self._java_metadata)
+        if not self._producer.is_alive():
+            self._metadata = metadata
+        return metadata
+
+    @override
+    def _on_eof(self) -> None:
+        self._producer.wait()
+        if isinstance(self._producer.error, TikaTimeoutError):
+            raise self._producer.error
+        if self._producer.error is not None:
+            msg = f"Parsing failed after partial output: {self._producer.error}"
+            raise TikaError(msg) from self._producer.error
+
+
+def _snapshot_metadata(metadata: "Metadata", attempts: int = 3) -> TikaMetadata:
+    """Convert metadata that a streaming parse may still be writing to.
+
+    Java's `Metadata` is not thread-safe, so a concurrent update can make the conversion fail. Retry a few times
+    before giving up.
+    """
+    from java.util import ConcurrentModificationException
+
+    for _ in range(attempts - 1):
+        try:
+            return TikaMetadata._from_java_metadata(metadata)
+        except ConcurrentModificationException:
+            continue
+    return TikaMetadata._from_java_metadata(metadata)
+
+
+def _handle_stream_output(  # noqa: PLR0913
+    template: _ParseTemplate,
     input_stream: "InputStream",
     metadata: "Metadata",
     output_format: TikaParseOutputFormat,
+    resources: ExitStack | None = None,
+    *,
+    max_chars: int | None = None,
+    language_detector: "LanguageDetector | None" = None,
+    timeout: float | None = None,
 ) -> tuple[BinaryIO, TikaMetadata]:
-    """Handle parsing with stream output."""
-    from java.io import ByteArrayOutputStream, OutputStreamWriter
-    from org.apache.tika.parser import (
-        ParseContext,
-        Parser,
-    )
-    from org.apache.tika.sax import (  # type: ignore # noqa: PGH003
-        BodyContentHandler,
-        ToXMLContentHandler,
-    )
-    from org.xml.sax import ContentHandler
+    """Handle parsing with stream output.
 
-    output_stream = ByteArrayOutputStream()
-    if output_format == "xhtml":
-        ch = ToXMLContentHandler(output_stream, "UTF-8")
-    elif output_format == "txt":
-        ch = BodyContentHandler(OutputStreamWriter(output_stream, "UTF-8"))
-    else:
-        raise TikaOutputFormatError._from_output_format(output_format)
+    The parse runs on a background thread and writes into a bounded pipe, so memory use stays flat no matter how
+    large the output is. This returns as soon as the first bytes of output are available (or the parse ends without
+    producing any). The returned metadata reflects what the parser had found by then; the complete metadata is
+    available from the stream's `metadata` attribute once the stream has been read to the end.
 
-    pc = ParseContext()
-    pc.set(Parser, parser)
-    pc.set(ContentHandler, ch)
+    Args:
+        template: The parser and document-independent context entries of the parse.
+        input_stream: The stream to parse.
+        metadata: The metadata of the input document. Filled in by the parser as it goes.
+        output_format: The format of the output.
+        resources: Resources backing `input_stream`. Ownership passes to the background thread, which closes them
+            when the parse finishes.
+        max_chars: If set, stop the parse once this many characters of text have been written.
+        timeout: If set, seconds after which the background parse is interrupted, its input closed and its output
+            ended. The resulting `TikaTimeoutError` is raised from the stream's reads without waiting for the
+            parser to stop.
+    """
+    from java.io import BufferedInputStream
+    from java.nio.channels import Channels, Pipe
 
-    parser.parse(input_stream, ch, metadata, pc)
+    resources = resources or ExitStack()
+    if output_format not in {"xhtml", "txt"}:
+        resources.close()
+        raise TikaOutputFormatError._from_output_format(output_format)
 
-    return reader_as_binary_stream(output_stream), TikaMetadata._from_java_metadata(metadata)
+    toolkit = _get_parse_toolkit()
+    # an OS pipe wakes a blocked reader as soon as bytes arrive, where PipedInputStream polls once a second. Its
+    # kernel buffer bounds the output held in flight, and writes block while it is full
+    pipe = Pipe.open()
+    pipe_in = Channels.newInputStream(pipe.source())
+    pipe_out = Channels.newOutputStream(pipe.sink())
+    handler = toolkit.stream_handler(output_format, pipe_out)
+    ch, pc = toolkit.new_context(template, handler, max_chars, language_detector)
+
+    def parse(deadline: _Deadline) -> None:
+        deadline.add_closeable(input_stream)
+        toolkit.run(template.parser, input_stream, ch, metadata, pc)
+
+    producer = _StreamingParse(
+        parse=parse,
+        sink=pipe_out,
+        resources=resources,
+        timeout=timeout,
+    )
+    producer.start()
+
+    # Block until the parser has written something (or finished), without consuming it
+    head = BufferedInputStream(pipe_in, _STREAM_PIPE_SIZE)
+    head.mark(1)
+    if head.read() == -1:
+        producer.wait()
+        producer.raise_error()
+    head.reset()
+
+    return (
+        _ParseOutputStream(head, producer, metadata),
+        _snapshot_metadata(metadata),
+    )
 
 
-def _handle_string_output(
-    parser: "Parser",
+def _handle_string_output(  # noqa: PLR0913
+    template: _ParseTemplate,
     input_stream: "InputStream",
     metadata: "Metadata",
     output_format: TikaParseOutputFormat,
+    *,
+    max_chars: int | None = None,
+    language_detector: "LanguageDetector | None" = None,
 ) -> tuple[str, TikaMetadata]:
     """Handle parsing with string output."""
-    from java.io import StringWriter
-    from org.apache.tika.parser import (
-        ParseContext,
-        Parser,
-    )
-    from org.apache.tika.sax import (  # type: ignore # noqa: PGH003
-        BodyContentHandler,
-        RichTextContentHandler,
-        ToXMLContentHandler,
-    )
-    from org.xml.sax import ContentHandler
+    toolkit = _get_parse_toolkit()
+    ch = toolkit.string_handler(output_format)
 
-    writer = StringWriter()
+    limited_ch, pc = toolkit.new_context(template, ch, max_chars, language_detector)
+    toolkit.run(template.parser, input_stream, limited_ch, metadata, pc)
 
-    ch = (
-        ToXMLContentHandler("UTF-8") if output_format == "xhtml" else BodyContentHandler(RichTextContentHandler(writer))
-    )
+    return str(ch.toString()), TikaMetadata._from_java_metadata(metadata)
 
-    pc = ParseContext()
-    pc.set(Parser, parser)
-    pc.set(ContentHandler, ch)
 
-    parser.parse(input_stream, ch, metadata, pc)
+def _parse(  # noqa: PLR0913
+    template: _ParseTemplate,
+    obj: TikaInputType,
+    *,
+    output_stream: bool,
+    output_format: TikaParseOutputFormat,
+    output_file: Path | str | None,
+    input_file_name: str | Path | None,
+    content_type: str | None,
+    io_mode: TikaIOMode,
+    max_chars: int | None = None,
+    timeout: float | None = None,
+    language_detector: "Callable[[], AbstractContextManager[LanguageDetector]] | None" = None,
+) -> tuple[str | Path | BinaryIO, TikaMetadata]:
+    """Parse `obj` with the parser of `template`, dispatching on the output mode. Backs `Tika.parse` and sessions.
+
+    `language_detector` checks out a detector to run language detection during the parse. The detector is held
+    until the parse finishes, which for streamed output is when the background parse does.
+    """
+    output_path = _validate_and_prepare_output_file(output_file=output_file, output_format=output_format)
+    if output_file and not output_stream and not output_path:
+        msg = "output_file is required when mode is 'file'"
+        raise TikaInputArgumentsError(msg)
+    if max_chars is not None and max_chars < 0:
+        msg = f"max_chars must not be negative, got {max_chars}"
+        raise TikaInputArgumentsError(msg)
+    if timeout is not None and timeout <= 0:
+        msg = f"timeout must be positive, got {timeout}"
+        raise TikaInputArgumentsError(msg)
+
+    # Create initial metadata
+    metadata = _get_metadata(
+        obj=obj,
+        input_file_name=input_file_name,
+        content_type=content_type,
+    )
 
-    return str(ch.toString()), TikaMetadata._from_java_metadata(metadata)
+    if output_stream:
+        # a streaming parse enforces its timeout on its own background thread
+        with ExitStack() as resources:
+            input_stream = resources.enter_context(_tika_input_stream(obj, metadata=metadata, io_mode=io_mode))
+            detector = resources.enter_context(language_detector()) if language_detector else None
+            # the background parse takes over the input stream and closes it when done
+            return _handle_stream_output(
+                template=template,
+                input_stream=input_stream,
+                metadata=metadata,
+                output_format=output_format,
+                resources=resources.pop_all(),
+                max_chars=max_chars,
+                timeout=timeout,
+                language_detector=detector,
+            )
+
+    def parse(deadline: _Deadline) -> tuple[str | Path, TikaMetadata]:
+        with ExitStack() as resources:
+            input_stream = resources.enter_context(_tika_input_stream(obj, metadata=metadata, io_mode=io_mode))
+            deadline.add_closeable(input_stream)
+            detector = resources.enter_context(language_detector()) if language_detector else None
+            if output_path:
+                return _handle_file_output(
+                    template=template,
+                    output_file=output_path,
+                    input_stream=input_stream,
+                    metadata=metadata,
+                    output_format=output_format,
+                    max_chars=max_chars,
+                    language_detector=detector,
+                )
+            return _handle_string_output(
+                template=template,
+                input_stream=input_stream,
+                metadata=metadata,
+                output_format=output_format,
+                max_chars=max_chars,
+                language_detector=detector,
+            )
+
+    # a timed parse runs on a worker thread, so a parser that ignores the interrupt cannot hold the caller past it
+    return _run_with_deadline(parse, timeout)
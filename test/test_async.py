@@ -0,0 +1,113 @@
+import asyncio
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from tikara import AsyncTika, AsyncTikaStream, Tika
+from tikara.error_handling import TikaInputArgumentsError
+
+
+@pytest.fixture
+def async_tika(tika: Tika) -> AsyncTika:
+    return AsyncTika(tika, max_concurrency=2)
+
+
+def test_parse_detect_and_unpack(async_tika: AsyncTika, tika: Tika, demo_docx: Path, tmp_path: Path) -> None:
+    async def run() -> None:
+        async with async_tika:
+            (content, metadata), mime_type, language, unpacked = await asyncio.gather(
+                async_tika.parse(demo_docx, output_format="txt"),
+                async_tika.detect_mime_type(demo_docx),
+                async_tika.detect_language("The quick brown fox jumps over the lazy dog"),
+                async_tika.unpack(demo_docx, tmp_path),
+            )
+        assert content == tika.parse(demo_docx, output_format="txt")[0]
+        assert metadata.content_type == mime_type
+        assert language.language == "en"
+        assert unpacked.embedded_documents
+
+    asyncio.run(run())
+
+
+def test_detection_options_match_sync(async_tika: AsyncTika, tika: Tika, demo_docx: Path) -> None:
+    text = "The quick brown fox jumps over the lazy dog"
+
+    async def run() -> None:
+        async with async_tika:
+            mime_type, ranked = await asyncio.gather(
+                async_tika.detect_mime_type(demo_docx, timeout=30, header_only=True),
+                async_tika.detect_language(text, top_k=2, sample_chars=20),
+            )
+        assert mime_type == tika.detect_mime_type(demo_docx, timeout=30, header_only=True)
+        assert ranked == tika.detect_language(text, top_k=2, sample_chars=20)
+
+    asyncio.run(run())
+
+
+def test_parse_stream(async_tika: AsyncTika, tika: Tika, demo_docx: Path) -> None:
+    async def run() -> bytes:
+        stream, _ = await async_tika.parse(demo_docx, output_stream=True, output_format="txt", chunk_size=16)
+        assert isinstance(stream, AsyncTikaStream)
+        async with stream:
+            chunks = [chunk async for chunk in stream]
+        assert all(len(chunk) <= 16 for chunk in chunks)  # noqa: PLR2004
+        assert stream.metadata
+        return b"".join(chunks)
+
+    expected, _ = tika.parse(demo_docx, output_format="txt")
+    assert asyncio.run(run()).decode() == expected
+
+
+def test_concurrency_is_bounded(async_tika: AsyncTika) -> None:
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+
+    def work() -> None:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+
+    async def run() -> None:
+        await asyncio.gather(*(async_tika._run(work) for _ in range(8)))
+
+    asyncio.run(run())
+    assert peak == 2  # noqa: PLR2004
+
+
+@pytest.mark.parametrize("max_concurrency", [0, -1])
+def test_invalid_max_concurrency(tika: Tika, max_concurrency: int) -> None:
+    with pytest.raises(TikaInputArgumentsError):
+        AsyncTika(tika, max_concurrency=max_concurrency)
+
+
+def test_cancel_interrupts_running_java_call(async_tika: AsyncTika) -> None:
+    from java.lang import InterruptedException
+    from java.lang import Thread as JThread
+
+    started = threading.Event()
+
+    def sleep_in_java() -> str:
+        started.set()
+        try:
+            JThread.sleep(10_000)
+        except InterruptedException:
+            return "interrupted"
+        return "slept"
+
+    async def run() -> None:
+        task = asyncio.create_task(async_tika._run(sleep_in_java))
+        await asyncio.to_thread(started.wait)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        # the slot is handed back once the interrupted call returns
+        await asyncio.wait_for(async_tika._run(lambda: None), timeout=5)
+
+    asyncio.run(run())
@@ -0,0 +1,133 @@
+import os
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+
+from tikara import Tika, TikaDetectionCache, TikaParseCache
+from tikara.error_handling import TikaInputArgumentsError
+
+
+def test_detection_cache_hits_for_unchanged_path(tmp_path: Path) -> None:
+    cache = TikaDetectionCache()
+    tika = Tika(detection_cache=cache)
+    file_path = tmp_path / "page.html"
+    file_path.write_text("<html><body>Hello</body></html>")
+
+    first = tika.detect_mime_type(file_path)
+    assert tika.detect_mime_type(file_path) == first
+    assert tika.detect_mime_type(str(file_path)) == first
+    assert cache.stats.hits == 2  # noqa: PLR2004
+    assert cache.stats.misses == 1
+
+    # a modified file is detected again
+    file_path.write_text("<html><body>Hello again</body></html>")
+    os.utime(file_path, ns=(0, 10**9))
+    tika.detect_mime_type(file_path)
+    assert cache.stats.misses == 2  # noqa: PLR2004
+
+
+def test_detection_cache_keys_bytes_by_content() -> None:
+    cache = TikaDetectionCache()
+    tika = Tika(detection_cache=cache)
+
+    assert tika.detect_mime_type(b"%PDF-1.4") == "application/pdf"
+    assert tika.detect_mime_type(bytearray(b"%PDF-1.4")) == "application/pdf"
+    assert tika.detect_mime_type(b"<html><body>Hi</body></html>") == "text/html"
+    assert cache.stats.hits == 1
+
+    # full-detection streams are never cached, header-only ones are
+    tika.detect_mime_type(BytesIO(b"%PDF-1.4"))
+    assert cache.stats.hits + cache.stats.misses == 3  # noqa: PLR2004
+    tika.detect_mime_type(BytesIO(b"%PDF-1.4"), header_only=True)
+    assert cache.stats.hits == 2  # noqa: PLR2004
+
+
+def test_detection_cache_is_bounded() -> None:
+    cache = TikaDetectionCache(max_entries=2)
+    tika = Tika(detection_cache=cache)
+    for i in range(5):
+        tika.detect_mime_type(f"text {i}".encode())
+    assert cache.stats.entries == 2  # noqa: PLR2004
+
+
+def test_detection_cache_persists_to_sqlite(tmp_path: Path, basic_txt: Path) -> None:
+    database = tmp_path / "detections.sqlite"
+    with TikaDetectionCache(path=database) as cache:
+        expected = Tika(detection_cache=cache).detect_mime_type(basic_txt)
+
+    with TikaDetectionCache(path=database) as cache:
+        assert Tika(detection_cache=cache).detect_mime_type(basic_txt) == expected
+        assert cache.stats.hits == 1
+
+
+def test_detection_cache_key_includes_detector_configuration(basic_txt: Path) -> None:
+    cache = TikaDetectionCache()
+    Tika(detection_cache=cache).detect_mime_type(basic_txt)
+    Tika(detection_cache=cache, custom_mime_types=["text/x-custom"]).detect_mime_type(basic_txt)
+    assert cache.stats.hits == 0
+    assert cache.stats.misses == 2  # noqa: PLR2004
+
+
+def test_detection_cache_invalid_size() -> None:
+    with pytest.raises(TikaInputArgumentsError):
+        TikaDetectionCache(max_entries=0)
+
+
+def test_parse_cache_hits_for_identical_bytes(tmp_path: Path, demo_docx: Path) -> None:
+    with TikaParseCache(tmp_path / "parses.sqlite") as cache:
+        tika = Tika(parse_cache=cache)
+        expected_content, expected_metadata = tika.parse(demo_docx, output_format="txt")
+
+        copy = tmp_path / "renamed.docx"
+        copy.write_bytes(demo_docx.read_bytes())
+        content, metadata = tika.parse(copy, output_format="txt")
+        assert content == expected_content
+        assert metadata.content_type == expected_metadata.content_type
+        assert metadata.resource_name == str(copy)
+
+        content, _ = tika.parse(demo_docx.read_bytes(), output_format="txt", input_file_name="attachment.docx")
+        assert content == expected_content
+        assert cache.stats.hits == 2  # noqa: PLR2004
+        assert cache.stats.misses == 1
+
+
+def test_parse_cache_key_includes_options(tmp_path: Path, demo_docx: Path) -> None:
+    with TikaParseCache(tmp_path / "parses.sqlite") as cache:
+        tika = Tika(parse_cache=cache)
+        txt, _ = tika.parse(demo_docx, output_format="txt")
+        xhtml, _ = tika.parse(demo_docx, output_format="xhtml")
+        truncated, _ = tika.parse(demo_docx, output_format="txt", max_chars=10)
+        assert txt != xhtml
+        assert len(truncated.strip()) <= 10  # noqa: PLR2004
+        assert cache.stats.hits == 0
+
+
+def test_parse_cache_file_output(tmp_path: Path, demo_docx: Path) -> None:
+    with TikaParseCache(tmp_path / "parses.sqlite") as cache:
+        tika = Tika(parse_cache=cache)
+        first, _ = tika.parse(demo_docx, output_file=tmp_path / "first.txt", output_format="txt")
+        second, _ = tika.parse(demo_docx, output_file=tmp_path / "second.txt", output_format="txt")
+        assert cache.stats.hits == 1
+        assert second.read_bytes() == first.read_bytes()
+
+
+def test_parse_cache_evicts_least_recently_used(tmp_path: Path) -> None:
+    with TikaParseCache(tmp_path / "parses.sqlite", max_bytes=4096, compression_level=0) as cache:
+        tika = Tika(parse_cache=cache)
+        for i in range(20):
+            tika.parse(f"document {i} ".encode() * 50, output_format="txt")
+        stats = cache.stats
+        assert 0 < stats.entries < 20  # noqa: PLR2004
+        assert stats.size_bytes <= 4096  # noqa: PLR2004
+
+
+def test_parse_cache_skips_non_seekable_streams(tmp_path: Path) -> None:
+    class Unseekable(BytesIO):
+        def seekable(self) -> bool:
+            return False
+
+    with TikaParseCache(tmp_path / "parses.sqlite") as cache:
+        content, _ = Tika(parse_cache=cache).parse(Unseekable(b"Hello, world!"), output_format="txt")
+        assert content.strip() == "Hello, world!"
+        assert cache.stats.hits + cache.stats.misses == 0
@@ -0,0 +1,57 @@
+from pathlib import Path
+
+import pytest
+
+from tikara.cli import main
+from tikara.util.java import _build_classpath, _cds_archive_path, _cds_jvm_args, _warmup_jar_args, get_jars
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setenv("TIKARA_CACHE_DIR", str(tmp_path))
+    monkeypatch.delenv("TIKARA_CDS", raising=False)
+    monkeypatch.delenv("TIKARA_CDS_DUMP", raising=False)
+    return tmp_path
+
+
+def test_cds_archive_path_depends_on_classpath(cache_dir: Path) -> None:
+    extra_jar = cache_dir / "extra.jar"
+    extra_jar.write_bytes(b"not really a jar")
+
+    default = _cds_archive_path(_build_classpath())
+    assert default == _cds_archive_path(_build_classpath())
+    assert default.parent == cache_dir
+    assert _cds_archive_path(_build_classpath(extra_jars=[extra_jar])) != default
+
+
+def test_cds_jvm_args(cache_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    classpath = _build_classpath()
+    assert _cds_jvm_args(classpath) == []
+
+    archive = _cds_archive_path(classpath)
+    archive.write_bytes(b"")
+    assert f"-XX:SharedArchiveFile={archive}" in _cds_jvm_args(classpath)
+
+    monkeypatch.setenv("TIKARA_CDS", "off")
+    assert _cds_jvm_args(classpath) == []
+
+    monkeypatch.setenv("TIKARA_CDS_DUMP", str(cache_dir / "dump.jsa"))
+    assert f"-XX:ArchiveClassesAtExit={cache_dir / 'dump.jsa'}" in _cds_jvm_args(classpath)
+
+
+def test_warmup_jar_args(tmp_path: Path) -> None:
+    extra_jar = tmp_path / "extra.jar"
+    assert _warmup_jar_args(get_jars()) == []
+    assert _warmup_jar_args([*get_jars(), extra_jar]) == ["--extra-jar", str(extra_jar)]
+    assert _warmup_jar_args([extra_jar]) == ["--tika-jar", str(extra_jar)]
+
+
+@pytest.mark.benchmark
+def test_warmup_records_archive(cache_dir: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    assert main(["warmup", "--benchmark", "--runs", "1"]) == 0
+    assert _cds_archive_path(_build_classpath()).exists()
+    output = capsys.readouterr().out
+    assert "Startup with archive" in output
+
+    assert main(["warmup"]) == 0
+    assert "already exists" in capsys.readouterr().out
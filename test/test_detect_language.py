@@ -2,7 +2,8 @@ import pytest
 import requests
 from testcontainers.core.container import DockerContainer
 
-from tikara.core import Tika, TikaLanguageConfidence
+from tikara.core import Tika, TikaLanguageConfidence, _sample_text
+from tikara.error_handling import TikaInputArgumentsError
 
 TEST_TEXTS: list[tuple[str, str, TikaLanguageConfidence, float]] = [
     ("en", "The quick brown fox jumps over the lazy dog", TikaLanguageConfidence.HIGH, 0.9),
@@ -57,3 +58,44 @@ def test_detect_language_from_str_compare_with_tika_server(
     result_server = requests.put(url, headers=headers, data=text.encode())
 
     assert result_server.text == language
+
+
+def test_detect_language_top_k(tika: Tika) -> None:
+    candidates = tika.detect_language("Der schnelle braune Fuchs springt über den faulen Hund", top_k=3)
+    assert 1 <= len(candidates) <= 3  # noqa: PLR2004
+    assert candidates[0].language == "de"
+    assert [c.raw_score for c in candidates] == sorted((c.raw_score for c in candidates), reverse=True)
+
+
+def test_detect_language_samples_long_text(tika: Tika) -> None:
+    text = "The quick brown fox jumps over the lazy dog. " * 50_000
+    result = tika.detect_language(text, sample_chars=2_000)
+    assert result.language == "en"
+    assert result.confidence == TikaLanguageConfidence.HIGH
+
+
+def test_sample_text() -> None:
+    text = "".join(str(i % 10) for i in range(1_000))
+    assert _sample_text(text, None) == text
+    assert _sample_text(text, 2_000) == text
+    sample = _sample_text(text, 100)
+    assert len(sample.replace("\n", "")) == 100  # noqa: PLR2004
+    assert sample.startswith(text[:25])
+    assert sample.endswith(text[-25:])
+
+
+@pytest.mark.parametrize("workers", [1, 3])
+def test_detect_language_many(tika: Tika, workers: int) -> None:
+    texts = [text for _, text, _, _ in TEST_TEXTS] * 5
+    results = tika.detect_language_many(texts, workers=workers)
+    assert [r.language for r in results] == [language for language, _, _, _ in TEST_TEXTS] * 5
+
+    ranked = tika.detect_language_many(texts[:3], top_k=2, workers=workers)
+    assert [candidates[0].language for candidates in ranked] == [language for language, _, _, _ in TEST_TEXTS]
+
+
+def test_detect_language_invalid_options(tika: Tika) -> None:
+    with pytest.raises(TikaInputArgumentsError):
+        tika.detect_language("text", top_k=0)
+    with pytest.raises(TikaInputArgumentsError):
+        tika.detect_language_many(["text"], workers=0)
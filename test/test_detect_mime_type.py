@@ -72,6 +72,21 @@ class TestDetectMimeType:
         result_str = result if isinstance(result, str) else result.decode()
         assert expected_type == result_str.casefold()
 
+    @pytest.mark.parametrize("wrap", [bytearray, memoryview])
+    @pytest.mark.parametrize(
+        ("content", "expected_type"),
+        [(data[1], data[2]) for data in TEST_FILES.values()],
+    )
+    def test_detect_mime_type_buffers(
+        self,
+        tika: Tika,
+        content: str,
+        expected_type: str,
+        wrap: type[bytearray | memoryview],
+    ) -> None:
+        result = tika.detect_mime_type(wrap(content.encode()))
+        assert expected_type == result.casefold()
+
     @pytest.mark.parametrize(
         ("content", "expected_type"),
         [(data[1], data[2]) for data in TEST_FILES.values()],
@@ -88,6 +103,66 @@ class TestDetectMimeType:
         result_str = result if isinstance(result, str) else result.decode()
         assert expected_type == result_str.casefold()
 
+    @pytest.mark.parametrize(
+        ("ext", "filename", "content", "expected_type"),
+        [(ext, data[0], data[1], data[2]) for ext, data in TEST_FILES.items()],
+    )
+    def test_detect_mime_type_mmap(
+        self,
+        *,
+        tika: Tika,
+        ext: str,
+        filename: str,
+        content: str,
+        expected_type: str,
+        tmp_path: Path,
+    ) -> None:
+        file_path = tmp_path / filename
+        file_path.write_text(content)
+        assert tika.detect_mime_type(file_path, io_mode="mmap").casefold() == expected_type
+        with file_path.open("rb") as f:
+            assert tika.detect_mime_type(f, io_mode="mmap").casefold() == expected_type
+
+    @pytest.mark.parametrize(
+        ("ext", "filename", "content", "expected_type"),
+        [(ext, data[0], data[1], data[2]) for ext, data in TEST_FILES.items()],
+    )
+    def test_detect_mime_type_header_only(
+        self,
+        *,
+        tika: Tika,
+        ext: str,
+        filename: str,
+        content: str,
+        expected_type: str,
+        tmp_path: Path,
+    ) -> None:
+        file_path = tmp_path / filename
+        file_path.write_text(content)
+        assert tika.detect_mime_type(file_path, header_only=True).casefold() == expected_type
+        assert tika.detect_mime_type(content.encode(), header_only=True).casefold() == expected_type
+
+    def test_detect_mime_type_header_only_reads_bounded_prefix(
+        self, tika: Tika, test_pdf_child_attachments: Path
+    ) -> None:
+        class CountingStream(BytesIO):
+            bytes_read = 0
+
+            def read(self, size: int | None = -1) -> bytes:
+                data = super().read(size)
+                self.bytes_read += len(data)
+                return data
+
+        stream = CountingStream(test_pdf_child_attachments.read_bytes())
+        stream.seek(0)
+        assert tika.detect_mime_type(stream, header_only=True, header_size=1024) == "application/pdf"
+        assert stream.bytes_read <= 1024  # noqa: PLR2004
+        assert stream.tell() == 0
+
+    def test_detect_mime_type_invalid_header_size(self, tika: Tika) -> None:
+        with pytest.raises(TikaInputArgumentsError):
+            tika.detect_mime_type(b"data", header_only=True, header_size=0)
+
     def test_detect_mime_type_invalid_type(self, tika: Tika) -> None:
         with pytest.raises(TikaInputArgumentsError):
             tika.detect_mime_type(123)  # type: ignore  # noqa: PGH003
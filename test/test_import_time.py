@@ -0,0 +1,49 @@
+import subprocess
+import sys
+
+import pytest
+
+_IMPORT_BUDGET_US = 100_000
+"""Generous upper bound on the cumulative `-X importtime` cost of `import tikara`, in microseconds."""
+
+
+def _run(code: str, *args: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run([sys.executable, *args, "-c", code], check=True, capture_output=True, text=True)
+
+
+def _cumulative_import_time_us(stderr: str, module: str) -> int:
+    for line in stderr.splitlines():
+        # each line reads: self time | cumulative time | module name
+        _, _, fields = line.partition("import time:")
+        parts = [part.strip() for part in fields.split("|")]
+        if len(parts) == 3 and parts[2] == module:  # noqa: PLR2004
+            return int(parts[1])
+    pytest.fail(f"{module} not found in -X importtime output")
+
+
+def test_import_does_not_load_heavy_dependencies() -> None:
+    result = _run(
+        "import sys, tikara; print(*sorted({'jpype', 'pydantic', 'tikara.core'} & set(sys.modules)))",
+    )
+    assert result.stdout.strip() == ""
+
+
+def test_data_type_import_does_not_load_jpype() -> None:
+    result = _run("import sys; from tikara import TikaMetadata; print('jpype' in sys.modules)")
+    assert result.stdout.strip() == "False"
+
+
+def test_lazy_exports_resolve() -> None:
+    import tikara
+
+    for name in tikara.__all__:
+        assert getattr(tikara, name) is not None
+    assert set(tikara.__all__) <= set(dir(tikara))
+    with pytest.raises(AttributeError):
+        _ = tikara.NotAnExport  # type: ignore[attr-defined]
+
+
+@pytest.mark.benchmark
+def test_import_time_budget() -> None:
+    result = _run("import tikara", "-X", "importtime")
+    assert _cumulative_import_time_us(result.stderr, "tikara") < _IMPORT_BUDGET_US
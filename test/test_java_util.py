@@ -1,4 +1,7 @@
+import os
 import tempfile
+import threading
+import time
 from io import BytesIO
 from pathlib import Path
 from typing import BinaryIO
@@ -6,12 +9,19 @@ from typing import BinaryIO
 import jpype
 import pytest
 from jpype import JString
+from pydantic import ValidationError
 
 from tikara.core import Tika
+from tikara.data_types import TikaJvmOptions
+from tikara.error_handling import TikaInputArgumentsError, TikaTimeoutError
 from tikara.util.java import (
     TIKA_VERSION,
+    _container_memory_limit,
+    _Deadline,
     _file_output_stream,
     _JavaReaderWrapper,
+    _jvm_options_args,
+    _run_with_deadline,
     _wrap_python_stream,
     output_stream_or_reader_stream_to_file,
     read_to_string,
@@ -132,13 +142,13 @@ class TestJavaReaderWrapper:
             reader.read()
 
     def test_contextmanager_close(self) -> None:
-        from java.io import IOException, StringReader
+        from java.io import StringReader
 
         with _JavaReaderWrapper(StringReader("Hello")) as r:
             pass
 
-        # The Java Reader should now be closed
-        with pytest.raises(IOException):
+        # The wrapper should now be closed, like any closed Python file
+        with pytest.raises(ValueError, match="read of closed file"):
             r.read()
 
     def test_readline(self) -> None:
@@ -155,7 +165,7 @@ class TestJavaReaderWrapper:
         assert result.decode("utf-8") == "Line 2\n"
 
         result = stream.readline()
-        assert result.decode("utf-8") == "Line 3\n"
+        assert result.decode("utf-8") == "Line 3"
 
         result = stream.readline()
         assert result == b""
@@ -168,7 +178,63 @@ class TestJavaReaderWrapper:
         stream = _JavaReaderWrapper(reader)
 
         result = stream.readlines()
-        assert result == [b"Line 1\n", b"Line 2\n", b"Line 3\n"]
+        assert result == [b"Line 1\n", b"Line 2\n", b"Line 3"]
+
+    def test_readline_after_partial_read(self) -> None:
+        from java.io import StringReader
+
+        stream = _JavaReaderWrapper(StringReader("Line 1\nLine 2\n"))
+
+        assert stream.read(3) == b"Lin"
+        assert stream.readline() == b"e 1\n"
+        assert stream.read() == b"Line 2\n"
+
+    def test_iterate_lines(self) -> None:
+        from java.io import StringReader
+
+        stream = _JavaReaderWrapper(StringReader("Line 1\nLine 2\n世界"))
+
+        assert list(stream) == [b"Line 1\n", b"Line 2\n", "世界".encode()]
+
+    def test_readinto(self) -> None:
+        from java.io import StringReader
+
+        test_data = "Hello, 世界!"
+        stream = _JavaReaderWrapper(StringReader(test_data), buffer_size=4)
+
+        buffer = bytearray(5)
+        result = bytearray()
+        while read_count := stream.readinto(buffer):
+            result += buffer[:read_count]
+
+        assert result.decode("utf-8") == test_data
+
+    def test_read1(self) -> None:
+        from java.io import StringReader
+
+        stream = _JavaReaderWrapper(StringReader("x" * 100), buffer_size=16)
+
+        chunk = stream.read1(64)
+        assert 0 < len(chunk) <= 64  # noqa: PLR2004
+        assert chunk + stream.read() == b"x" * 100
+
+    def test_iter_chunks(self) -> None:
+        from java.io import ByteArrayInputStream
+
+        test_data = bytes(range(256)) * 4096
+        stream = _JavaReaderWrapper(ByteArrayInputStream(test_data))
+
+        chunks = list(stream.iter_chunks(1024 * 1024))
+        assert len(chunks) == 1
+        assert b"".join(chunks) == test_data
+
+    def test_read_large_size_is_not_recursive(self) -> None:
+        from java.io import StringReader
+
+        test_data = "x" * 1_000_000
+        stream = _JavaReaderWrapper(StringReader(test_data), buffer_size=3)
+
+        assert stream.read(len(test_data)) == test_data.encode()
 
 
 class TestReadToString:
@@ -341,25 +407,25 @@ class TestPipeToStream:
         assert result.decode("utf-8") == test_data
 
     def test_pipe_to_closed_reader(self) -> None:
-        from java.io import IOException, StringReader
+        from java.io import StringReader
 
         r = reader_as_binary_stream(StringReader("Hello"))
 
         r.close()
 
-        with pytest.raises(IOException):
+        with pytest.raises(ValueError):  # noqa: PT011
             r.read()
 
 
 class TestWrapPythonStream:
     def test_basic_streaming(self) -> None:
-        from java.io import PipedInputStream
+        from java.io import InputStream
 
         test_data = b"Hello, World!"
         bio = BytesIO(test_data)
 
         stream = _wrap_python_stream(bio)
-        assert isinstance(stream, PipedInputStream)
+        assert isinstance(stream, InputStream)
 
         # Read individual bytes from Java stream
         result = bytearray()
@@ -400,6 +466,24 @@ class TestWrapPythonStream:
 
         assert bytes(result) == test_data
 
+    def test_non_blocking_stream_waits_for_data(self) -> None:
+        read_fd, write_fd = os.pipe()
+        os.set_blocking(read_fd, False)
+
+        def write_slowly() -> None:
+            with os.fdopen(write_fd, "wb", buffering=0) as writer:
+                for chunk in (b"first ", b"second"):
+                    time.sleep(0.1)
+                    writer.write(chunk)
+
+        writer = threading.Thread(target=write_slowly)
+        writer.start()
+        with os.fdopen(read_fd, "rb") as reader:
+            # reads return None until the writer catches up, which must not end or spin the Java stream
+            stream = _wrap_python_stream(reader)
+            assert bytes(stream.readAllBytes()) == b"first second"
+        writer.join()
+
     def test_stream_closes_properly(self) -> None:
         from java.io import IOException
 
@@ -472,6 +556,49 @@ class TestWrapPythonStream:
         assert isinstance(result, bytes), f"Got exception: {result}"
         assert result == test_data
 
+    def test_no_pump_thread(self) -> None:
+        threads_before = threading.active_count()
+        stream = _wrap_python_stream(BytesIO(b"x" * 100000))
+        assert stream.skip(99999) == 99999  # noqa: PLR2004
+        assert stream.read() == ord("x")
+        assert threading.active_count() == threads_before
+
+    def test_skip_seeks_seekable_stream(self) -> None:
+        bio = BytesIO(bytes(range(100)))
+        stream = _wrap_python_stream(bio)
+
+        assert stream.available() == 100  # noqa: PLR2004
+        assert stream.skip(90) == 90  # noqa: PLR2004
+        assert bio.tell() == 90  # noqa: PLR2004
+        assert stream.read() == 90  # noqa: PLR2004
+        assert stream.available() == 9  # noqa: PLR2004
+
+    def test_non_seekable_stream(self) -> None:
+        class _Unseekable(BytesIO):
+            def seekable(self) -> bool:
+                return False
+
+        test_data = bytes(range(256)) * 1000
+        stream = _wrap_python_stream(_Unseekable(test_data))
+        assert stream.skip(10) == 10  # noqa: PLR2004
+        assert bytes(stream.readAllBytes()) == test_data[10:]
+
+    def test_mark_reset_through_tika_input_stream(self) -> None:
+        from org.apache.tika.io import TikaInputStream
+
+        tis = TikaInputStream.get(_wrap_python_stream(BytesIO(b"Hello, World!")))
+        assert tis.markSupported()
+        tis.mark(5)
+        assert tis.read() == ord("H")
+        tis.reset()
+        assert bytes(tis.readAllBytes()) == b"Hello, World!"
+
+    def test_python_stream_left_open(self) -> None:
+        bio = BytesIO(b"test data")
+        stream = _wrap_python_stream(bio)
+        stream.close()
+        assert not bio.closed
+
 
 @pytest.fixture
 def temp_dir(tmp_path: Path) -> Path:
@@ -530,3 +657,121 @@ def test_file_stream_handles_binary(temp_dir: Path) -> None:
         fos.write(test_bytes)
 
     assert test_file.read_bytes() == test_bytes
+
+
+class TestDeadline:
+    def test_interrupts_java_and_raises(self) -> None:
+        from java.lang import InterruptedException
+        from java.lang import Thread as JThread
+
+        interrupted = threading.Event()
+
+        def sleep_in_java() -> None:
+            with _Deadline(0.1):
+                try:
+                    JThread.sleep(10_000)
+                except InterruptedException:
+                    interrupted.set()
+
+        with pytest.raises(TikaTimeoutError):
+            sleep_in_java()
+        assert interrupted.is_set()
+        assert not JThread.currentThread().isInterrupted()
+
+    def test_closes_registered_resources(self) -> None:
+        from java.io import IOException
+
+        stream = _wrap_python_stream(BytesIO(b"data"))
+
+        def wait_past_deadline() -> None:
+            with _Deadline(0.05) as deadline:
+                deadline.add_closeable(stream)
+                threading.Event().wait(0.5)
+
+        with pytest.raises(TikaTimeoutError):
+            wait_past_deadline()
+        with pytest.raises(IOException):
+            stream.read()
+
+    def test_no_timeout_is_noop(self) -> None:
+        with _Deadline(None) as deadline:
+            pass
+        assert not deadline.expired
+
+
+class TestRunWithDeadline:
+    def test_returns_result(self) -> None:
+        assert _run_with_deadline(lambda _: "done", 5) == "done"
+        assert _run_with_deadline(lambda _: "done", None) == "done"
+
+    def test_raises_work_error(self) -> None:
+        def fail(_: _Deadline) -> None:
+            raise KeyError
+
+        with pytest.raises(KeyError):
+            _run_with_deadline(fail, 5)
+
+    def test_returns_at_deadline_when_work_ignores_interrupt(self) -> None:
+        finished = threading.Event()
+
+        def busy(_: _Deadline) -> None:
+            # neither reads a closed input nor checks the Java interrupt flag, like a CPU-bound parser
+            time.sleep(1)
+            finished.set()
+
+        start = time.monotonic()
+        with pytest.raises(TikaTimeoutError):
+            _run_with_deadline(busy, 0.1)
+        assert time.monotonic() - start < 0.9  # noqa: PLR2004
+        assert not finished.is_set()
+        assert finished.wait(5)
+
+    def test_rejects_non_positive_timeout(self) -> None:
+        with pytest.raises(TikaInputArgumentsError):
+            _run_with_deadline(lambda _: None, 0)
+
+
+class TestJvmOptions:
+    def test_args(self) -> None:
+        options = TikaJvmOptions(
+            heap_min="512m",
+            heap_max="4g",
+            gc="Z",
+            thread_stack_size="2m",
+            system_properties={"file.encoding": "UTF-8"},
+            extra_args=["-XX:+ExitOnOutOfMemoryError"],
+        )
+        assert _jvm_options_args(options) == [
+            "-Xms512m",
+            "-Xmx4g",
+            "-XX:+UseZGC",
+            "-Xss2m",
+            "-Dfile.encoding=UTF-8",
+            "-XX:+ExitOnOutOfMemoryError",
+        ]
+        assert _jvm_options_args(None) == []
+
+    def test_invalid_sizes(self) -> None:
+        with pytest.raises(ValidationError):
+            TikaJvmOptions(heap_max="lots")
+        with pytest.raises(ValidationError):
+            TikaJvmOptions(heap_max="auto", heap_fraction=1.5)
+
+    @pytest.mark.parametrize(
+        ("contents", "expected"),
+        [("2147483648\n", 2147483648), ("max\n", None), ("9223372036854771712", None)],
+    )
+    def test_container_memory_limit(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, contents: str, expected: int | None
+    ) -> None:
+        limit_file = tmp_path / "memory.max"
+        limit_file.write_text(contents)
+        monkeypatch.setattr("tikara.util.java._CGROUP_MEMORY_LIMIT_FILES", (tmp_path / "missing", limit_file))
+        assert _container_memory_limit() == expected
+
+    def test_auto_heap(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        options = TikaJvmOptions(heap_max="auto", heap_fraction=0.5)
+        monkeypatch.setattr("tikara.util.java._container_memory_limit", lambda: 2 * 1024**3)
+        assert _jvm_options_args(options) == ["-Xmx1024m"]
+        monkeypatch.setattr("tikara.util.java._container_memory_limit", lambda: None)
+        assert _jvm_options_args(options) == ["-XX:MaxRAMPercentage=50"]
@@ -1,5 +1,9 @@
 import io
 import re
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from difflib import SequenceMatcher
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, BinaryIO, ClassVar, Literal
@@ -7,12 +11,20 @@ from typing import TYPE_CHECKING, Any, BinaryIO, ClassVar, Literal
 import pytest
 import requests
 from jpype import JImplements, JOverride, JString
+from pydantic import ValidationError
 from testcontainers.core.container import DockerContainer
 
 from test.conftest import ALL_INVALID_DOCS, ALL_VALID_DOCS
 from tikara import Tika
-from tikara.data_types import TikaMetadata
-from tikara.error_handling import TikaError, TikaInputTypeError
+from tikara.data_types import TesseractOptions, TikaInputType, TikaMetadata, TikaOcrPolicy, TikaParseOutputFormat
+from tikara.error_handling import (
+    TikaError,
+    TikaInitializationError,
+    TikaInputArgumentsError,
+    TikaInputFileNotFoundError,
+    TikaInputTypeError,
+    TikaTimeoutError,
+)
 
 if TYPE_CHECKING:
     from org.apache.tika.detect import Detector
@@ -45,11 +57,13 @@ PDF_XMP_SKIP_KEYS: set[str] = {
 }
 
 
-@pytest.mark.parametrize("input_type", ["string", "path", "bytes", "stream"])
+@pytest.mark.parametrize("input_type", ["string", "path", "bytes", "bytearray", "memoryview", "stream"])
 def test_parse_to_string_input_types(
-    tika: Tika, demo_docx: Path, input_type: Literal["string", "path", "bytes", "stream"]
+    tika: Tika,
+    demo_docx: Path,
+    input_type: Literal["string", "path", "bytes", "bytearray", "memoryview", "stream"],
 ) -> None:
-    input_obj: str | Path | bytes | BinaryIO
+    input_obj: TikaInputType
     match input_type:
         case "string":
             input_obj = str(demo_docx)
@@ -57,6 +71,10 @@ def test_parse_to_string_input_types(
             input_obj = demo_docx
         case "bytes":
             input_obj = demo_docx.read_bytes()
+        case "bytearray":
+            input_obj = bytearray(demo_docx.read_bytes())
+        case "memoryview":
+            input_obj = memoryview(demo_docx.read_bytes())
         case "stream":
             input_obj = io.BytesIO(demo_docx.read_bytes())
 
@@ -138,6 +156,166 @@ def test_parse_to_stream_with_content_type(
     assert content
 
 
+def test_parse_to_stream_full_metadata_after_read(tika: Tika, demo_docx: Path) -> None:
+    stream, metadata = tika.parse(demo_docx, output_stream=True, output_format="txt")
+
+    content = stream.read()
+    assert content
+
+    full_metadata: TikaMetadata = stream.metadata  # type: ignore  # noqa: PGH003
+    assert full_metadata.content_type == metadata.content_type
+    assert full_metadata.raw_metadata.keys() >= metadata.raw_metadata.keys()
+
+
+def test_parse_to_stream_large_output_in_chunks(tika: Tika) -> None:
+    # several times larger than the pipe between the parser and the reader
+    text = "All work and no play makes Jack a dull boy.\n" * 50_000
+
+    stream, _ = tika.parse(text.encode(), output_stream=True, output_format="txt", content_type="text/plain")
+
+    chunks: list[bytes] = []
+    while chunk := stream.read(4096):
+        chunks.append(chunk)
+
+    assert b"".join(chunks).decode().strip() == text.strip()
+
+
+class _StallingStream(io.RawIOBase):
+    """Non-seekable raw stream that returns a burst of text, then stalls before its end. Parse it buffered."""
+
+    def __init__(self, burst: bytes, stall: float) -> None:
+        self._burst = memoryview(burst)
+        self._stall = stall
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        if not self._burst:
+            time.sleep(self._stall)
+            return 0
+        count = min(len(buffer), len(self._burst))
+        buffer[:count] = self._burst[:count]
+        self._burst = self._burst[count:]
+        return count
+
+
+def test_parse_to_stream_output_available_while_parser_waits(tika: Tika) -> None:
+    burst = b"All work and no play makes Jack a dull boy.\n" * 2000
+    start = time.monotonic()
+    stream, _ = tika.parse(
+        io.BufferedReader(_StallingStream(burst, stall=3)),
+        output_stream=True,
+        output_format="txt",
+        content_type="text/plain",
+    )
+    # the output written before the stall reaches the reader without waiting on a polling interval
+    assert stream.read(1024)
+    assert time.monotonic() - start < 0.9  # noqa: PLR2004
+    assert b"Jack" in stream.read()
+
+
+@pytest.mark.parametrize("input_file_path", ALL_INVALID_DOCS)
+def test_parse_to_stream_invalid_docs_raise(tika: Tika, input_file_path: Path) -> None:
+    with pytest.raises(TikaError):  # noqa: PT012
+        stream, _ = tika.parse(input_file_path, output_stream=True)
+        stream.read()
+
+
+@pytest.mark.parametrize("offset", [0, 16])
+def test_parse_io_mode_mmap(tika: Tika, demo_docx: Path, tmp_path: Path, offset: int) -> None:
+    expected, _ = tika.parse(demo_docx, output_format="txt")
+    # at the start, Tika opens the file itself; part way in, the rest of the file is read from a mapping
+    document = tmp_path / "document.bin"
+    document.write_bytes(bytes(offset) + demo_docx.read_bytes())
+    with document.open("rb") as f:
+        f.seek(offset)
+        content, metadata = tika.parse(f, output_format="txt", io_mode="mmap")
+    assert content == expected
+    assert metadata.content_type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+
+@pytest.mark.parametrize("output_format", ["txt", "xhtml"])
+def test_parse_max_chars_truncates(tika: Tika, output_format: TikaParseOutputFormat) -> None:
+    document = ("lorem ipsum dolor sit amet " * 40 + "\n") * 2000
+
+    content, metadata = tika.parse(document.encode(), output_format=output_format, max_chars=1000)
+    assert metadata.write_limit_reached
+    if output_format == "txt":
+        assert 0 < len(content.strip()) <= 1000  # noqa: PLR2004
+    else:
+        assert len(content) < len(document) // 10
+
+    content, metadata = tika.parse(document.encode(), output_format=output_format)
+    assert not metadata.write_limit_reached
+    assert "lorem" in content[-2000:]
+
+
+def test_parse_max_chars_not_reached(tika: Tika, basic_txt: Path) -> None:
+    content, metadata = tika.parse(basic_txt, output_format="txt", max_chars=1000)
+    assert content.strip() == "Hello, world!"
+    assert not metadata.write_limit_reached
+
+
+def test_parse_max_chars_file_and_stream(tika: Tika, tmp_path: Path) -> None:
+    document = ("lorem ipsum " * 100 + "\n").encode() * 1000
+
+    output_file, metadata = tika.parse(document, output_file=tmp_path / "out.txt", output_format="txt", max_chars=500)
+    assert len(output_file.read_text().strip()) <= 500  # noqa: PLR2004
+    assert metadata.write_limit_reached
+
+    stream, _ = tika.parse(document, output_stream=True, output_format="txt", max_chars=500)
+    assert len(stream.read().strip()) <= 500  # noqa: PLR2004
+    assert stream.metadata.write_limit_reached  # type: ignore[attr-defined]
+
+
+def test_parse_negative_max_chars(tika: Tika, basic_txt: Path) -> None:
+    with pytest.raises(TikaInputArgumentsError):
+        tika.parse(basic_txt, max_chars=-1)
+
+
+class _SlowStream(io.RawIOBase):
+    """Non-seekable raw stream that trickles out a large text document. Wrap it in a `BufferedReader` to parse it."""
+
+    def __init__(self) -> None:
+        self._remaining = 10_000
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        if not self._remaining:
+            return 0
+        self._remaining -= 1
+        time.sleep(0.05)
+        buffer[:16] = b"slow slow slow\n\n"
+        return 16
+
+
+def test_parse_timeout_expires(tika: Tika) -> None:
+    start = time.monotonic()
+    with pytest.raises(TikaTimeoutError):
+        tika.parse(io.BufferedReader(_SlowStream()), output_format="txt", content_type="text/plain", timeout=0.5)
+    assert time.monotonic() - start < 5  # noqa: PLR2004
+
+    # the thread is usable again afterwards
+    content, _ = tika.parse(b"Hello, world!", output_format="txt", timeout=30)
+    assert content.strip() == "Hello, world!"
+
+
+def test_parse_stream_timeout_expires(tika: Tika) -> None:
+    stream, _ = tika.parse(io.BufferedReader(_SlowStream()), output_stream=True, content_type="text/plain", timeout=0.5)
+    with pytest.raises(TikaTimeoutError):
+        stream.read()
+
+
+def test_unpack_and_detect_timeout(tika: Tika, demo_docx: Path, tmp_path: Path) -> None:
+    assert tika.unpack(demo_docx, tmp_path, timeout=30).embedded_documents
+    assert tika.detect_mime_type(demo_docx, timeout=30)
+    with pytest.raises(TikaInputArgumentsError):
+        tika.detect_mime_type(demo_docx, timeout=0)
+
+
 def test_parse_with_invalid_input(tika: Tika) -> None:
     with pytest.raises(TikaInputTypeError):
         tika.parse(123)  # type: ignore  # noqa: PGH003
@@ -177,6 +355,65 @@ def test_parse_different_file_types(
     assert expected_content_type in metadata.content_type
 
 
+@pytest.mark.parametrize("ordered", [True, False])
+def test_parse_many(tika: Tika, ordered: bool) -> None:  # noqa: FBT001
+    inputs: list[TikaInputType] = [*ALL_VALID_DOCS[:6], Path("nonexistent.docx"), b"Hello world"]
+    results = list(tika.parse_many(inputs, workers=3, ordered=ordered, output_format="txt"))
+
+    assert len(results) == len(inputs)
+    if ordered:
+        assert [item.index for item in results] == list(range(len(inputs)))
+    by_index = {item.index: item for item in results}
+
+    for index, path in enumerate(ALL_VALID_DOCS[:6]):
+        item = by_index[index]
+        assert item.ok, item.error
+        assert item.metadata
+        assert item.content == tika.parse(path, output_format="txt")[0]
+
+    missing = by_index[6]
+    assert not missing.ok
+    assert isinstance(missing.error, TikaError)
+    assert missing.content is None
+
+    assert by_index[7].content
+    assert by_index[7].content.strip() == "Hello world"
+
+
+def test_parse_many_consumes_inputs_lazily(tika: Tika, basic_txt: Path) -> None:
+    consumed = 0
+
+    def inputs() -> Iterator[Path]:
+        nonlocal consumed
+        for _ in range(100):
+            consumed += 1
+            yield basic_txt
+
+    results = tika.parse_many(inputs(), workers=2)
+    next(results)
+    results.close()
+    assert consumed < 100  # noqa: PLR2004
+
+
+def test_parse_many_rejects_no_workers(tika: Tika, basic_txt: Path) -> None:
+    # raised by the call itself, not on first iteration
+    with pytest.raises(TikaInputArgumentsError):
+        tika.parse_many([basic_txt], workers=0)
+
+
+def test_lazy_getters_are_thread_safe() -> None:
+    tika = Tika()
+    barrier = threading.Barrier(8)
+
+    def get_parser() -> object:
+        barrier.wait()
+        return tika._get_parser()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        parsers = list(executor.map(lambda _: get_parser(), range(8)))
+    assert all(parser is parsers[0] for parser in parsers)
+
+
 @pytest.fixture
 def tika_server_parse_metadata_request_params_norecurse(tika_container: DockerContainer) -> tuple[str, dict[str, str]]:
     host_port = tika_container.get_exposed_port(9998)
@@ -501,3 +738,132 @@ def test_parse_ocr_docs(tika: Tika, input_file_path: Path, excerpt: str, lang: s
         assert lang_result.language == lang
     else:
         pytest.warns(UserWarning, match=f"Language detection skipped for {input_file_path.name}")
+
+
+@pytest.mark.parametrize("output_mode", ["string", "file", "stream"])
+def test_parse_detect_language(tika: Tika, tmp_path: Path, output_mode: str) -> None:
+    document = ("Der schnelle braune Fuchs springt über den faulen Hund. " * 2000).encode()
+
+    if output_mode == "string":
+        _, metadata = tika.parse(document, output_format="txt", detect_language=True)
+    elif output_mode == "file":
+        _, metadata = tika.parse(document, output_file=tmp_path / "out.txt", detect_language=True)
+    else:
+        stream, _ = tika.parse(document, output_stream=True, detect_language=True)
+        stream.read()
+        metadata = stream.metadata  # type: ignore[attr-defined]
+
+    assert metadata.detected_language
+    assert metadata.detected_language.language == "de"
+    assert metadata.detected_language.raw_score > 0.5  # noqa: PLR2004
+
+
+def test_parse_without_detect_language(tika: Tika, basic_txt: Path) -> None:
+    _, metadata = tika.parse(basic_txt)
+    assert metadata.detected_language is None
+
+
+@pytest.mark.parametrize(
+    "parsers",
+    [
+        ["PDFParser", "org.apache.tika.parser.microsoft.*"],
+        ["application/pdf", "application/vnd.openxmlformats-officedocument.*"],
+    ],
+)
+def test_parse_with_restricted_parsers(
+    demo_docx: Path, test_pdf_child_attachments: Path, basic_txt: Path, parsers: list[str]
+) -> None:
+    restricted = Tika(parsers=parsers)
+    content, _ = restricted.parse(demo_docx, output_format="txt")
+    assert content.strip()
+    content, _ = restricted.parse(test_pdf_child_attachments, output_format="txt")
+    assert content.strip()
+
+    # nothing selected handles plain text, so it falls back to an empty result
+    content, metadata = restricted.parse(basic_txt, output_format="txt")
+    assert not content.strip()
+    assert metadata.content_type
+    assert metadata.content_type.startswith("text/plain")
+
+
+def test_parse_with_excluded_parsers(tika: Tika, demo_docx: Path, basic_txt: Path) -> None:
+    restricted = Tika(exclude_parsers=["text/plain"])
+    content, _ = restricted.parse(basic_txt, output_format="txt")
+    assert not content.strip()
+    content, _ = restricted.parse(demo_docx, output_format="txt")
+    assert content == tika.parse(demo_docx, output_format="txt")[0]
+
+    # plain text is handled by TXTParser or TextAndCSVParser, depending on the Tika version
+    without_text_parsers = Tika(exclude_parsers=["TXTParser", "TextAndCSVParser"])
+    assert not without_text_parsers.parse(basic_txt, output_format="txt")[0].strip()
+
+
+def test_parse_with_parsers_selecting_nothing() -> None:
+    with pytest.raises(TikaInputArgumentsError):
+        Tika(parsers=["NoSuchParser"], lazy_load=False)
+    with pytest.raises(TikaInputArgumentsError):
+        Tika(parsers=[" "], lazy_load=False)
+
+
+_TIKA_CONFIG_WITHOUT_TEXT_PARSERS = """<?xml version="1.0" encoding="UTF-8"?>
+<properties>
+  <parsers>
+    <parser class="org.apache.tika.parser.DefaultParser">
+      <parser-exclude class="org.apache.tika.parser.txt.TXTParser"/>
+      <parser-exclude class="org.apache.tika.parser.csv.TextAndCSVParser"/>
+    </parser>
+  </parsers>
+</properties>
+"""
+
+
+def test_parse_with_tika_config(tmp_path: Path, demo_docx: Path, basic_txt: Path) -> None:
+    config = tmp_path / "tika-config.xml"
+    config.write_text(_TIKA_CONFIG_WITHOUT_TEXT_PARSERS)
+
+    configured = Tika(config=config)
+    assert not configured.parse(basic_txt, output_format="txt")[0].strip()
+    assert configured.parse(demo_docx, output_format="txt")[0].strip()
+
+    # instances using the same file share the loaded config
+    assert Tika(config=str(config))._get_configuration() is configured._get_configuration()
+
+
+def test_parse_with_invalid_tika_config(tmp_path: Path) -> None:
+    with pytest.raises(TikaInputFileNotFoundError):
+        Tika(config=tmp_path / "missing.xml")
+
+    config = tmp_path / "tika-config.xml"
+    config.write_text("<properties><parsers><parser class='org.example.NoSuchParser'/></parsers></properties>")
+    with pytest.raises(TikaInitializationError):
+        Tika(config=config, lazy_load=False)
+
+    with pytest.raises(TikaInputArgumentsError):
+        Tika(config=config, parsers=["PDFParser"])
+
+
+@pytest.mark.parametrize(
+    "ocr",
+    ["auto", "only", TesseractOptions(language="eng", timeout_seconds=120, skip_pages_with_text=False)],
+)
+def test_parse_ocr_policy_runs_ocr(tika: Tika, ocr: TikaOcrPolicy) -> None:
+    content, _ = tika.parse(Path("./test/data/numbers_gs150.jpg"), output_format="txt", ocr=ocr)
+    assert "3.75 miles" in content
+
+
+def test_parse_ocr_policy_off(tika: Tika, demo_docx: Path) -> None:
+    content, _ = tika.parse(Path("./test/data/numbers_gs150.jpg"), output_format="txt", ocr="off")
+    assert "3.75 miles" not in content
+
+    # documents with a text layer are unaffected
+    content, _ = tika.parse(demo_docx, output_format="txt", ocr="off")
+    assert content == tika.parse(demo_docx, output_format="txt")[0]
+
+
+def test_parse_ocr_policy_invalid(tika: Tika, basic_txt: Path) -> None:
+    with pytest.raises(TikaInputArgumentsError):
+        tika.parse(basic_txt, ocr="sometimes")  # type: ignore[call-overload]
+    with pytest.raises(ValidationError):
+        TesseractOptions(resize=150)
+    with pytest.raises(ValidationError):
+        TesseractOptions(language="eng; rm -rf /")
@@ -0,0 +1,88 @@
+from collections.abc import Generator, Iterator
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+
+from test.conftest import ALL_VALID_DOCS
+from tikara import Tika, TikaProcessPool
+from tikara.data_types import TikaInputType
+from tikara.error_handling import TikaError, TikaInputArgumentsError
+
+
+@pytest.fixture(scope="module")
+def pool() -> Generator[TikaProcessPool, None, None]:
+    with TikaProcessPool(workers=2) as pool:
+        yield pool
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_parse_many(tika: Tika, pool: TikaProcessPool, ordered: bool) -> None:  # noqa: FBT001
+    docs = ALL_VALID_DOCS[:4]
+    inputs: list[TikaInputType] = [*docs, docs[0].read_bytes(), Path("nonexistent.docx"), 123]  # type: ignore  # noqa: PGH003
+    results = list(pool.parse_many(inputs, ordered=ordered, output_format="txt"))
+
+    assert len(results) == len(inputs)
+    if ordered:
+        assert [item.index for item in results] == list(range(len(inputs)))
+    by_index = {item.index: item for item in results}
+
+    for index, path in enumerate(docs):
+        assert by_index[index].ok, by_index[index].error
+        assert by_index[index].content == tika.parse(path, output_format="txt")[0]
+    assert by_index[4].content == by_index[0].content
+    assert isinstance(by_index[5].error, TikaError)
+    assert isinstance(by_index[6].error, TikaInputArgumentsError)
+
+
+def test_parse_many_streams(pool: TikaProcessPool, demo_docx: Path) -> None:
+    expected = next(pool.parse_many([demo_docx], output_format="txt")).content
+    positioned = BytesIO(b"junk" + demo_docx.read_bytes())
+    positioned.seek(4)
+    with demo_docx.open("rb") as f:
+        results = list(pool.parse_many([positioned, f], ordered=True, output_format="txt"))
+    assert [item.content for item in results] == [expected, expected]
+
+
+def test_ordered_results_held_back_are_bounded(pool: TikaProcessPool, basic_txt: Path) -> None:
+    slow = ("All work and no play makes Jack a dull boy.\n" * 500_000).encode()
+    consumed = 0
+
+    def inputs() -> Iterator[TikaInputType]:
+        nonlocal consumed
+        for document in [slow, *[basic_txt] * 50]:
+            consumed += 1
+            yield document
+
+    results = pool.parse_many(inputs(), ordered=True, output_format="txt")
+    assert next(results).index == 0
+    # the slow document, at most 2 * 2 + 1 results held back behind it, and at most 2 more in flight
+    assert consumed <= 8  # noqa: PLR2004
+    assert len(list(results)) == 50  # noqa: PLR2004
+
+
+def test_workers_are_recycled(basic_txt: Path) -> None:
+    with TikaProcessPool(workers=1, max_tasks_per_worker=2) as pool:
+        first_pid = pool._workers[0].process.pid
+        results = list(pool.parse_many([basic_txt] * 5))
+        assert all(item.ok for item in results)
+        assert pool._workers[0].process.pid != first_pid
+
+
+def test_abandoned_batch_does_not_leak_into_next(pool: TikaProcessPool, basic_txt: Path, demo_docx: Path) -> None:
+    results = pool.parse_many([basic_txt] * 10)
+    next(results)
+    results.close()
+
+    items = list(pool.parse_many([demo_docx], ordered=True))
+    assert [item.index for item in items] == [0]
+    assert items[0].metadata
+    assert items[0].metadata.content_type
+    assert "wordprocessingml" in items[0].metadata.content_type
+
+
+def test_invalid_limits() -> None:
+    with pytest.raises(TikaInputArgumentsError):
+        TikaProcessPool(workers=1, max_tasks_per_worker=0)
+    with pytest.raises(TikaInputArgumentsError):
+        TikaProcessPool(workers=0)
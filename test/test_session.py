@@ -0,0 +1,85 @@
+from pathlib import Path
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from tikara import Tika, TikaParseCache, TikaParseSession
+from tikara.error_handling import TikaInputArgumentsError
+
+
+@pytest.fixture(scope="module")
+def session(tika: Tika) -> TikaParseSession:
+    return tika.session(output_format="txt")
+
+
+def test_session_matches_tika_parse(tika: Tika, session: TikaParseSession, demo_docx: Path) -> None:
+    content, metadata = session.parse(demo_docx)
+    expected_content, expected_metadata = tika.parse(demo_docx, output_format="txt")
+    assert content == expected_content
+    assert metadata.content_type == expected_metadata.content_type
+
+
+def test_session_output_modes(session: TikaParseSession, demo_docx: Path, tmp_path: Path) -> None:
+    content, _ = session.parse(demo_docx)
+    assert content.strip()
+
+    output_file, _ = session.parse(demo_docx, output_file=tmp_path / "out.txt")
+    assert output_file.read_text().strip()
+
+    stream, metadata = session.parse(demo_docx, output_stream=True)
+    assert stream.read().strip()
+    assert metadata.content_type
+
+    xhtml, _ = session.parse(demo_docx, output_format="xhtml")
+    assert xhtml.startswith("<html")
+
+
+def test_session_ocr_policy(tika: Tika) -> None:
+    image = Path("./test/data/numbers_gs150.jpg")
+    session = tika.session(output_format="txt", ocr="off")
+    assert session.ocr == "off"
+
+    content, _ = session.parse(image)
+    assert "3.75 miles" not in content
+
+    # a per-call policy overrides the session's prepared one
+    content, _ = session.parse(image, ocr="auto")
+    assert "3.75 miles" in content
+
+    with pytest.raises(TikaInputArgumentsError):
+        tika.session(ocr="sometimes")  # type: ignore[arg-type]
+
+
+def test_session_detect_language(session: TikaParseSession) -> None:
+    document = ("Der schnelle braune Fuchs springt über den faulen Hund. " * 200).encode()
+
+    _, metadata = session.parse(document, detect_language=True)
+    assert metadata.detected_language
+    assert metadata.detected_language.language == "de"
+
+    _, metadata = session.parse(document)
+    assert metadata.detected_language is None
+
+
+def test_session_bypasses_parse_cache(demo_docx: Path, tmp_path: Path) -> None:
+    with TikaParseCache(tmp_path / "parses.sqlite") as cache:
+        tika = Tika(parse_cache=cache)
+        session = tika.session(output_format="txt")
+        session.parse(demo_docx)
+        session.parse(demo_docx)
+        assert cache.stats.hits == 0
+        assert cache.stats.misses == 0
+
+
+@pytest.mark.benchmark
+def test_benchmark_tika_parse_hello_world(benchmark: BenchmarkFixture, tika: Tika, basic_txt: Path) -> None:
+    content, _ = benchmark(tika.parse, basic_txt, output_format="txt")
+    assert "Hello" in content
+
+
+@pytest.mark.benchmark
+def test_benchmark_session_parse_hello_world(
+    benchmark: BenchmarkFixture, session: TikaParseSession, basic_txt: Path
+) -> None:
+    content, _ = benchmark(session.parse, basic_txt)
+    assert "Hello" in content
@@ -1,3 +1,6 @@
+import mmap
+import tempfile
+from collections.abc import Buffer, Callable
 from io import BytesIO
 from pathlib import Path
 from typing import TYPE_CHECKING, BinaryIO, cast
@@ -8,6 +11,7 @@ import pytest
 from tikara.data_types import TikaLanguageConfidence, TikaMetadata
 from tikara.error_handling import TikaInputTypeError
 from tikara.util.tika import (
+    _read_header,
     _RecursiveEmbeddedDocumentExtractor,
     _tika_input_stream,
 )
@@ -36,6 +40,37 @@ def test_metadata_to_dict(sample_metadata: "Metadata") -> None:
     assert result == {"key1": "value1", "key2": "value2"}
 
 
+def test_from_java_metadata_conversions() -> None:
+    from org.apache.tika.metadata import PDF, Metadata, Office  # type: ignore  # noqa: PGH003
+
+    metadata = Metadata()
+    metadata.set(Office.PAGE_COUNT, "12")
+    metadata.set(PDF.CHARACTERS_PER_PAGE, "10,20,30")
+    metadata.set(Office.KEYWORDS, "alpha, beta")
+    metadata.set("Duration", "1.5")
+    metadata.set("Content-Type", "application/pdf")
+    metadata.set("width", "wide")
+    metadata.set("Title", "")
+
+    result = TikaMetadata._from_java_metadata(metadata)
+    assert result.page_count == 12  # noqa: PLR2004
+    assert result.chars_per_page == [10, 20, 30]
+    assert result.keywords == ["alpha", "beta"]
+    assert result.duration == 1.5  # noqa: PLR2004
+    assert result.content_type == "application/pdf"
+    assert result.width == "wide"
+    assert result.title is None
+    assert result.raw_metadata["Duration"] == "1.5"
+
+
+def test_metadata_conversion_plan_is_built_once() -> None:
+    from tikara.data_types import _get_metadata_conversion_plan
+
+    plan = _get_metadata_conversion_plan()
+    assert plan is _get_metadata_conversion_plan()
+    assert all(isinstance(key, str) for _, keys, _ in plan for key in keys)
+
+
 def test_language_confidence_enum() -> None:
     assert TikaLanguageConfidence.HIGH == "HIGH"
     assert TikaLanguageConfidence.MEDIUM == "MEDIUM"
@@ -64,6 +99,132 @@ def test_tika_input_stream_with_bytes() -> None:
         assert bytes(content) == test_bytes
 
 
+@pytest.mark.parametrize("wrap", [bytearray, memoryview, lambda b: memoryview(bytearray(b))])
+def test_tika_input_stream_with_buffers(wrap: Callable[[bytes], Buffer]) -> None:
+    test_bytes = b"test content"
+    with _tika_input_stream(wrap(test_bytes)) as tis:  # type: ignore  # noqa: PGH003
+        content = []
+        while (byte := tis.read()) != -1:
+            content.append(byte)
+        assert bytes(content) == test_bytes
+
+
+def test_tika_input_stream_with_mmap(temp_dir: Path) -> None:
+    test_file = temp_dir / "test.bin"
+    test_file.write_bytes(b"test content")
+
+    with test_file.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        with _tika_input_stream(mapped) as tis:
+            content = []
+            while (byte := tis.read()) != -1:
+                content.append(byte)
+        assert bytes(content) == b"test content"
+
+
+@pytest.mark.parametrize("payload", [b"test content", b""])
+def test_tika_input_stream_io_mode_mmap(temp_dir: Path, payload: bytes) -> None:
+    test_file = temp_dir / "test.bin"
+    test_file.write_bytes(payload)
+
+    with _tika_input_stream(test_file, io_mode="mmap") as tis:
+        # paths stay file-backed, so parsers that need a file get the original rather than a spooled copy
+        assert tis.hasFile()
+        assert Path(str(tis.getPath())) == test_file
+        content = []
+        while (byte := tis.read()) != -1:
+            content.append(byte)
+    assert bytes(content) == payload
+
+
+def test_tika_input_stream_io_mode_mmap_opens_file_streams_in_place(temp_dir: Path) -> None:
+    test_file = temp_dir / "test.bin"
+    test_file.write_bytes(b"test content")
+
+    with test_file.open("rb") as f, _tika_input_stream(f, io_mode="mmap") as tis:
+        # parsers that need a file read the open file itself rather than a spooled copy
+        assert tis.hasFile()
+        assert Path(str(tis.getPath())).samefile(test_file)
+        assert bytes(tis.readAllBytes()) == b"test content"
+        assert f.tell() == 0
+
+
+def test_tika_input_stream_io_mode_mmap_unnamed_file() -> None:
+    with tempfile.TemporaryFile() as f:
+        f.write(b"test content")
+        f.seek(0)
+        with _tika_input_stream(f, io_mode="mmap") as tis:
+            assert tis.hasFile()
+            assert Path(str(tis.getPath())).parent == Path("/proc/self/fd")
+            assert bytes(tis.readAllBytes()) == b"test content"
+
+
+def test_tika_input_stream_io_mode_mmap_from_file_position(temp_dir: Path) -> None:
+    test_file = temp_dir / "test.bin"
+    test_file.write_bytes(b"headertest content")
+
+    with test_file.open("rb") as f:
+        f.seek(6)
+        with _tika_input_stream(f, io_mode="mmap") as tis:
+            # the file cannot be handed over from the middle, so it is read from a mapping
+            assert not tis.hasFile()
+            content = []
+            while (byte := tis.read()) != -1:
+                content.append(byte)
+    assert bytes(content) == b"test content"
+
+
+def test_tika_input_stream_io_mode_mmap_falls_back_for_unmappable() -> None:
+    bio: BinaryIO = BytesIO(b"test content")
+    with _tika_input_stream(bio, io_mode="mmap") as tis:
+        assert tis.read() == ord("t")
+
+
+def test_tika_input_stream_with_non_contiguous_memoryview() -> None:
+    test_bytes = b"0123456789"
+    with _tika_input_stream(memoryview(test_bytes)[::2]) as tis:
+        content = []
+        while (byte := tis.read()) != -1:
+            content.append(byte)
+        assert bytes(content) == test_bytes[::2]
+
+
+def test_buffer_input_stream_skip_and_available() -> None:
+    from tikara.util.java import _wrap_python_buffer
+
+    stream = _wrap_python_buffer(bytearray(range(100)))
+    assert stream.available() > 0
+    assert stream.skip(90) == 90  # noqa: PLR2004
+    assert stream.read() == 90  # noqa: PLR2004
+    assert stream.available() == 9  # noqa: PLR2004
+    stream.close()
+
+
+def test_buffer_input_stream_reads_without_python() -> None:
+    from java.io import IOException
+
+    from tikara.util.java import _wrap_python_buffer
+
+    stream = _wrap_python_buffer(b"test content")
+    # a pure-Java stream: reads never go through a Python proxy
+    assert "$Proxy" not in str(stream.getClass().getName())
+    assert bytes(stream.readAllBytes()) == b"test content"
+    assert stream.read() == -1
+    stream.close()
+    with pytest.raises(IOException):
+        stream.read()
+
+
+def test_buffer_input_stream_without_http_module(monkeypatch: pytest.MonkeyPatch) -> None:
+    from tikara.util import java as java_util
+
+    # jlinked runtimes may not ship java.net.http, so the buffer is copied into a Java byte array instead
+    monkeypatch.setattr(java_util, "_has_http_module", lambda: False)
+    for payload in (b"test content", bytearray(b""), memoryview(b"0123456789")[::2]):
+        stream = java_util._wrap_python_buffer(payload)
+        assert str(stream.getClass().getName()) == "java.io.ByteArrayInputStream"
+        assert bytes(stream.readAllBytes()) == bytes(payload)
+
+
 def test_tika_input_stream_with_binary_io() -> None:
     bio: BinaryIO = BytesIO(b"test content")
     with _tika_input_stream(bio) as tis:
@@ -73,6 +234,25 @@ def test_tika_input_stream_with_binary_io() -> None:
         assert bytes(content) == b"test content"
 
 
+def test_read_header(temp_dir: Path) -> None:
+    payload = bytes(range(256)) * 16
+    file_path = temp_dir / "payload.bin"
+    file_path.write_bytes(payload)
+
+    assert _read_header(file_path, 100) == payload[:100]
+    assert bytes(_read_header(payload, 100)) == payload[:100]
+    assert bytes(_read_header(memoryview(payload)[::2], 10)) == payload[::2][:10]
+    assert _read_header(file_path, 10_000) == payload
+
+    stream = BytesIO(payload)
+    stream.seek(50)
+    assert _read_header(stream, 100) == payload[50:150]
+    assert stream.tell() == 50  # noqa: PLR2004
+
+    with pytest.raises(TikaInputTypeError):
+        _read_header(123, 10)  # type: ignore[arg-type]
+
+
 def test_tika_input_stream_invalid_input() -> None:
     with pytest.raises(TikaInputTypeError), _tika_input_stream(123):  # type: ignore  # noqa: PGH003
         pass
@@ -107,6 +287,31 @@ class TestRecursiveEmbeddedDocumentExtractor:
         assert len(results) == 1
         assert results[0].file_path.exists()
         assert results[0].file_path.read_bytes() == b"test content"
+        assert results[0].bytes_copied == len(b"test content")
+        assert results[0].copy_time_millis >= 0
+
+    def test_parse_embedded_small_copy_buffer(self, temp_dir: Path) -> None:
+        from java.io import ByteArrayInputStream  # type: ignore # noqa: PGH003
+        from org.apache.tika.metadata import Metadata, TikaCoreProperties  # type: ignore  # noqa: PGH003
+        from org.apache.tika.parser import ParseContext, Parser  # type: ignore  # noqa: PGH003
+        from org.xml.sax import ContentHandler  # type: ignore # noqa: PGH003
+
+        extractor = _RecursiveEmbeddedDocumentExtractor.create(
+            parse_context=ParseContext(),
+            parser=cast(Parser, Mock()),
+            output_dir=temp_dir,
+            max_depth=3,
+            copy_buffer_size=7,
+        )
+        test_bytes = bytes(range(256)) * 10
+
+        metadata = Metadata()
+        metadata.add(TikaCoreProperties.RESOURCE_NAME_KEY, "test.bin")
+        extractor.parseEmbedded(ByteArrayInputStream(test_bytes), cast(ContentHandler, Mock()), metadata, recurse=False)
+
+        results = extractor.get_results()
+        assert results[0].file_path.read_bytes() == test_bytes
+        assert results[0].bytes_copied == len(test_bytes)
 
     def test_parse_embedded_max_depth(self, extractor: _RecursiveEmbeddedDocumentExtractor) -> None:
         from java.io import ByteArrayInputStream  # type: ignore # noqa: PGH003
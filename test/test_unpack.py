@@ -52,6 +52,7 @@ def test_unpack_with_embedded_files_input_filepath(
             assert child.file_path.exists()
             assert child.file_path.is_file()
             assert len(child.file_path.read_bytes())
+            assert child.bytes_copied == child.file_path.stat().st_size
 
         # ensure the root document is also found
         assert result.root_metadata
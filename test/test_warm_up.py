@@ -0,0 +1,95 @@
+import io
+import zipfile
+from importlib import import_module
+from pathlib import Path
+
+import pytest
+
+from tikara import Tika, TikaProcessPool
+from tikara.error_handling import TikaInputArgumentsError
+from tikara.util import samples
+from tikara.util.samples import _WARM_UP_FAMILIES, _warm_up_sample
+
+_EXPECTED_MIME_TYPES = {
+    "pdf": "application/pdf",
+    "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "xls": "application/vnd.ms-excel",
+    "msg": "application/vnd.ms-outlook",
+}
+
+
+@pytest.mark.parametrize("family", _WARM_UP_FAMILIES)
+def test_samples_are_detected_and_parsed(tika: Tika, family: str) -> None:
+    sample = _warm_up_sample(family)
+    assert sample is _warm_up_sample(family)
+
+    content, metadata = tika.parse(sample, output_format="txt")
+    assert "Hello" in content
+    if family in _EXPECTED_MIME_TYPES:
+        assert metadata.content_type is not None
+        assert metadata.content_type.startswith(_EXPECTED_MIME_TYPES[family])
+
+
+def test_pdf_sample_xref_offsets() -> None:
+    pdf = _warm_up_sample("pdf")
+    xref = int(pdf.rsplit(b"startxref\n", 1)[1].split(b"\n", 1)[0])
+    assert pdf[xref:].startswith(b"xref")
+    entries = pdf[xref:].split(b"\n")[3:8]
+    for number, entry in enumerate(entries, start=1):
+        assert pdf[int(entry[:10]) :].startswith(b"%d 0 obj" % number)
+
+
+def test_ooxml_samples_are_zip_packages() -> None:
+    for family in ("docx", "xlsx"):
+        with zipfile.ZipFile(io.BytesIO(_warm_up_sample(family))) as archive:
+            assert "[Content_Types].xml" in archive.namelist()
+
+
+def test_warm_up_timings(tika: Tika) -> None:
+    iterations = 2
+    timings = tika.warm_up(["pdf", "docx", "msg"], iterations=iterations)
+    assert [timing.family for timing in timings] == ["pdf", "docx", "msg"]
+    for timing in timings:
+        assert timing.iterations == iterations
+        assert timing.mime_type
+        assert 0 < timing.first_seconds <= timing.total_seconds
+        assert 0 < timing.last_seconds <= timing.total_seconds
+
+
+def test_warm_up_all_families(tika: Tika) -> None:
+    timings = tika.warm_up(iterations=1, output_format="txt")
+    assert [timing.family for timing in timings] == list(_WARM_UP_FAMILIES)
+
+
+def test_warm_up_skips_families_missing_classes(tika: Tika, monkeypatch: pytest.MonkeyPatch) -> None:
+    def build_without_poi() -> bytes:
+        # a trimmed Tika jar without POI
+        import_module("org.apache.poi.notshipped")
+        return b""
+
+    monkeypatch.setitem(samples._SAMPLE_BUILDERS, "msg", build_without_poi)
+    _warm_up_sample.cache_clear()
+    try:
+        pdf, msg = tika.warm_up(["pdf", "msg"], iterations=1)
+    finally:
+        _warm_up_sample.cache_clear()
+
+    assert pdf.skipped is None
+    assert pdf.iterations == 1
+    assert msg.skipped
+    assert msg.iterations == 0
+    assert msg.total_seconds == 0
+
+
+def test_warm_up_invalid_arguments(tika: Tika) -> None:
+    with pytest.raises(TikaInputArgumentsError):
+        tika.warm_up(iterations=0)
+    with pytest.raises(TikaInputArgumentsError):
+        tika.warm_up(["not-a-family"])  # type: ignore[list-item]
+
+
+def test_process_pool_warm_up(basic_txt: Path) -> None:
+    with TikaProcessPool(workers=1, warm_up=["txt", "pdf"]) as pool:
+        (item,) = pool.parse_many([basic_txt], output_format="txt")
+    assert item.ok